@@ -11,7 +11,8 @@ structure, exporters work only with SceneData (no direct reader access).
 from pathlib import Path
 
 # Import readers module
-from readers import create_reader, get_file_type, AlembicReader
+from readers import create_reader, get_file_type
+from readers.base_reader import DEFAULT_SCENE_CACHE_DIR
 
 # Import exporters
 from exporters.ae_exporter import AfterEffectsExporter
@@ -19,6 +20,9 @@ from exporters.usd_exporter import USDExporter
 from exporters.maya_ma_exporter import MayaMAExporter
 from exporters.fbx_exporter import FBXExporter
 
+# Banner rule used in the conversion log
+_SEPARATOR = '=' * 60
+
 
 class AlembicToJSXConverter:
     """Multi-format scene converter (orchestrator/facade)
@@ -55,7 +59,11 @@ class AlembicToJSXConverter:
         print(message)
 
     def convert_multi_format(self, input_file, output_dir, shot_name, fps=24, frame_count=None,
-                            export_ae=True, export_usd=True, export_maya_ma=True, export_fbx=True):
+                            export_ae=True, export_usd=True, export_maya_ma=True, export_fbx=True,
+                            verbose=None, scene_cache=False, stream_vertex_positions=False,
+                            usd_quantize_points=False,
+                            usd_quantize_rotations=False,
+                            usd_debug_ascii=False):
         """Convert scene file to multiple formats
 
         This is the main entry point for v2.5.0 multi-format export.
@@ -71,6 +79,20 @@ class AlembicToJSXConverter:
             export_usd: Export to USD (.usdc)
             export_maya_ma: Export to Maya MA (.ma)
             export_fbx: Export to FBX (.fbx) for Unreal Engine
+            verbose: Per-object diagnostic logging in the exporters (None: only
+                    when a progress callback is set)
+            scene_cache: Reuse extracted scene data from an on-disk cache when
+                        the input file and fps/frame count are unchanged. True
+                        uses ~/.cache/abcConverter; a path uses that directory
+            stream_vertex_positions: Read vertex-animated mesh frames from the
+                        input file while exporting instead of holding every
+                        frame in memory (disables scene_cache)
+            usd_quantize_points: Snap vertex-animated points in the USD export to a
+                        16-bit grid over each mesh's animated bounds
+            usd_quantize_rotations: Round mesh/locator rotations in the USD export
+                        to 0.001 degree (cameras keep full precision)
+            usd_debug_ascii: Write the USD export as human-readable .usda
+                        instead of binary .usdc
 
         Returns:
             dict: Results with keys:
@@ -83,17 +105,20 @@ class AlembicToJSXConverter:
         """
         try:
             # Detect file type for logging
-            input_path = Path(input_file)
-            file_type = get_file_type(str(input_path))
+            file_type = get_file_type(input_file)
             format_name = "Alembic" if file_type == 'alembic' else "USD"
 
-            self.log(f"\n{'='*60}")
-            self.log(f"MultiConverter v2.6.2 - VFX-Experts")
-            self.log(f"{'='*60}")
-            self.log(f"Input: {input_file} ({format_name})")
-            self.log(f"Output: {output_dir}")
-            self.log(f"Shot: {shot_name}")
-            self.log(f"{'='*60}\n")
+            # Multi-line blocks go out as one message: each log call
+            # refreshes the GUI log view
+            self.log(
+                f"\n{_SEPARATOR}\n"
+                f"MultiConverter v2.6.2 - VFX-Experts\n"
+                f"{_SEPARATOR}\n"
+                f"Input: {input_file} ({format_name})\n"
+                f"Output: {output_dir}\n"
+                f"Shot: {shot_name}\n"
+                f"{_SEPARATOR}\n"
+            )
 
             results = {
                 'success': False,
@@ -106,6 +131,10 @@ class AlembicToJSXConverter:
             # Step 1: Read input file ONCE (auto-detect format)
             self.log(f"Step 1/4: Reading {format_name} file...")
             reader = create_reader(input_file)
+            if scene_cache:
+                reader.scene_cache_dir = (DEFAULT_SCENE_CACHE_DIR if scene_cache is True
+                                          else Path(scene_cache))
+            reader.stream_vertex_positions = stream_vertex_positions
 
             # Auto-detect frame count if not provided
             if frame_count is None:
@@ -122,17 +151,19 @@ class AlembicToJSXConverter:
 
             # Log animation summary
             categories = scene_data.animation_categories
-            self.log(f"\nAnimation Analysis:")
-            self.log(f"  - Vertex Animated: {len(categories.vertex_animated)} meshes")
-            self.log(f"  - Transform Only: {len(categories.transform_only)} meshes")
-            self.log(f"  - Static: {len(categories.static)} meshes")
-            self.log(f"  - Cameras: {len(scene_data.cameras)}")
-            self.log(f"  - Transforms/Locators: {len(scene_data.transforms)}")
+            self.log(
+                f"\nAnimation Analysis:\n"
+                f"  - Vertex Animated: {len(categories.vertex_animated)} meshes\n"
+                f"  - Transform Only: {len(categories.transform_only)} meshes\n"
+                f"  - Static: {len(categories.static)} meshes\n"
+                f"  - Cameras: {len(scene_data.cameras)}\n"
+                f"  - Transforms/Locators: {len(scene_data.transforms)}"
+            )
 
             if categories.vertex_animated:
-                self.log(f"\n  Vertex Animated Meshes:")
-                for name in categories.vertex_animated:
-                    self.log(f"    - {name}")
+                self.log("\n  Vertex Animated Meshes:\n" + "\n".join(
+                    f"    - {name}" for name in sorted(categories.vertex_animated)
+                ))
 
             # Step 3: Export to selected formats
             self.log("\nStep 3/4: Exporting to selected formats...")
@@ -148,7 +179,10 @@ class AlembicToJSXConverter:
             if export_usd:
                 self.log(f"\n--- USD Export ---")
                 usd_dir = output_path / f"{shot_name}_usd"
-                exporter = USDExporter(self.progress_callback)
+                exporter = USDExporter(self.progress_callback, verbose=verbose,
+                                       quantize_points=usd_quantize_points,
+                                       quantize_rotations=usd_quantize_rotations,
+                                       debug_ascii=usd_debug_ascii)
                 results['usd'] = exporter.export(scene_data, usd_dir, shot_name)
 
             # Export to Maya MA
@@ -166,9 +200,7 @@ class AlembicToJSXConverter:
                 results['fbx'] = exporter.export(scene_data, fbx_dir, shot_name)
 
             # Step 4: Summary
-            self.log(f"\n{'='*60}")
-            self.log(f"Export Complete!")
-            self.log(f"{'='*60}")
+            self.log(f"\n{_SEPARATOR}\nExport Complete!\n{_SEPARATOR}")
 
             success_count = sum(1 for key in ['ae', 'usd', 'maya_ma', 'fbx']
                               if key in results and results[key].get('success', False))
@@ -191,7 +223,7 @@ class AlembicToJSXConverter:
                 self.log(f"  {status} FBX: {results['fbx'].get('message', 'N/A')}")
 
             self.log(f"\n{results['message']}")
-            self.log(f"{'='*60}\n")
+            self.log(f"{_SEPARATOR}\n")
 
             return results
 
@@ -16,6 +16,8 @@ from .scene_data import (
     MeshGeometry,
     TransformData,
     Keyframe,
+    KeyframeTrack,
+    TransformKeyframes,
     AnimationCategories,
     AnimationType,
 )
@@ -30,6 +32,8 @@ __all__ = [
     'MeshGeometry',
     'TransformData',
     'Keyframe',
+    'KeyframeTrack',
+    'TransformKeyframes',
     'AnimationCategories',
     'AnimationType',
 ]
@@ -6,6 +6,8 @@ Detects animation types (transform vs vertex) to determine export strategy
 Works with any BaseReader implementation (Alembic, USD, etc.)
 """
 
+import numpy as np
+
 
 class AnimationDetector:
     """Analyzes scene to detect different types of animation
@@ -28,7 +30,7 @@ class AnimationDetector:
         """
         self.tolerance = tolerance
 
-    def detect_vertex_animation(self, reader, mesh_obj, frame_count, fps):
+    def detect_vertex_animation(self, reader, mesh_obj, frame_count, fps, first_frame_geometry=None):
         """Detect if a mesh has vertex animation (deformation)
 
         Samples vertex positions across multiple frames to detect changes.
@@ -39,6 +41,8 @@ class AnimationDetector:
             mesh_obj: Mesh object to analyze
             frame_count: Total number of frames in the animation
             fps: Frames per second
+            first_frame_geometry: Optional dict; the first-frame mesh data is
+                stored in it under the mesh name for reuse by the caller
 
         Returns:
             bool: True if vertex animation detected, False otherwise
@@ -47,7 +51,9 @@ class AnimationDetector:
             # Get first frame positions as baseline
             first_time = 1.0 / fps
             first_data = reader.get_mesh_data_at_time(mesh_obj, first_time)
-            first_positions = first_data['positions']
+            if first_frame_geometry is not None:
+                first_frame_geometry[mesh_obj.getName()] = first_data
+            first_positions = np.asarray(first_data['positions'], dtype=np.float64).reshape(-1, 3)
             num_verts = len(first_positions)
 
             # Early exit if no vertices
@@ -63,17 +69,11 @@ class AnimationDetector:
             for frame in range(2, frame_count + 1, sample_interval):
                 time_seconds = frame / fps
                 mesh_data = reader.get_mesh_data_at_time(mesh_obj, time_seconds)
-                positions = mesh_data['positions']
-
-                # Compare each vertex position to first frame
-                for i in range(num_verts):
-                    dx = abs(positions[i][0] - first_positions[i][0])
-                    dy = abs(positions[i][1] - first_positions[i][1])
-                    dz = abs(positions[i][2] - first_positions[i][2])
+                positions = np.asarray(mesh_data['positions'], dtype=np.float64).reshape(-1, 3)
 
-                    # If any vertex moved beyond tolerance, vertex animation detected
-                    if dx > self.tolerance or dy > self.tolerance or dz > self.tolerance:
-                        return True
+                # If any vertex moved beyond tolerance, vertex animation detected
+                if (np.abs(positions[:num_verts] - first_positions) > self.tolerance).any():
+                    return True
 
             return False
 
@@ -131,15 +131,16 @@ class AnimationDetector:
 
         Returns:
             dict: Animation analysis with keys:
-                - 'vertex_animated': List of mesh names with vertex animation
-                - 'transform_only': List of mesh names with only transform animation
-                - 'static': List of mesh names with no animation
+                - 'vertex_animated': frozenset of mesh names with vertex animation
+                - 'transform_only': frozenset of mesh names with only transform animation
+                - 'static': frozenset of mesh names with no animation
+                - 'first_frame_geometry': Dict of mesh name -> mesh data sampled
+                  at frame 1, so readers don't sample it again
         """
-        result = {
-            'vertex_animated': [],
-            'transform_only': [],
-            'static': []
-        }
+        vertex_animated = []
+        transform_only = []
+        static = []
+        first_frame_geometry = {}
 
         parent_map = reader.get_parent_map()
 
@@ -147,10 +148,12 @@ class AnimationDetector:
             mesh_name = mesh_obj.getName()
 
             # Check for vertex animation first (most important for AE)
-            has_vertex_anim = self.detect_vertex_animation(reader, mesh_obj, frame_count, fps)
+            has_vertex_anim = self.detect_vertex_animation(
+                reader, mesh_obj, frame_count, fps, first_frame_geometry
+            )
 
             if has_vertex_anim:
-                result['vertex_animated'].append(mesh_name)
+                vertex_animated.append(mesh_name)
                 continue
 
             # Check for transform animation on parent
@@ -161,11 +164,17 @@ class AnimationDetector:
                 has_transform_anim = self.detect_transform_animation(reader, parent, frame_count, fps)
 
             if has_transform_anim:
-                result['transform_only'].append(mesh_name)
+                transform_only.append(mesh_name)
             else:
-                result['static'].append(mesh_name)
-
-        return result
+                static.append(mesh_name)
+
+        # Read-only sets: callers only test membership
+        return {
+            'vertex_animated': frozenset(vertex_animated),
+            'transform_only': frozenset(transform_only),
+            'static': frozenset(static),
+            'first_frame_geometry': first_frame_geometry
+        }
 
     def get_animation_summary(self, animation_data):
         """Generate human-readable summary of animation analysis
@@ -184,7 +193,7 @@ class AnimationDetector:
 
         if animation_data['vertex_animated']:
             lines.append("\n  Vertex Animated Meshes:")
-            for name in animation_data['vertex_animated']:
+            for name in sorted(animation_data['vertex_animated']):
                 lines.append(f"    - {name}")
 
         return "\n".join(lines)
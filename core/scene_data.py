@@ -9,10 +9,14 @@ extract scene data into these structures, and exporters consume them
 without knowledge of the source format.
 """
 
+from collections.abc import Sequence as SequenceABC
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple
+from functools import cached_property
+from typing import List, Dict, Optional, Tuple, Sequence, Callable, Iterator
 from enum import Enum
 
+import numpy as np
+
 
 class AnimationType(Enum):
     """Animation classification for mesh objects"""
@@ -22,12 +26,13 @@ class AnimationType(Enum):
     BLEND_SHAPE = "blend_shape"  # Vertex animation via blend shapes (exportable to FBX)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Keyframe:
     """Single animation keyframe with transform data
 
     Stores both AE-compatible and Maya-compatible rotation decompositions
-    to avoid re-extraction in exporters.
+    to avoid re-extraction in exporters. Slotted and immutable, since
+    exporters may build one per object per frame (see KeyframeTrack).
 
     Attributes:
         frame: 1-based frame number
@@ -43,7 +48,136 @@ class Keyframe:
     scale: Tuple[float, float, float]
 
 
+class KeyframeTrack(SequenceABC):
+    """Packed keyframe sequence that builds Keyframe objects on demand
+
+    Readers store a whole track as one (F, 12) float64 array with columns
+    [tx, ty, tz, rx_ae, ry_ae, rz_ae, rx_maya, ry_maya, rz_maya, sx, sy, sz]
+    instead of F Keyframe objects. Indexing, slicing and iteration return
+    Keyframes, so exporters can treat it like a list.
+
+    Attributes:
+        frames: (F,) int32 frame numbers
+        data: (F, 12) float64 channel values
+    """
+
+    __slots__ = ('frames', 'data')
+
+    def __init__(self, frames: np.ndarray, data: np.ndarray):
+        self.frames = frames
+        self.data = data
+
+    def __len__(self):
+        return len(self.frames)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self._build(self.frames[index], self.data[index]))
+        row = self.data[index].tolist()
+        return Keyframe(int(self.frames[index]), tuple(row[0:3]), tuple(row[3:6]),
+                        tuple(row[6:9]), tuple(row[9:12]))
+
+    def __iter__(self):
+        return self._build(self.frames, self.data)
+
+    def __getstate__(self):
+        return self.frames, self.data
+
+    def __setstate__(self, state):
+        self.frames, self.data = state
+
+    @staticmethod
+    def _build(frames, data):
+        for frame, row in zip(frames.tolist(), data.tolist()):
+            yield Keyframe(frame, tuple(row[0:3]), tuple(row[3:6]),
+                           tuple(row[6:9]), tuple(row[9:12]))
+
+
 @dataclass
+class TransformKeyframes:
+    """Struct-of-arrays view of a keyframe sequence
+
+    Exporters that write whole animation channels at once (USD) work on
+    contiguous arrays instead of walking Keyframe objects one at a time.
+    Rotations use the Maya/USD compatible decomposition.
+
+    Attributes:
+        frames: (N,) float64 frame numbers (usable directly as time codes)
+        positions: (N, 3) float64 translations
+        rotations: (N, 3) float32 rotations in degrees (rotation_maya)
+        scales: (N, 3) float32 scale multipliers
+    """
+    frames: np.ndarray
+    positions: np.ndarray
+    rotations: np.ndarray
+    scales: np.ndarray
+
+    @classmethod
+    def from_keyframes(cls, keyframes: Sequence[Keyframe]) -> 'TransformKeyframes':
+        """Build the SoA arrays from a list of Keyframe objects
+
+        Args:
+            keyframes: Keyframes in frame order
+
+        Returns:
+            TransformKeyframes: Packed channel arrays
+        """
+        if isinstance(keyframes, KeyframeTrack):
+            # Already packed - slice the columns
+            data = keyframes.data
+            return cls(
+                frames=keyframes.frames.astype(np.float64),
+                positions=np.ascontiguousarray(data[:, 0:3], dtype=np.float64),
+                rotations=np.ascontiguousarray(data[:, 6:9], dtype=np.float32),
+                scales=np.ascontiguousarray(data[:, 9:12], dtype=np.float32),
+            )
+
+        count = len(keyframes)
+
+        def channel(values, dtype):
+            # Readers store plain (x, y, z) tuples, so this is a direct pack
+            return np.array(values, dtype=dtype).reshape(count, 3)
+
+        return cls(
+            frames=np.array([kf.frame for kf in keyframes], dtype=np.float64),
+            positions=channel([kf.position for kf in keyframes], np.float64),
+            rotations=channel([kf.rotation_maya for kf in keyframes], np.float32),
+            scales=channel([kf.scale for kf in keyframes], np.float32),
+        )
+
+    def __len__(self):
+        return len(self.frames)
+
+
+class _SceneObjectMixin:
+    """Derived views shared by cameras, meshes and transforms
+
+    Built on first access and cached, so ``keyframes`` and ``full_path``
+    must not be modified afterwards.
+
+    The Keyframe list stays the primary storage (AE, Maya and FBX exporters
+    walk it per frame); exporters that write whole channels use
+    ``keyframe_arrays`` instead.
+    """
+
+    @cached_property
+    def keyframe_arrays(self) -> TransformKeyframes:
+        """TransformKeyframes packed from this object's keyframes"""
+        return TransformKeyframes.from_keyframes(self.keyframes)
+
+    @cached_property
+    def full_path_parts(self) -> Tuple[str, ...]:
+        """Non-empty components of full_path"""
+        return tuple(p for p in self.full_path.split('/') if p)
+
+    @cached_property
+    def is_shape(self) -> bool:
+        """True if full_path ends in a shape node under a transform"""
+        parts = self.full_path_parts
+        return len(parts) >= 2 and parts[-1].endswith('Shape')
+
+
+@dataclass(slots=True, frozen=True)
 class CameraProperties:
     """Camera-specific optical properties
 
@@ -58,7 +192,7 @@ class CameraProperties:
 
 
 @dataclass
-class CameraData:
+class CameraData(_SceneObjectMixin):
     """Complete camera data with animation
 
     Attributes:
@@ -72,21 +206,24 @@ class CameraData:
     parent_name: Optional[str]
     full_path: str
     properties: CameraProperties
-    keyframes: List[Keyframe]
+    keyframes: Sequence[Keyframe]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False)
 class MeshGeometry:
     """Static mesh geometry data (first frame)
 
+    Stored as typed NumPy buffers so exporters can hand them to native
+    array types (e.g. Vt arrays) without re-boxing every element.
+
     Attributes:
-        positions: List of vertex positions as [x, y, z] tuples
-        indices: Face vertex indices (flattened)
-        counts: Number of vertices per face
+        positions: (N, 3) float32 array of vertex positions
+        indices: (M,) int32 array of face vertex indices (flattened)
+        counts: (F,) int32 array of vertices per face
     """
-    positions: List[Tuple[float, float, float]]
-    indices: List[int]
-    counts: List[int]
+    positions: np.ndarray
+    indices: np.ndarray
+    counts: np.ndarray
 
 
 @dataclass
@@ -95,13 +232,13 @@ class BlendShapeTarget:
 
     Attributes:
         name: Target name (e.g., "smile", "blink")
-        vertex_indices: List of affected vertex indices (sparse storage)
-        deltas: Delta positions for each affected vertex [(dx,dy,dz), ...]
+        vertex_indices: Affected vertex indices (sparse storage), (K,) int32 array
+        deltas: Delta positions for each affected vertex, (K, 3) float array
         full_weight: Weight value at which target is fully applied (default 1.0)
     """
     name: str
-    vertex_indices: List[int]
-    deltas: List[Tuple[float, float, float]]
+    vertex_indices: np.ndarray
+    deltas: np.ndarray
     full_weight: float = 1.0
 
 
@@ -151,7 +288,7 @@ class BlendShapeDeformer:
 
 
 @dataclass
-class MeshData:
+class MeshData(_SceneObjectMixin):
     """Complete mesh data with animation and geometry
 
     Attributes:
@@ -161,21 +298,72 @@ class MeshData:
         animation_type: Classification (STATIC, TRANSFORM_ONLY, VERTEX_ANIMATED, BLEND_SHAPE)
         keyframes: Transform animation keyframes (empty if static)
         geometry: First frame geometry (positions, indices, counts)
-        vertex_positions_per_frame: Per-frame vertex positions if vertex-animated
+        vertex_positions_per_frame: Per-frame (N, 3) float32 vertex positions if vertex-animated
         blend_shapes: Blend shape deformer data if mesh has blend shapes
+        vertex_positions_stack: (F, V, 3) float32 positions for every frame when
+                                the vertex count is constant (the per-frame dict
+                                entries are views into it), None otherwise
+        vertex_position_frames: (F,) int32 frame numbers matching the stack rows
+        vertex_positions_loader: Callable returning a fresh (frame, positions)
+                                 iterator that reads from the still-open source,
+                                 used instead of the above when streaming
     """
     name: str
     parent_name: Optional[str]
     full_path: str
     animation_type: AnimationType
-    keyframes: List[Keyframe]
+    keyframes: Sequence[Keyframe]
     geometry: MeshGeometry
-    vertex_positions_per_frame: Optional[Dict[int, List[Tuple[float, float, float]]]] = None
+    vertex_positions_per_frame: Optional[Dict[int, np.ndarray]] = None
     blend_shapes: Optional[BlendShapeDeformer] = None
+    vertex_positions_stack: Optional[np.ndarray] = None
+    vertex_position_frames: Optional[np.ndarray] = None
+    vertex_positions_loader: Optional[Callable[[], Iterator[Tuple[int, np.ndarray]]]] = None
+
+    @property
+    def has_vertex_positions(self) -> bool:
+        """True if per-frame vertex positions are available in any form"""
+        return (self.vertex_positions_stack is not None
+                or bool(self.vertex_positions_per_frame)
+                or self.vertex_positions_loader is not None)
+
+    def __getstate__(self):
+        # When a stack backs the per-frame dict, pickle only the stack; the
+        # dict views would otherwise be saved (and loaded) as separate copies
+        state = self.__dict__.copy()
+        if self.vertex_positions_stack is not None and self.vertex_positions_per_frame:
+            state['vertex_positions_per_frame'] = None
+            state['_rebuild_vertex_views'] = True
+        return state
+
+    def __setstate__(self, state):
+        rebuild = state.pop('_rebuild_vertex_views', False)
+        self.__dict__.update(state)
+        if rebuild:
+            self.vertex_positions_per_frame = dict(
+                zip(self.vertex_position_frames.tolist(), self.vertex_positions_stack)
+            )
+
+    def iter_vertex_positions(self) -> Iterator[Tuple[int, np.ndarray]]:
+        """Iterate per-frame vertex positions in frame order
+
+        Walks the stack rows when available (views, no copies), then the
+        per-frame dict, then the streaming loader.
+
+        Yields:
+            tuple: (frame, (N, 3) float32 positions)
+        """
+        if self.vertex_positions_stack is not None:
+            yield from zip(self.vertex_position_frames.tolist(), self.vertex_positions_stack)
+        elif self.vertex_positions_per_frame:
+            for frame in sorted(self.vertex_positions_per_frame):
+                yield frame, self.vertex_positions_per_frame[frame]
+        elif self.vertex_positions_loader is not None:
+            yield from self.vertex_positions_loader()
 
 
 @dataclass
-class TransformData:
+class TransformData(_SceneObjectMixin):
     """Transform/locator data with animation
 
     Used for pure transforms that don't have camera or mesh shapes attached.
@@ -190,7 +378,7 @@ class TransformData:
     name: str
     parent_name: Optional[str]
     full_path: str
-    keyframes: List[Keyframe]
+    keyframes: Sequence[Keyframe]
 
 
 @dataclass
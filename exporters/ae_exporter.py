@@ -67,7 +67,7 @@ class AfterEffectsExporter(BaseExporter):
             skipped_meshes = scene_data.animation_categories.vertex_animated
             if skipped_meshes:
                 self.log(f"Skipping {len(skipped_meshes)} meshes with vertex animation:")
-                for mesh_name in skipped_meshes:
+                for mesh_name in sorted(skipped_meshes):
                     self.log(f"  - {mesh_name}")
 
             duration = frame_count / fps
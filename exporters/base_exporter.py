@@ -28,14 +28,18 @@ class BaseExporter(ABC):
     - Format Agnostic: Works with SceneData, not reader objects (v2.5.0+)
     """
 
-    def __init__(self, progress_callback=None):
+    def __init__(self, progress_callback=None, verbose=None):
         """Initialize exporter
 
         Args:
             progress_callback: Optional function to call for progress updates
                               Signature: callback(message: str) -> None
+            verbose: Emit per-object diagnostic detail (progress and summary
+                    messages are always logged); None enables it only when a
+                    progress callback is supplied
         """
         self.progress_callback = progress_callback
+        self.verbose = progress_callback is not None if verbose is None else verbose
 
     def log(self, message):
         """Send progress/status message
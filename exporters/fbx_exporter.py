@@ -15,6 +15,7 @@ FBX ASCII format based on FBX 7.4 specification.
 import re
 from pathlib import Path
 from datetime import datetime
+import numpy as np
 from exporters.base_exporter import BaseExporter
 from core.scene_data import SceneData, AnimationType
 
@@ -863,10 +864,8 @@ class FBXExporter(BaseExporter):
                 converted_deltas = [self._convert_position(d) for d in target.deltas]
 
                 # Flatten indices and vertices
-                indices_str = ",".join(str(i) for i in target.vertex_indices)
-                vertices_flat = []
-                for d in converted_deltas:
-                    vertices_flat.extend([d[0], d[1], d[2]])
+                indices_str = ",".join(map(str, np.asarray(target.vertex_indices).tolist()))
+                vertices_flat = np.asarray(converted_deltas, dtype=np.float64).reshape(-1).tolist()
                 vertices_str = ",".join(f"{v:.6f}" for v in vertices_flat)
 
                 lines.extend([
@@ -7,11 +7,21 @@ v2.5.0 - Refactored to use SceneData instead of reader objects.
          Now format-agnostic - works with any input format.
 """
 
+import functools
+import re
 from pathlib import Path
 
+import numpy as np
+
 from .base_exporter import BaseExporter
 from core.scene_data import SceneData, AnimationType
 
+# Characters not allowed in prim names: anything but alphanumerics and '_'
+# (\W rejects exactly what str.isalnum() and '_' reject)
+_INVALID_NAME_CHARS = re.compile(r'\W+')
+# Separators that become '_' instead of being dropped
+_SEPARATOR_TABLE = str.maketrans(' -', '__')
+
 
 class USDExporter(BaseExporter):
     """USD exporter with full animation support
@@ -28,55 +38,62 @@ class USDExporter(BaseExporter):
     v2.6.2: Added scene hierarchy preservation from full_path data.
     """
 
-    def __init__(self, progress_callback=None):
-        super().__init__(progress_callback)
+    def __init__(self, progress_callback=None, quantize_points=False, debug_ascii=False,
+                 quantize_rotations=False, verbose=None):
+        """Initialize exporter
+
+        Args:
+            progress_callback: Optional function to call for progress updates
+            quantize_points: Snap vertex-animated points to a 16-bit grid over
+                            each mesh's animated bounds (off by default for fidelity)
+            debug_ascii: Write human-readable .usda instead of binary .usdc
+            quantize_rotations: Round mesh/locator rotations to 0.001 degree so
+                               tracking jitter doesn't defeat constant-channel
+                               detection (cameras always keep full precision)
+            verbose: Emit per-object diagnostic detail (see BaseExporter)
+        """
+        super().__init__(progress_callback, verbose)
+        self.quantize_points = quantize_points
+        self.quantize_rotations = quantize_rotations
+        self.debug_ascii = debug_ascii
         self.created_prims = set()  # Track created prim paths for hierarchy
+        self._vt_array_cache = {}  # id(int32 array) -> (array, Vt.IntArray), per export
+        self._hierarchy_trie = {}  # Path component -> child trie, for ancestors already ensured
+        self.constant_channel_count = 0  # TRS channels written as a single default
+        self.Usd = None  # pxr modules, loaded on first export()
+
+    def _ensure_usd_loaded(self):
+        """Import the USD Python bindings on first use
+
+        pxr is large and slow to import, so it is deferred until an export
+        actually runs rather than paid whenever an exporter is constructed.
+
+        Raises:
+            ImportError: If the USD Python library is not installed
+        """
+        if self.Usd is not None:
+            return
 
-        # Lazy import USD - only import when actually creating exporter instance
-        # This avoids module-level import issues
         try:
             from pxr import Usd, UsdGeom, Gf, Vt, Sdf
-            # Store in instance for use throughout the class
-            self.Usd = Usd
-            self.UsdGeom = UsdGeom
-            self.Gf = Gf
-            self.Vt = Vt
-            self.Sdf = Sdf
         except ImportError as e:
             raise ImportError(
                 f"USD Python library (pxr) not found: {e}\n"
                 "Install with: pip install usd-core or download from NVIDIA (https://developer.nvidia.com/usd)"
             )
 
+        # Store in instance for use throughout the class
+        self.UsdGeom = UsdGeom
+        self.Gf = Gf
+        self.Vt = Vt
+        self.Sdf = Sdf
+        self.Usd = Usd
+
     def get_format_name(self):
         return "USD"
 
     def get_file_extension(self):
-        return "usdc"
-
-    def _extract_float3(self, value):
-        """Extract three floats from a value, handling nested lists
-
-        Args:
-            value: A tuple/list like (x, y, z), [x, y, z], or [[x, y, z]]
-
-        Returns:
-            tuple: (float, float, float)
-        """
-        # Handle nested list edge case: [[x, y, z]] -> [x, y, z]
-        if isinstance(value, (list, tuple)) and len(value) > 0 and isinstance(value[0], (list, tuple)):
-            value = value[0]
-        return (float(value[0]), float(value[1]), float(value[2]))
-
-    def _make_vec3d(self, value):
-        """Create a Gf.Vec3d from potentially nested data"""
-        x, y, z = self._extract_float3(value)
-        return self.Gf.Vec3d(x, y, z)
-
-    def _make_vec3f(self, value):
-        """Create a Gf.Vec3f from potentially nested data"""
-        x, y, z = self._extract_float3(value)
-        return self.Gf.Vec3f(x, y, z)
+        return "usda" if self.debug_ascii else "usdc"
 
     def export(self, scene_data: SceneData, output_path, shot_name):
         """Export to USD format
@@ -94,100 +111,128 @@ class USDExporter(BaseExporter):
                 - 'message': Status message
         """
         try:
+            self._ensure_usd_loaded()
+
             # Reset state for this export
             self.created_prims = set()
+            self._vt_array_cache = {}
+            self._hierarchy_trie = {}
+            self.constant_channel_count = 0
 
             # Extract info from SceneData
             fps = scene_data.metadata.fps
             frame_count = scene_data.metadata.frame_count
 
             output_dir = self.validate_output_path(output_path)
-            usd_file = output_dir / f"{shot_name}.usdc"
+            usd_file = output_dir / f"{shot_name}.{self.get_file_extension()}"
 
             self.log(f"Creating USD stage: {usd_file}")
 
-            # Create USD stage (.usdc = binary crate format)
-            stage = self.Usd.Stage.CreateNew(str(usd_file))
+            # Author specs directly into an anonymous in-memory layer and export
+            # it in one write at the end (.usdc = binary crate, .usda = ASCII for
+            # debugging). No stage is opened: the exporter knows the exact specs
+            # it needs, so schema Define/Set and recomposition are skipped.
+            layer = self.Sdf.Layer.CreateAnonymous()
 
-            # Set stage metadata
-            stage.SetStartTimeCode(1)
-            stage.SetEndTimeCode(frame_count)
-            stage.SetTimeCodesPerSecond(fps)
-            stage.SetFramesPerSecond(fps)
+            # Set stage metadata (root layer metadata is the stage metadata)
+            layer.startTimeCode = 1
+            layer.endTimeCode = frame_count
+            layer.timeCodesPerSecond = fps
+            layer.framesPerSecond = fps
 
             # Set Y-up axis (same as Alembic!)
-            self.UsdGeom.SetStageUpAxis(stage, self.UsdGeom.Tokens.y)
+            layer.pseudoRoot.SetInfo(self.UsdGeom.Tokens.upAxis, self.UsdGeom.Tokens.y)
 
             self.log(f"Stage setup: {frame_count} frames @ {fps} fps, Y-up axis")
 
-            # Create root transform
-            root_xform = self.UsdGeom.Xform.Define(stage, "/World")
-            self.created_prims.add("/World")
-
-            # Process cameras with hierarchy preservation
+            # Resolve every camera/mesh prim path in one pass up front
+            camera_entries = []
             for camera in scene_data.cameras:
                 cam_name = camera.parent_name if camera.parent_name else camera.name
                 # Get hierarchical USD path from full_path
-                usd_path = self._get_usd_path_from_full_path(camera.full_path, cam_name)
-                self._ensure_hierarchy_exists(stage, usd_path)
-                self.log(f"Exporting camera: {cam_name} -> {usd_path}")
-                self._export_camera(stage, camera, usd_path, frame_count)
-                self.created_prims.add(usd_path)
-
-            # Track used paths to avoid conflicts
-            used_paths = set(self.created_prims)
+                usd_path = self._get_usd_path_from_full_path(camera, cam_name)
+                camera_entries.append((camera, cam_name, usd_path))
 
-            # Process meshes with hierarchy preservation
-            vertex_animated_count = 0
+            mesh_entries = []
             for mesh in scene_data.meshes:
                 mesh_name = mesh.parent_name if mesh.parent_name else mesh.name
-                # Get hierarchical USD path from full_path
-                usd_path = self._get_usd_path_from_full_path(mesh.full_path, mesh_name)
-                self._ensure_hierarchy_exists(stage, usd_path)
-
-                if mesh.animation_type == AnimationType.VERTEX_ANIMATED:
-                    self.log(f"Exporting mesh with vertex animation: {mesh_name} -> {usd_path}")
-                    self._export_mesh_with_vertex_anim(stage, mesh, usd_path, frame_count)
-                    vertex_animated_count += 1
-                else:
-                    self.log(f"Exporting mesh (transform only): {mesh_name} -> {usd_path}")
-                    self._export_mesh_transform_only(stage, mesh, usd_path, frame_count)
-
-                self.created_prims.add(usd_path)
-                used_paths.add(usd_path)
-
-            # Process transforms (locators/trackers) with hierarchy preservation
-            locator_count = 0
-            for transform in scene_data.transforms:
-                xform_name = transform.name  # Always use locator's own name
-                # Get hierarchical USD path from full_path
-                usd_path = self._get_usd_path_from_full_path(transform.full_path, xform_name)
-
-                # Skip if path conflicts with existing camera/mesh
-                if usd_path in used_paths:
-                    self.log(f"Skipping locator (path conflict): {xform_name}")
-                    continue
-
-                # Skip if no keyframes
-                if not transform.keyframes:
-                    self.log(f"Skipping locator (no keyframes): {xform_name}")
-                    continue
-
-                try:
-                    self._ensure_hierarchy_exists(stage, usd_path)
-                    self.log(f"Exporting locator: {xform_name} -> {usd_path}")
-                    self._export_locator(stage, transform, usd_path, frame_count)
+                usd_path = self._get_usd_path_from_full_path(mesh, mesh_name)
+                mesh_entries.append((mesh, mesh_name, usd_path))
+
+            # Everything below is Sdf-level authoring with no composed reads, so
+            # the whole scene is written under one change block
+            with self.Sdf.ChangeBlock():
+                # Create root transform
+                self._define_prim(layer, "/World", "Xform")
+                self.created_prims.add("/World")
+
+                # Process cameras with hierarchy preservation
+                for camera, cam_name, usd_path in camera_entries:
+                    self._ensure_hierarchy_exists(layer, usd_path)
+                    self.log(f"Exporting camera: {cam_name} -> {usd_path}")
+                    self._export_camera(layer, camera, usd_path, frame_count)
+                    self.created_prims.add(usd_path)
+
+                # Paths locators must not reuse: everything authored for the
+                # cameras plus each mesh prim (mesh hierarchy groups may be
+                # shared with a locator, which then authors the group's xform)
+                used_paths = set(self.created_prims)
+
+                # Process meshes with hierarchy preservation
+                vertex_animated_count = 0
+                for mesh, mesh_name, usd_path in mesh_entries:
+                    self._ensure_hierarchy_exists(layer, usd_path)
+
+                    if mesh.animation_type == AnimationType.VERTEX_ANIMATED:
+                        self.log(f"Exporting mesh with vertex animation: {mesh_name} -> {usd_path}")
+                        self._export_mesh_with_vertex_anim(layer, mesh, usd_path, frame_count)
+                        vertex_animated_count += 1
+                    else:
+                        self.log(f"Exporting mesh (transform only): {mesh_name} -> {usd_path}")
+                        self._export_mesh_transform_only(layer, mesh, usd_path, frame_count)
+
                     self.created_prims.add(usd_path)
                     used_paths.add(usd_path)
-                    locator_count += 1
-                except Exception as e:
-                    self.log(f"Warning: Failed to export locator {xform_name}: {e}")
+
+                # Process transforms (locators/trackers) with hierarchy preservation
+                # Authored serially on purpose: SdfLayer does not support concurrent
+                # edits and pxr authoring calls hold the GIL, so a thread pool would
+                # risk layer corruption without any speedup. Per-locator cost is kept
+                # down by the batched TRS writes in _write_trs_samples instead.
+                locator_count = 0
+                for transform in scene_data.transforms:
+                    xform_name = transform.name  # Always use locator's own name
+                    # Get hierarchical USD path from full_path
+                    usd_path = self._get_usd_path_from_full_path(transform, xform_name)
+
+                    # Skip if path conflicts with existing camera/mesh/locator
+                    if usd_path in used_paths:
+                        self.log(f"Skipping locator (path conflict): {xform_name}")
+                        continue
+
+                    # Skip if no keyframes
+                    if not transform.keyframes:
+                        self.log(f"Skipping locator (no keyframes): {xform_name}")
+                        continue
+
+                    try:
+                        self._ensure_hierarchy_exists(layer, usd_path)
+                        self.log(f"Exporting locator: {xform_name} -> {usd_path}")
+                        self._export_locator(layer, transform, usd_path, frame_count)
+                        self.created_prims.add(usd_path)
+                        used_paths.add(usd_path)
+                        locator_count += 1
+                    except Exception as e:
+                        self.log(f"Warning: Failed to export locator {xform_name}: {e}")
 
             # Save stage
-            stage.Save()
+            if not layer.Export(str(usd_file)):
+                raise IOError(f"Failed to write USD file: {usd_file}")
             self.log(f"\n✓ USD file saved: {usd_file}")
             self.log(f"✓ Exported {len(scene_data.cameras)} cameras, {len(scene_data.meshes)} meshes, {locator_count} locators")
             self.log(f"✓ Vertex-animated meshes: {vertex_animated_count}")
+            if self.constant_channel_count:
+                self.log(f"✓ Constant TRS channels written as defaults: {self.constant_channel_count}")
 
             return {
                 'success': True,
@@ -207,47 +252,45 @@ class USDExporter(BaseExporter):
                 'files': []
             }
 
-    def _export_camera(self, stage, camera, usd_path, frame_count):
+    def _export_camera(self, layer, camera, usd_path, frame_count):
         """Export animated camera to USD
 
         Args:
-            stage: USD stage
+            layer: Sdf.Layer being authored
             camera: CameraData instance from SceneData
             usd_path: Full USD prim path (e.g., "/World/Group/Camera")
             frame_count: Total frames
         """
         # Define camera at the given path
-        usd_camera = self.UsdGeom.Camera.Define(stage, usd_path)
+        prim_spec = self._define_prim(layer, usd_path, "Camera")
+        tokens = self.UsdGeom.Tokens
+        value_types = self.Sdf.ValueTypeNames
 
         # Set camera properties from CameraData.properties
         focal_length = camera.properties.focal_length
         h_aperture = camera.properties.h_aperture * 10  # cm to mm
         v_aperture = camera.properties.v_aperture * 10  # cm to mm
 
-        usd_camera.GetFocalLengthAttr().Set(focal_length)
-        usd_camera.GetHorizontalApertureAttr().Set(h_aperture)
-        usd_camera.GetVerticalApertureAttr().Set(v_aperture)
+        self._create_attr(prim_spec, tokens.focalLength, value_types.Float, focal_length)
+        self._create_attr(prim_spec, tokens.horizontalAperture, value_types.Float, h_aperture)
+        self._create_attr(prim_spec, tokens.verticalAperture, value_types.Float, v_aperture)
 
         # Animate camera transform
-        xformable = self.UsdGeom.Xformable(usd_camera)
+        # USD uses same Y-up coordinate system - direct copy!
+        trs_paths = self._create_trs_ops(prim_spec)
+        self._write_trs_samples(layer, trs_paths, camera.keyframe_arrays)
 
-        # Create transform ops with EXPLICIT precision for Maya compatibility
-        translate_op = xformable.AddTranslateOp(self.UsdGeom.XformOp.PrecisionDouble)
-        rotate_op = xformable.AddRotateXYZOp(self.UsdGeom.XformOp.PrecisionFloat)
-        scale_op = xformable.AddScaleOp(self.UsdGeom.XformOp.PrecisionFloat)
+        # Diagnostic detail only - skip the scan and formatting when not verbose
+        if not self.verbose:
+            return
 
-        # Set default values FIRST to establish attributes (required for animation)
-        if camera.keyframes:
-            kf = camera.keyframes[0]
-            translate_op.Set(self._make_vec3d(kf.position))
-            rotate_op.Set(self._make_vec3f(kf.rotation_maya))
-            scale_op.Set(self._make_vec3f(kf.scale))
+        cam_name = usd_path.rpartition('/')[2]
 
+        if camera.keyframes:
             # Log first frame values for debugging
-            cam_name = usd_path.split('/')[-1]
+            kf = camera.keyframes[0]
             self.log(f"  Camera {cam_name} frame 1: pos={kf.position}, rot={kf.rotation_maya}")
 
-        # THEN set time-sampled animation from pre-extracted keyframes
         first_kf, last_kf = None, None
         for kf in camera.keyframes:
             if kf.frame == 1:
@@ -255,15 +298,8 @@ class USDExporter(BaseExporter):
             if kf.frame == frame_count:
                 last_kf = kf
 
-            # USD uses same Y-up coordinate system - direct copy!
-            # Use float for time code (matches USD convention)
-            translate_op.Set(self._make_vec3d(kf.position), time=float(kf.frame))
-            rotate_op.Set(self._make_vec3f(kf.rotation_maya), time=float(kf.frame))
-            scale_op.Set(self._make_vec3f(kf.scale), time=float(kf.frame))
-
         # Log animation range to verify data changes
         if first_kf and last_kf:
-            cam_name = usd_path.split('/')[-1]
             self.log(f"  Camera {cam_name} animation check:")
             self.log(f"    Frame 1: pos={first_kf.position}, rot={first_kf.rotation_maya}")
             self.log(f"    Frame {frame_count}: pos={last_kf.position}, rot={last_kf.rotation_maya}")
@@ -271,125 +307,73 @@ class USDExporter(BaseExporter):
             rot_changed = first_kf.rotation_maya != last_kf.rotation_maya
             self.log(f"    Position animated: {pos_changed}, Rotation animated: {rot_changed}")
 
-    def _export_mesh_transform_only(self, stage, mesh, usd_path, frame_count):
+    def _export_mesh_transform_only(self, layer, mesh, usd_path, frame_count):
         """Export mesh with static geometry and animated transform
 
         Args:
-            stage: USD stage
+            layer: Sdf.Layer being authored
             mesh: MeshData instance from SceneData
             usd_path: Full USD prim path (e.g., "/World/Group/Mesh")
             frame_count: Total frames
         """
-        # Define mesh at the given path
-        usd_mesh = self.UsdGeom.Mesh.Define(stage, usd_path)
+        # Define mesh at the given path (orientation, indices and counts)
+        prim_spec = self._define_mesh_topology(layer, mesh.geometry, usd_path)
 
-        # Set orientation to handle winding order difference from Alembic
-        usd_mesh.GetOrientationAttr().Set("leftHanded")
+        # Set static points
+        # Geometry is already stored as typed float32/int32 buffers
+        points = self.Vt.Vec3fArray.FromNumpy(mesh.geometry.positions)
+        self._create_attr(prim_spec, self.UsdGeom.Tokens.points,
+                          self.Sdf.ValueTypeNames.Point3fArray, points)
 
-        # Get mesh data from pre-extracted geometry
-        geometry = mesh.geometry
+        # Animate transform (Y-up coordinate system - direct copy from source)
+        trs_paths = self._create_trs_ops(prim_spec)
+        self._write_trs_samples(layer, trs_paths, mesh.keyframe_arrays, self.quantize_rotations)
 
-        # Set static topology
-        # Convert positions to USD format
-        points = self.Vt.Vec3fArray([self._make_vec3f(p) for p in geometry.positions])
-        usd_mesh.GetPointsAttr().Set(points)
-
-        # Set face vertex indices
-        indices = self.Vt.IntArray([int(i) for i in geometry.indices])
-        usd_mesh.GetFaceVertexIndicesAttr().Set(indices)
-
-        # Set face vertex counts
-        counts = self.Vt.IntArray([int(c) for c in geometry.counts])
-        usd_mesh.GetFaceVertexCountsAttr().Set(counts)
-
-        # Animate transform
-        xformable = self.UsdGeom.Xformable(usd_mesh)
-
-        # Create transform ops with EXPLICIT precision for Maya compatibility
-        translate_op = xformable.AddTranslateOp(self.UsdGeom.XformOp.PrecisionDouble)
-        rotate_op = xformable.AddRotateXYZOp(self.UsdGeom.XformOp.PrecisionFloat)
-        scale_op = xformable.AddScaleOp(self.UsdGeom.XformOp.PrecisionFloat)
-
-        # Set default values FIRST to establish attributes (required for animation)
-        if mesh.keyframes:
-            kf = mesh.keyframes[0]
-            translate_op.Set(self._make_vec3d(kf.position))
-            rotate_op.Set(self._make_vec3f(kf.rotation_maya))
-            scale_op.Set(self._make_vec3f(kf.scale))
-
-        # THEN set time-sampled animation from pre-extracted keyframes
-        for kf in mesh.keyframes:
-            # Y-up coordinate system - direct copy from source
-            # Use float for time code (matches USD convention)
-            translate_op.Set(self._make_vec3d(kf.position), time=float(kf.frame))
-            rotate_op.Set(self._make_vec3f(kf.rotation_maya), time=float(kf.frame))
-            scale_op.Set(self._make_vec3f(kf.scale), time=float(kf.frame))
-
-    def _export_mesh_with_vertex_anim(self, stage, mesh, usd_path, frame_count):
+    def _export_mesh_with_vertex_anim(self, layer, mesh, usd_path, frame_count):
         """Export mesh with vertex animation (time-sampled point positions)
 
         Args:
-            stage: USD stage
+            layer: Sdf.Layer being authored
             mesh: MeshData instance from SceneData
             usd_path: Full USD prim path (e.g., "/World/Group/Mesh")
             frame_count: Total frames
         """
-        # Define mesh at the given path
-        usd_mesh = self.UsdGeom.Mesh.Define(stage, usd_path)
-
-        # Set orientation to handle winding order difference from Alembic
-        usd_mesh.GetOrientationAttr().Set("leftHanded")
-
-        # Get static topology from pre-extracted geometry
+        # Define mesh with static topology (indices and counts don't change)
         geometry = mesh.geometry
-
-        # Set static topology (indices and counts don't change)
-        indices = self.Vt.IntArray([int(i) for i in geometry.indices])
-        usd_mesh.GetFaceVertexIndicesAttr().Set(indices)
-
-        counts = self.Vt.IntArray([int(c) for c in geometry.counts])
-        usd_mesh.GetFaceVertexCountsAttr().Set(counts)
-
-        # Get points attribute for time-sampled animation
-        points_attr = usd_mesh.GetPointsAttr()
-
-        # Sample vertex positions from pre-extracted per-frame data
-        if mesh.vertex_positions_per_frame:
-            for frame, positions in mesh.vertex_positions_per_frame.items():
-                # Convert positions to USD format
-                points = self.Vt.Vec3fArray([self._make_vec3f(p) for p in positions])
-
+        prim_spec = self._define_mesh_topology(layer, geometry, usd_path)
+
+        # Points attribute for time-sampled animation
+        points_spec = self._create_attr(prim_spec, self.UsdGeom.Tokens.points,
+                                        self.Sdf.ValueTypeNames.Point3fArray)
+
+        # Sample vertex positions from pre-extracted (or streamed) per-frame data;
+        # each frame is handed to the layer as soon as it is read
+        if mesh.has_vertex_positions:
+            frame_positions = mesh.iter_vertex_positions()
+            if self.quantize_points:
+                # Needs the animated bounds up front, so frames are materialized
+                frame_positions = self._quantize_vertex_frames(list(frame_positions))
+
+            authored = 0
+            to_vt = self.Vt.Vec3fArray.FromNumpy
+            set_sample = layer.SetTimeSample
+            points_path = points_spec.path
+            for frame, positions in self._changed_vertex_frames(frame_positions):
                 # Set time-sampled point positions (use float for time code)
-                points_attr.Set(points, time=float(frame))
+                set_sample(points_path, float(frame), to_vt(positions))
+                authored += 1
+
+            if authored < frame_count and self.verbose:
+                self.log(f"  Authored {authored} of {frame_count} frames (skipped held frames)")
         else:
             # Fallback to static geometry if vertex_positions_per_frame not available
-            points = self.Vt.Vec3fArray([self._make_vec3f(p) for p in geometry.positions])
-            points_attr.Set(points)
+            points_spec.default = self.Vt.Vec3fArray.FromNumpy(geometry.positions)
 
         # Animate transform (if transform is also animated)
-        xformable = self.UsdGeom.Xformable(usd_mesh)
-
-        # Create transform ops with EXPLICIT precision for Maya compatibility
-        translate_op = xformable.AddTranslateOp(self.UsdGeom.XformOp.PrecisionDouble)
-        rotate_op = xformable.AddRotateXYZOp(self.UsdGeom.XformOp.PrecisionFloat)
-        scale_op = xformable.AddScaleOp(self.UsdGeom.XformOp.PrecisionFloat)
-
-        # Set default values FIRST to establish attributes (required for animation)
-        if mesh.keyframes:
-            kf = mesh.keyframes[0]
-            translate_op.Set(self._make_vec3d(kf.position))
-            rotate_op.Set(self._make_vec3f(kf.rotation_maya))
-            scale_op.Set(self._make_vec3f(kf.scale))
-
-        # THEN set time-sampled animation from pre-extracted keyframes
-        for kf in mesh.keyframes:
-            # Y-up coordinate system - direct copy from source
-            # Use float for time code (matches USD convention)
-            translate_op.Set(self._make_vec3d(kf.position), time=float(kf.frame))
-            rotate_op.Set(self._make_vec3f(kf.rotation_maya), time=float(kf.frame))
-            scale_op.Set(self._make_vec3f(kf.scale), time=float(kf.frame))
-
-    def _export_locator(self, stage, transform, usd_path, frame_count):
+        trs_paths = self._create_trs_ops(prim_spec)
+        self._write_trs_samples(layer, trs_paths, mesh.keyframe_arrays, self.quantize_rotations)
+
+    def _export_locator(self, layer, transform, usd_path, frame_count):
         """Export animated locator/tracker to USD as pure Xform
 
         Creates a UsdGeom.Xform with animated transforms and no geometry.
@@ -397,115 +381,346 @@ class USDExporter(BaseExporter):
         a locator/null and display it with their native representation.
 
         Args:
-            stage: USD stage
+            layer: Sdf.Layer being authored
             transform: TransformData instance from SceneData
             usd_path: Full USD prim path (e.g., "/World/Group/Locator")
             frame_count: Total frames
         """
         # Define Xform only - no geometry child
         # DCCs will display this with their native locator/null representation
-        usd_xform = self.UsdGeom.Xform.Define(stage, usd_path)
-
-        # Get xformable for adding transform ops
-        xformable = self.UsdGeom.Xformable(usd_xform)
-
-        # Create transform ops with EXPLICIT precision for Maya compatibility
-        translate_op = xformable.AddTranslateOp(self.UsdGeom.XformOp.PrecisionDouble)
-        rotate_op = xformable.AddRotateXYZOp(self.UsdGeom.XformOp.PrecisionFloat)
-        scale_op = xformable.AddScaleOp(self.UsdGeom.XformOp.PrecisionFloat)
-
-        # Set default values FIRST to establish attributes
-        if transform.keyframes:
-            kf = transform.keyframes[0]
-            translate_op.Set(self._make_vec3d(kf.position))
-            rotate_op.Set(self._make_vec3f(kf.rotation_maya))
-            scale_op.Set(self._make_vec3f(kf.scale))
-
-        # Set time-sampled animation
-        for kf in transform.keyframes:
-            translate_op.Set(self._make_vec3d(kf.position), time=float(kf.frame))
-            rotate_op.Set(self._make_vec3f(kf.rotation_maya), time=float(kf.frame))
-            scale_op.Set(self._make_vec3f(kf.scale), time=float(kf.frame))
-
-    def _sanitize_name(self, name):
+        prim_spec = self._define_prim(layer, usd_path, "Xform")
+
+        trs_paths = self._create_trs_ops(prim_spec)
+        self._write_trs_samples(layer, trs_paths, transform.keyframe_arrays, self.quantize_rotations)
+
+    def _define_mesh_topology(self, layer, geometry, usd_path):
+        """Define a Mesh prim spec with its orientation and face topology
+
+        Args:
+            layer: Sdf.Layer being authored
+            geometry: MeshGeometry instance from SceneData
+            usd_path: Full USD prim path
+
+        Returns:
+            Sdf.PrimSpec: The mesh prim spec
+        """
+        prim_spec = self._define_prim(layer, usd_path, "Mesh")
+        tokens = self.UsdGeom.Tokens
+        value_types = self.Sdf.ValueTypeNames
+
+        # Set orientation to handle winding order difference from Alembic
+        self._create_attr(prim_spec, tokens.orientation, value_types.Token,
+                          tokens.leftHanded, uniform=True)
+
+        # Set face vertex indices and counts
+        self._create_attr(prim_spec, tokens.faceVertexIndices, value_types.IntArray,
+                          self._shared_int_array(geometry.indices))
+        self._create_attr(prim_spec, tokens.faceVertexCounts, value_types.IntArray,
+                          self._shared_int_array(geometry.counts))
+        return prim_spec
+
+    def _shared_int_array(self, values):
+        """Convert an int32 buffer to Vt.IntArray, reusing identical conversions
+
+        Meshes that share topology (duplicated or instanced geometry) get the
+        same Vt.IntArray back instead of a fresh copy per mesh. Readers already
+        hand such meshes the same ndarray (BaseReader._intern_topology), so the
+        cache is keyed on array identity; the entry holds the array to keep
+        its id from being reused during the export.
+
+        Args:
+            values: int32 NumPy array
+
+        Returns:
+            Vt.IntArray: Converted (possibly shared) array
+        """
+        cached = self._vt_array_cache.get(id(values))
+        if cached is not None:
+            return cached[1]
+        vt_array = self.Vt.IntArray.FromNumpy(values)
+        self._vt_array_cache[id(values)] = (values, vt_array)
+        return vt_array
+
+    def _define_prim(self, layer, usd_path, type_name):
+        """Author a typed prim definition directly on the layer
+
+        Same specs as UsdGeom.<type>.Define on a stage targeting this layer,
+        minus the schema lookup and recomposition. Parents are expected to be
+        defined already (see _ensure_hierarchy_exists).
+
+        Args:
+            layer: Sdf.Layer being authored
+            usd_path: Full USD prim path
+            type_name: Schema type name (e.g., "Xform", "Mesh", "Camera")
+
+        Returns:
+            Sdf.PrimSpec: The defined prim spec
+        """
+        prim_spec = self.Sdf.CreatePrimInLayer(layer, usd_path)
+        prim_spec.specifier = self.Sdf.SpecifierDef
+        prim_spec.typeName = type_name
+        return prim_spec
+
+    def _create_attr(self, prim_spec, name, value_type, default=None, uniform=False):
+        """Create (or reuse) a schema attribute spec, optionally with a default
+
+        Args:
+            prim_spec: Owning Sdf.PrimSpec
+            name: Attribute name
+            value_type: Sdf.ValueTypeNames entry
+            default: Optional default value
+            uniform: Author as uniform (non-animatable) instead of varying
+
+        Returns:
+            Sdf.AttributeSpec: The attribute spec
+        """
+        attr_spec = prim_spec.attributes.get(name)
+        if attr_spec is None:
+            variability = self.Sdf.VariabilityUniform if uniform else self.Sdf.VariabilityVarying
+            attr_spec = self.Sdf.AttributeSpec(prim_spec, name, value_type, variability)
+        if default is not None:
+            attr_spec.default = default
+        return attr_spec
+
+    def _quantize_vertex_frames(self, frame_positions):
+        """Snap vertex positions to a 16-bit grid over the animated bounds
+
+        The points attribute is point3f[] by schema, so values stay float32;
+        quantizing removes sub-step jitter (common in simulation caches) so
+        near-still frames become identical and are dropped as held frames.
+        Maximum error is (bbox extent / 65535) per axis.
+
+        Args:
+            frame_positions: (frame, vertex positions) pairs in frame order
+
+        Returns:
+            list: (frame, (N, 3) float32 quantized positions) pairs
+        """
+        arrays = [
+            (frame, np.asarray(positions, dtype=np.float32).reshape(-1, 3))
+            for frame, positions in frame_positions
+        ]
+        non_empty = [a for _, a in arrays if len(a)]
+        if not non_empty:
+            return arrays
+
+        bbox_min = np.min([a.min(axis=0) for a in non_empty], axis=0)
+        bbox_max = np.max([a.max(axis=0) for a in non_empty], axis=0)
+        step = (bbox_max - bbox_min) / 65535.0
+        step[step == 0] = 1.0  # Flat axis - every value is already bbox_min
+
+        return [
+            (frame, (np.round((a - bbox_min) / step) * step + bbox_min).astype(np.float32))
+            for frame, a in arrays
+        ]
+
+    def _changed_vertex_frames(self, frame_positions):
+        """Yield only the vertex frames that need a time sample
+
+        Frames identical to the previous frame are dropped, except the last
+        frame of a held run: USD interpolates linearly between samples, so
+        the run's end must be authored to keep the hold flat until the mesh
+        moves again. A trailing held run needs no samples at all.
+
+        Args:
+            frame_positions: (frame, (N, 3) float32 vertex positions) pairs in frame order
+
+        Yields:
+            tuple: (frame, (N, 3) float32 positions array)
+        """
+        prev = None
+        held = None  # Latest skipped repeat of prev, emitted when the run ends
+
+        for frame, positions in frame_positions:
+            # No-op for the float32 buffers SceneData stores; FromNumpy needs contiguous data
+            positions = np.ascontiguousarray(positions, dtype=np.float32).reshape(-1, 3)
+
+            if prev is not None and np.array_equal(positions, prev):
+                held = (frame, positions)
+                continue
+
+            if held is not None:
+                yield held
+                held = None
+
+            yield frame, positions
+            prev = positions
+
+    def _create_trs_ops(self, prim_spec):
+        """Add the translate/rotateXYZ/scale op stack to a prim spec
+
+        Shared by every prim type so the TRS layout lives in one place. The
+        stack is XformCommonAPI compatible: translate (double), rotateXYZ
+        (float) and scale (float) - the explicit precisions Maya expects.
+
+        Args:
+            prim_spec: Sdf.PrimSpec of the target prim
+
+        Returns:
+            tuple: Sdf.Path of the (translate, rotate, scale) attributes
+        """
+        value_types = self.Sdf.ValueTypeNames
+        op_specs = [
+            self._create_attr(prim_spec, name, value_type)
+            for name, value_type in (
+                ("xformOp:translate", value_types.Double3),
+                ("xformOp:rotateXYZ", value_types.Float3),
+                ("xformOp:scale", value_types.Float3),
+            )
+        ]
+        self._create_attr(prim_spec, self.UsdGeom.Tokens.xformOpOrder, value_types.TokenArray,
+                          self.Vt.TokenArray([spec.name for spec in op_specs]), uniform=True)
+        return tuple(spec.path for spec in op_specs)
+
+    def _write_trs_samples(self, layer, trs_paths, keyframes, quantize_rotations=False):
+        """Author TRS animation onto ops created by _create_trs_ops
+
+        Channels arrive as packed arrays and are converted to Vt arrays with
+        one call each; every keyframe is then written with its own
+        SetTimeSample call. Constant channels collapse to a default value;
+        without keyframes the ops get identity defaults so the op stack
+        stays valid.
+
+        Args:
+            layer: Sdf.Layer being authored
+            trs_paths: (translate, rotate, scale) attribute paths
+            keyframes: TransformKeyframes (the data object's keyframe_arrays)
+            quantize_rotations: Round rotations to 0.001 degree before writing
+        """
+        t_path, r_path, s_path = trs_paths
+
+        if not len(keyframes):
+            layer.GetAttributeAtPath(t_path).default = self.Gf.Vec3d(0.0, 0.0, 0.0)
+            layer.GetAttributeAtPath(r_path).default = self.Gf.Vec3f(0.0, 0.0, 0.0)
+            layer.GetAttributeAtPath(s_path).default = self.Gf.Vec3f(1.0, 1.0, 1.0)
+            return
+
+        # Time samples alone establish the animated values; no separate default
+        # value is authored (float time codes match USD convention). A channel
+        # that never changes is written as a single default instead.
+        set_sample = layer.SetTimeSample
+        times = keyframes.frames.tolist()
+        rotations = keyframes.rotations
+        if quantize_rotations:
+            rotations = np.round(rotations, 3)
+        channels = (
+            (t_path, keyframes.positions, self.Vt.Vec3dArray.FromNumpy),
+            (r_path, rotations, self.Vt.Vec3fArray.FromNumpy),
+            (s_path, keyframes.scales, self.Vt.Vec3fArray.FromNumpy),
+        )
+        for path, values, to_vt in channels:
+            vt_values = to_vt(values)
+            if (values == values[0]).all():
+                layer.GetAttributeAtPath(path).default = vt_values[0]
+                self.constant_channel_count += 1
+                continue
+            for time, value in zip(times, vt_values):
+                set_sample(path, time, value)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _sanitize_name(name):
         """Sanitize name for USD prim path
 
+        Pure function of the name, memoized because every path component is
+        re-sanitized for each prim that shares it. Bounded, since the cache
+        outlives a single export in the GUI.
+
         Args:
             name: Original name
 
         Returns:
             str: Sanitized name safe for USD paths
         """
-        # Replace spaces and special characters
-        sanitized = name.replace(' ', '_').replace('-', '_')
-        # Remove other problematic characters
-        sanitized = ''.join(c for c in sanitized if c.isalnum() or c == '_')
+        # Replace spaces and dashes (one translate pass)
+        sanitized = name.translate(_SEPARATOR_TABLE)
+        # Remove other problematic characters (single C-level regex scan)
+        sanitized = _INVALID_NAME_CHARS.sub('', sanitized)
         # Ensure it doesn't start with a number
         if sanitized and sanitized[0].isdigit():
             sanitized = 'mesh_' + sanitized
         return sanitized or 'mesh'
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _sanitize_path_parts(parts):
+        """Sanitize every component of a hierarchy path
+
+        Memoized on the whole component tuple: objects under the same parent
+        resolve their shared ancestry with one cache hit. Bounded like
+        _sanitize_name.
+
+        Args:
+            parts: Tuple of source path components
+
+        Returns:
+            tuple: Sanitized components
+        """
+        return tuple(USDExporter._sanitize_name(p) for p in parts)
+
     # === HIERARCHY UTILITIES ===
 
-    def _get_usd_path_from_full_path(self, full_path, display_name):
-        """Convert a full_path to a USD prim path with hierarchy
+    def _get_usd_path_from_full_path(self, scene_object, display_name):
+        """Convert an object's full_path to a USD prim path with hierarchy
 
-        Parses the source full_path (e.g., "/Group/SubGroup/ObjectShape")
-        and constructs a USD path preserving hierarchy.
+        Uses the source path pre-split on the scene object (e.g.,
+        "/Group/SubGroup/ObjectShape" -> full_path_parts + is_shape) and
+        constructs a USD path preserving hierarchy.
 
         For shapes (ending in "Shape"), uses the display_name (parent transform name)
         as the object name, with grandparent as the hierarchy parent.
 
         Args:
-            full_path: Full hierarchy path from source (e.g., "/CameraRig/Camera/CameraShape")
+            scene_object: CameraData, MeshData or TransformData from SceneData
             display_name: Display name for the object (e.g., "Camera" for a camera shape)
 
         Returns:
             str: USD prim path (e.g., "/World/CameraRig/Camera")
         """
-        parts = [p for p in full_path.split('/') if p]
-        if not parts:
-            return f"/World/{self._sanitize_name(display_name)}"
-
-        # Build path components
+        parts = scene_object.full_path_parts
         sanitized_name = self._sanitize_name(display_name)
+        if not parts:
+            return f"/World/{sanitized_name}"
 
         # Determine hierarchy path
         # For shapes: /Group/Transform/Shape -> /World/Group/Transform
         # For transforms: /Group/Transform -> /World/Group/Transform
-        obj_name = parts[-1]
-        if obj_name.endswith('Shape') and len(parts) >= 2:
-            # Shape node - use parent path elements (excluding shape itself)
-            hierarchy_parts = parts[:-1]  # Everything except the shape
-        else:
-            # Transform node - use all path elements
-            hierarchy_parts = parts
+        # (shape nodes use parent path elements, excluding the shape itself)
+        hierarchy_parts = parts[:-1] if scene_object.is_shape else parts
 
         # If the last element of hierarchy matches display_name, use full hierarchy
         # Otherwise, replace last element with display_name
-        if hierarchy_parts and self._sanitize_name(hierarchy_parts[-1]) == sanitized_name:
-            path_parts = [self._sanitize_name(p) for p in hierarchy_parts]
+        sanitized_parts = self._sanitize_path_parts(hierarchy_parts)
+        if sanitized_parts and sanitized_parts[-1] == sanitized_name:
+            path_parts = sanitized_parts
         else:
-            path_parts = [self._sanitize_name(p) for p in hierarchy_parts[:-1]] + [sanitized_name]
+            path_parts = sanitized_parts[:-1] + (sanitized_name,)
 
         return "/World/" + "/".join(path_parts) if path_parts else f"/World/{sanitized_name}"
 
-    def _ensure_hierarchy_exists(self, stage, usd_path):
+    def _ensure_hierarchy_exists(self, layer, usd_path):
         """Ensure all parent Xforms exist for a given USD path
 
         Creates intermediate Xform prims for any missing parent paths.
 
         Args:
-            stage: USD stage
+            layer: Sdf.Layer being authored
             usd_path: Target USD prim path (e.g., "/World/Group/SubGroup/Object")
         """
         parts = usd_path.split('/')
-        # Build paths incrementally, skipping empty parts and the final object
-        current_path = ""
-        for part in parts[1:-1]:  # Skip empty first part and final object
-            current_path += "/" + part
-            if current_path not in self.created_prims:
-                # Create Xform for hierarchy group
-                self.UsdGeom.Xform.Define(stage, current_path)
-                self.created_prims.add(current_path)
-                self.log(f"  Creating hierarchy group: {current_path}")
+        # Walk the ancestors (skipping the empty first part and the final object)
+        # down a trie of already-ensured components; path strings are only
+        # built for components seen for the first time
+        node = self._hierarchy_trie
+        for depth, part in enumerate(parts[1:-1], start=2):
+            child = node.get(part)
+            if child is None:
+                current_path = '/'.join(parts[:depth])
+                if current_path not in self.created_prims:
+                    # Create Xform for hierarchy group
+                    self._define_prim(layer, current_path, "Xform")
+                    self.created_prims.add(current_path)
+                    if self.verbose:
+                        self.log(f"  Creating hierarchy group: {current_path}")
+                child = node[part] = {}
+            node = child
@@ -7,7 +7,6 @@ Scene file readers for different 3D formats (Alembic, USD, Maya)
 from pathlib import Path
 
 from .base_reader import BaseReader
-from .alembic_reader import AlembicReader
 
 # Supported file extensions
 ALEMBIC_EXTENSIONS = {'.abc'}
@@ -32,6 +31,8 @@ def create_reader(input_file):
     ext = path.suffix.lower()
 
     if ext in ALEMBIC_EXTENSIONS:
+        # Lazy import to avoid loading the Alembic bindings for other formats
+        from .alembic_reader import AlembicReader
         return AlembicReader(input_file)
     elif ext in USD_EXTENSIONS:
         # Lazy import to avoid requiring USD when only using Alembic
@@ -80,6 +81,14 @@ def is_supported_format(input_file):
     return ext in SUPPORTED_EXTENSIONS
 
 
+def __getattr__(name):
+    """Import AlembicReader on first access (see create_reader)"""
+    if name == 'AlembicReader':
+        from .alembic_reader import AlembicReader
+        return AlembicReader
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     'BaseReader',
     'AlembicReader',
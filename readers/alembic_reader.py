@@ -4,16 +4,97 @@ Alembic Reader Module
 Centralized Alembic reading utilities implementing the BaseReader interface
 """
 
+import math
+from functools import lru_cache
+
 import numpy as np
 from pathlib import Path
 
 # Import Alembic libraries
 from alembic.Abc import IArchive, ISampleSelector, WrapExistingFlag
 from alembic.AbcGeom import IXform, ICamera, IPolyMesh
-import imath
 
 from .base_reader import BaseReader
 
+# Object kinds recorded during traversal (see AlembicReader._kind_of)
+KIND_OTHER = 0
+KIND_XFORM = 1
+KIND_CAMERA = 2
+KIND_MESH = 3
+
+# Kinds by the schemaObjTitle that IXform/ICamera/IPolyMesh.matches() test
+# for; headers with other titles fall back to the matches() calls
+_KIND_BY_SCHEMA_TITLE = {
+    'AbcGeom_Xform_v3:.xform': KIND_XFORM,
+    'AbcGeom_Camera_v1:.geom': KIND_CAMERA,
+    'AbcGeom_PolyMesh_v1:.geom': KIND_MESH,
+}
+
+# Shared world matrix for objects with no xform ancestry (read-only)
+_IDENTITY = np.identity(4)
+_IDENTITY.flags.writeable = False
+
+
+@lru_cache(maxsize=512)
+def _cached_selector(time_seconds):
+    return ISampleSelector(time_seconds)
+
+
+def _sample_selector(time_seconds):
+    """Get a shared ISampleSelector for a time
+
+    Times come from frame / fps arithmetic, so they are rounded before
+    caching to keep equal times on one key.
+    """
+    return _cached_selector(round(float(time_seconds), 9))
+
+
+def _imath_to_numpy(values, dtype, width=None):
+    """Convert an imath array to an ndarray
+
+    Uses the buffer protocol when the bindings expose it (no per-element
+    Python objects); older bindings fall back to element-wise conversion.
+
+    Args:
+        values: imath array (V3fArray, IntArray, ...)
+        dtype: numpy dtype of the result
+        width: Components per element for vector arrays, None for scalars
+
+    Returns:
+        np.ndarray: (N,) or (N, width) array
+    """
+    try:
+        array = np.asarray(values, dtype=dtype)
+    except (TypeError, ValueError):
+        array = None
+    if array is None or array.dtype == object or (width and array.size != len(values) * width):
+        if width:
+            array = np.array([tuple(v[i] for i in range(width)) for v in values], dtype=dtype)
+        else:
+            array = np.fromiter(values, dtype=dtype, count=len(values))
+    return array.reshape(-1, width) if width else array.reshape(-1)
+
+
+def _chain_product(matrices):
+    """Multiply matrices in order (matrices[0] @ matrices[1] @ ...)
+
+    Reduces pairwise so deep hierarchies have a log-depth chain of dependent
+    products instead of a linear one. Works on single (4, 4) matrices and
+    on (N, 4, 4) stacks alike.
+
+    Args:
+        matrices: Non-empty list of matrices, outermost (root) first
+
+    Returns:
+        np.ndarray: The accumulated product
+    """
+    while len(matrices) > 1:
+        paired = [a @ b for a, b in zip(matrices[0::2], matrices[1::2])]
+        if len(matrices) % 2:
+            paired.append(matrices[-1])
+        matrices = paired
+    return matrices[0]
+
 
 class AlembicReader(BaseReader):
     """Centralized Alembic file reading and data extraction
@@ -24,6 +105,10 @@ class AlembicReader(BaseReader):
     Key principle: Read the Alembic file ONCE, then share data across all exporters.
     """
 
+    # Max cached xform samples; enough for every ancestor of the objects being
+    # sampled at the current frame, bounded so long shots don't hold them all
+    XFORM_SAMPLE_CACHE_SIZE = 4096
+
     def __init__(self, abc_file):
         """Open Alembic archive and initialize
 
@@ -33,6 +118,31 @@ class AlembicReader(BaseReader):
         super().__init__(abc_file)
         self.archive = IArchive(str(self.file_path))
         self.top = self.archive.getTop()
+        self._xform_sample_cache = {}  # (full name, time) -> local 4x4 float64 matrix
+        # Per-kind object lists, filled by the same traversal as _objects_cache
+        # Kinds are keyed by full name: the bindings hand out a new wrapper
+        # for every children/getParent() access, so id() is not stable
+        self._kind_by_name = {}
+        # Hierarchy records in traversal order, parallel to _objects_cache:
+        # full name, parent index (-1 for the root) and child indices
+        self._index_by_name = {}
+        # Full names of the traversed wrappers by id(); safe because
+        # _objects_cache keeps those wrappers alive for the reader's lifetime
+        self._full_name_by_id = {}
+        self._full_names = []
+        self._parent_indices = []
+        self._child_indices = []
+        self._kinds = None  # uint8 array of KIND_* values, built after traversal
+        self._is_org_by_name = {}  # full name -> _is_organizational_group result
+        self._num_samples_by_name = {}  # full name -> xform schema sample count
+        self._cameras_cache = []
+        self._meshes_cache = []
+        self._transforms_cache = []
+        self._camera_metadata_cache = None
+        # Last world-matrix track; keyframe extraction decomposes the same
+        # track twice (AE and Maya rotation modes)
+        self._world_track_cache = None
+        self._frame_count_cache = None
 
     @property
     def abc_file(self):
@@ -59,50 +169,100 @@ class AlembicReader(BaseReader):
         """
         if self._objects_cache is None:
             self._objects_cache = []
-            self._collect_objects_recursive(self.top, self._objects_cache)
+            self._collect_objects(self.top, self._objects_cache)
+            self._kinds = np.array(
+                [self._kind_by_name[name] for name in self._full_names], dtype=np.uint8
+            )
         return self._objects_cache
 
-    def _collect_objects_recursive(self, obj, objects_list):
-        """Recursively collect all objects in hierarchy"""
-        objects_list.append(obj)
-        for child in obj.children:
-            self._collect_objects_recursive(child, objects_list)
+    def _collect_objects(self, root, objects_list):
+        """Collect all objects in hierarchy (depth-first preorder), sorting them by kind
+
+        Iterative so deep hierarchies can't hit the recursion limit. Also
+        records each object's name, parent and children by index.
+        """
+        stack = [(root, -1)]
+        while stack:
+            obj, parent_index = stack.pop()
+            index = len(objects_list)
+            objects_list.append(obj)
+
+            name = obj.getFullName()
+            self._index_by_name[name] = index
+            self._full_name_by_id[id(obj)] = name
+            self._full_names.append(name)
+            self._parent_indices.append(parent_index)
+            self._child_indices.append([])
+            if parent_index >= 0:
+                self._child_indices[parent_index].append(index)
+
+            # Inspect each header once; the kind lists back the get_* accessors
+            kind = self._kind_of(obj, name)
+            if kind == KIND_XFORM:
+                self._transforms_cache.append(obj)
+            elif kind == KIND_CAMERA:
+                self._cameras_cache.append(obj)
+            elif kind == KIND_MESH:
+                self._meshes_cache.append(obj)
+
+            # Reversed so children pop in their original order
+            stack.extend((child, index) for child in reversed(list(obj.children)))
+
+    def _kind_of(self, obj, name=None):
+        """Get an object's kind, reading its header only on first sight
+
+        Args:
+            obj: Alembic object
+            name: obj.getFullName(), if the caller already has it
+
+        Returns:
+            int: KIND_XFORM, KIND_CAMERA, KIND_MESH or KIND_OTHER
+        """
+        if name is None:
+            name = self._full_name(obj)
+        kind = self._kind_by_name.get(name)
+        if kind is None:
+            header = obj.getHeader()
+            # One metadata read usually settles it; otherwise ask each schema
+            kind = _KIND_BY_SCHEMA_TITLE.get(header.getMetaData().get('schemaObjTitle'))
+            if kind is None:
+                if IXform.matches(header):
+                    kind = KIND_XFORM
+                elif ICamera.matches(header):
+                    kind = KIND_CAMERA
+                elif IPolyMesh.matches(header):
+                    kind = KIND_MESH
+                else:
+                    kind = KIND_OTHER
+            self._kind_by_name[name] = kind
+        return kind
 
     def get_cameras(self):
-        """Get all camera objects in the scene
+        """Get all camera objects in the scene (cached)
 
         Returns:
             list: ICamera objects
         """
-        cameras = []
-        for obj in self.get_all_objects():
-            if ICamera.matches(obj.getHeader()):
-                cameras.append(obj)
-        return cameras
+        self.get_all_objects()
+        return self._cameras_cache
 
     def get_meshes(self):
-        """Get all mesh objects in the scene
+        """Get all mesh objects in the scene (cached)
 
         Returns:
             list: IPolyMesh objects
         """
-        meshes = []
-        for obj in self.get_all_objects():
-            if IPolyMesh.matches(obj.getHeader()):
-                meshes.append(obj)
-        return meshes
+        self.get_all_objects()
+        return self._meshes_cache
 
     def get_transforms(self):
-        """Get all transform objects in the scene
+        """Get all transform objects in the scene (cached)
 
         Returns:
             list: IXform objects
         """
-        transforms = []
-        for obj in self.get_all_objects():
-            if IXform.matches(obj.getHeader()):
-                transforms.append(obj)
-        return transforms
+        self.get_all_objects()
+        return self._transforms_cache
 
     def get_parent_map(self):
         """Build parent-child relationship map (cached)
@@ -111,12 +271,35 @@ class AlembicReader(BaseReader):
             dict: Mapping of child name -> parent object
         """
         if self._parent_map_cache is None:
-            self._parent_map_cache = {}
-            for obj in self.get_all_objects():
-                for child in obj.children:
-                    self._parent_map_cache[child.getName()] = obj
+            # Built from the traversal records - no further children/getName() calls
+            objects = self.get_all_objects()
+            self._parent_map_cache = {
+                name.rpartition('/')[2]: objects[parent_index]
+                for name, parent_index in zip(self._full_names, self._parent_indices)
+                if parent_index >= 0
+            }
         return self._parent_map_cache
 
+    def get_parent_name_map(self):
+        """Build child name -> parent name map (cached)
+
+        Read from the traversal records without any binding calls.
+
+        Returns:
+            dict: Mapping of child name -> parent name
+        """
+        if self._parent_name_map_cache is None:
+            objects = self.get_all_objects()
+            # The archive root's full name is "/", so its name comes from the object
+            short_names = [name.rpartition('/')[2] for name in self._full_names]
+            short_names[0] = objects[0].getName()
+            self._parent_name_map_cache = {
+                short_names[index]: short_names[parent_index]
+                for index, parent_index in enumerate(self._parent_indices)
+                if parent_index >= 0
+            }
+        return self._parent_name_map_cache
+
     def detect_frame_count(self, fps=24):
         """Auto-detect frame count from Alembic time sampling
 
@@ -126,21 +309,29 @@ class AlembicReader(BaseReader):
         Returns:
             int: Number of frames in the animation
         """
+        # The archive's sampling never changes, so detect once; fps only
+        # matters to readers that compute the count from a time range
+        if self._frame_count_cache is None:
+            self._frame_count_cache = self._read_frame_count()
+        return self._frame_count_cache
+
+    def _read_frame_count(self):
+        """Read the frame count from the archive's time samplings
+
+        Returns:
+            int: Sample count of the first non-default time sampling, or 120
+        """
         try:
-            # Get time sampling
-            num_time_samplings = self.archive.getNumTimeSamplings()
-            if num_time_samplings > 1:
+            if self.archive.getNumTimeSamplings() > 1:
                 # Use the first non-uniform time sampling (index 1)
-                time_sampling = self.archive.getTimeSampling(1)
                 num_samples = self.archive.getMaxNumSamplesForTimeSamplingIndex(1)
-
                 if num_samples > 0:
                     return num_samples
-
-            # Fallback: assume 120 frames if we can't detect
-            return 120
         except Exception:
-            return 120
+            pass
+
+        # Fallback: assume 120 frames if we can't detect
+        return 120
 
     def get_transform_at_time(self, obj, time_seconds, maya_compat=False):
         """Get transform data (position, rotation, scale) at a specific time
@@ -159,35 +350,18 @@ class AlembicReader(BaseReader):
                 - rotation: [rx, ry, rz] in degrees (XYZ Euler)
                 - scale: [sx, sy, sz] as multipliers (NOT multiplied by 100)
         """
-        # First, get the LOCAL matrix of this object to extract scale
-        local_scale = None
-        if IXform.matches(obj.getHeader()):
-            xform = IXform(obj, WrapExistingFlag.kWrapExisting)
-            schema = xform.getSchema()
-
-            sample_sel = ISampleSelector(time_seconds)
-            xf_sample = schema.getValue(sample_sel)
-            local_matrix = xf_sample.getMatrix()
-
-            # Extract scale from LOCAL matrix (this is where SynthEyes stores it)
-            m = np.array(local_matrix)
-            sx = np.linalg.norm([m[0][0], m[0][1], m[0][2]])
-            sy = np.linalg.norm([m[1][0], m[1][1], m[1][2]])
-            sz = np.linalg.norm([m[2][0], m[2][1], m[2][2]])
-            local_scale = [sx, sy, sz]
-
-        # Now accumulate world matrix for position and rotation
+        # Accumulate local matrices up the hierarchy for world position and rotation
         matrices = []
+        local_matrix = None
         current = obj
 
         while current:
-            if IXform.matches(current.getHeader()):
-                xform = IXform(current, WrapExistingFlag.kWrapExisting)
-                schema = xform.getSchema()
-
-                sample_sel = ISampleSelector(time_seconds)
-                xf_sample = schema.getValue(sample_sel)
-                matrices.append(xf_sample.getMatrix())
+            name = current.getFullName()
+            if self._kind_of(current, name) == KIND_XFORM:
+                matrix = self._sampled_local_matrix(current, time_seconds, name)
+                if current is obj:
+                    local_matrix = matrix
+                matrices.append(matrix)
 
             parent = current.getParent()
             if parent and parent.getName() != "ABC":
@@ -195,12 +369,18 @@ class AlembicReader(BaseReader):
             else:
                 break
 
-        # Combine transforms for world matrix
-        world_matrix = imath.M44d()
-        world_matrix.makeIdentity()
-
-        for mat in reversed(matrices):
-            world_matrix = world_matrix * mat
+        # Extract scale from this object's LOCAL matrix (this is where SynthEyes stores it)
+        local_scale = None
+        if local_matrix is not None:
+            basis = local_matrix[:3, :3]
+            local_scale = np.sqrt((basis * basis).sum(axis=1)).tolist()
+
+        # Combine transforms for world matrix (same product order as the
+        # imath chain: root * ... * parent * local)
+        if matrices:
+            world_matrix = _chain_product(matrices[::-1])
+        else:
+            world_matrix = _IDENTITY
 
         # Decompose world matrix for position and rotation
         pos, rot, world_scale = self._decompose_matrix(world_matrix, maya_compat=maya_compat)
@@ -211,6 +391,147 @@ class AlembicReader(BaseReader):
 
         return pos, rot, final_scale
 
+    def get_transform_track(self, obj, times, maya_compat=False):
+        """Get transform data for a whole sequence of times
+
+        Samples every xform in the object's ancestry once per time, then
+        accumulates and decomposes all frames as stacked (N, 4, 4) arrays.
+        Same conventions as get_transform_at_time, including local scale.
+
+        Args:
+            obj: Alembic object (should be IXform or have parent IXform)
+            times: Times in seconds to sample
+            maya_compat: If True, use Maya-compatible rotation decomposition (row-major)
+
+        Returns:
+            tuple: (translations, rotations, scales) as (N, 3) float64 arrays
+        """
+        world, local_scale = self._world_matrix_track(obj, times)
+        translations, rotations, world_scale = self._decompose_matrices(world, maya_compat=maya_compat)
+
+        # Use local scale (from the object's own matrix), not world scale
+        scales = local_scale if local_scale is not None else world_scale
+        return translations, rotations, scales
+
+    def get_transforms_over_range(self, obj, times):
+        """Get a transform track with both rotation decomposition modes
+
+        Samples the world matrices once and decomposes them twice.
+
+        Args:
+            obj: Alembic object (should be IXform or have parent IXform)
+            times: Times in seconds to sample
+
+        Returns:
+            tuple: (translations, rotations_ae, rotations_maya, scales) as
+                   (N, 3) float64 arrays
+        """
+        world, local_scale = self._world_matrix_track(obj, times)
+        translations, rotations_ae, world_scale = self._decompose_matrices(world)
+        rotations_maya = self._decompose_matrices(world, maya_compat=True)[1]
+
+        scales = local_scale if local_scale is not None else world_scale
+        return translations, rotations_ae, rotations_maya, scales
+
+    def is_transform_constant(self, obj):
+        """Check whether an object's world transform can't change over time
+
+        True when no xform in its ancestry has more than one sample.
+
+        Args:
+            obj: Alembic object
+
+        Returns:
+            bool: True if the world transform is the same at every time
+        """
+        current = obj
+        while current:
+            if self._kind_of(current) == KIND_XFORM and self._xform_num_samples(current) > 1:
+                return False
+
+            parent = current.getParent()
+            if parent and parent.getName() != "ABC":
+                current = parent
+            else:
+                break
+        return True
+
+    def _world_matrix_track(self, obj, times):
+        """Sample and accumulate an object's world matrices over many times
+
+        Args:
+            obj: Alembic object
+            times: Times in seconds to sample
+
+        Returns:
+            tuple: ((N, 4, 4) world matrices, (N, 3) local scales or None)
+        """
+        key = (self._full_name(obj), tuple(times))
+        if self._world_track_cache is not None and self._world_track_cache[0] == key:
+            return self._world_track_cache[1]
+
+        # One (N, 4, 4) stack of local matrices per xform, object first
+        tracks = []
+        local_scale = None
+        current = obj
+
+        while current:
+            if self._kind_of(current) == KIND_XFORM:
+                schema = IXform(current, WrapExistingFlag.kWrapExisting).getSchema()
+                track = np.array(
+                    [schema.getValue(_sample_selector(t)).getMatrix() for t in times],
+                    dtype=np.float64
+                ).reshape(-1, 4, 4)
+                if current is obj:
+                    # Local scale from this object's own matrices (SynthEyes stores it there)
+                    basis = track[:, :3, :3]
+                    local_scale = np.sqrt((basis * basis).sum(axis=2))
+                tracks.append(track)
+
+            parent = current.getParent()
+            if parent and parent.getName() != "ABC":
+                current = parent
+            else:
+                break
+
+        # Same product order as get_transform_at_time, batched over frames
+        if tracks:
+            world = _chain_product(tracks[::-1])
+        else:
+            world = np.broadcast_to(_IDENTITY, (len(times), 4, 4))
+
+        result = (world, local_scale)
+        self._world_track_cache = (key, result)
+        return result
+
+    def _sampled_local_matrix(self, obj, time_seconds, name=None):
+        """Get an IXform's local matrix at a time, reusing recent samples
+
+        Every object sampled at a time re-reads all of its ancestors, and
+        keyframe extraction samples each time twice (AE and Maya rotation
+        modes), so most reads repeat. Oldest entries are evicted first.
+
+        Args:
+            obj: Alembic object matching IXform
+            time_seconds: Time in seconds to sample
+            name: obj.getFullName(), if the caller already has it
+
+        Returns:
+            np.ndarray: (4, 4) float64 local transform matrix (row-major)
+        """
+        key = (name or obj.getFullName(), time_seconds)
+        matrix = self._xform_sample_cache.get(key)
+        if matrix is None:
+            schema = IXform(obj, WrapExistingFlag.kWrapExisting).getSchema()
+            # Convert once here so accumulation runs on NumPy, not imath bindings
+            matrix = np.array(schema.getValue(_sample_selector(time_seconds)).getMatrix(),
+                              dtype=np.float64)
+            if len(self._xform_sample_cache) >= self.XFORM_SAMPLE_CACHE_SIZE:
+                # Dicts keep insertion order, so the first key is the oldest
+                del self._xform_sample_cache[next(iter(self._xform_sample_cache))]
+            self._xform_sample_cache[key] = matrix
+        return matrix
+
     def get_mesh_data_at_time(self, mesh_obj, time_seconds):
         """Get mesh geometry data at a specific time
 
@@ -220,19 +541,19 @@ class AlembicReader(BaseReader):
 
         Returns:
             dict: Mesh data with keys:
-                - 'positions': Vertex positions as list of [x, y, z]
-                - 'indices': Face vertex indices
-                - 'counts': Face vertex counts
+                - 'positions': (N, 3) float32 ndarray of vertex positions
+                - 'indices': int32 ndarray of face vertex indices
+                - 'counts': int32 ndarray of face vertex counts
         """
         poly = IPolyMesh(mesh_obj, WrapExistingFlag.kWrapExisting)
         schema = poly.getSchema()
 
-        sample_sel = ISampleSelector(time_seconds)
+        sample_sel = _sample_selector(time_seconds)
         sample = schema.getValue(sample_sel)
 
-        positions = sample.getPositions()
-        indices = sample.getFaceIndices()
-        counts = sample.getFaceCounts()
+        positions = _imath_to_numpy(sample.getPositions(), np.float32, 3)
+        indices = _imath_to_numpy(sample.getFaceIndices(), np.int32)
+        counts = _imath_to_numpy(sample.getFaceCounts(), np.int32)
 
         return {
             'positions': positions,
@@ -257,7 +578,7 @@ class AlembicReader(BaseReader):
         schema = camera.getSchema()
 
         if time_seconds is not None:
-            sample_sel = ISampleSelector(time_seconds)
+            sample_sel = _sample_selector(time_seconds)
             sample = schema.getValue(sample_sel)
         else:
             sample = schema.getValue()
@@ -268,63 +589,17 @@ class AlembicReader(BaseReader):
             'v_aperture': sample.getVerticalAperture()
         }
 
+    # Camera property names that may hold the source footage path
+    FOOTAGE_PROPERTY_NAMES = ('footagePath', 'footage', 'sourceFile', 'imagePath',
+                              'videoFile', 'mediaPath', 'sourceImage', 'backgroundImage')
+
     def extract_footage_path(self):
         """Extract footage file path from Alembic camera metadata
 
         Returns:
             str: Footage file path, or None if not found
         """
-        try:
-            # Search for camera objects to extract footage path from metadata
-            def find_camera(obj):
-                if ICamera.matches(obj.getHeader()):
-                    return obj
-                for child in obj.children:
-                    cam = find_camera(child)
-                    if cam:
-                        return cam
-                return None
-
-            camera_obj = find_camera(self.top)
-            if camera_obj:
-                camera = ICamera(camera_obj, WrapExistingFlag.kWrapExisting)
-                schema = camera.getSchema()
-
-                # Check for arbGeomParams (custom properties)
-                if schema.getArbGeomParams():
-                    arb_params = schema.getArbGeomParams()
-                    # Try common property names for footage file paths
-                    for prop_name in ['footagePath', 'footage', 'sourceFile', 'imagePath',
-                                     'videoFile', 'mediaPath', 'sourceImage', 'backgroundImage']:
-                        try:
-                            if arb_params.getPropertyHeader(prop_name):
-                                prop = arb_params.getProperty(prop_name)
-                                if prop.valid():
-                                    val = prop.getValue()
-                                    if val and isinstance(val, str):
-                                        return val
-                        except:
-                            pass
-
-                # Check user properties
-                if schema.getUserProperties():
-                    user_props = schema.getUserProperties()
-                    for prop_name in ['footagePath', 'footage', 'sourceFile', 'imagePath',
-                                     'videoFile', 'mediaPath', 'sourceImage', 'backgroundImage']:
-                        try:
-                            if user_props.getPropertyHeader(prop_name):
-                                prop = user_props.getProperty(prop_name)
-                                if prop.valid():
-                                    val = prop.getValue()
-                                    if val and isinstance(val, str):
-                                        return val
-                        except:
-                            pass
-
-        except Exception:
-            pass
-
-        return None
+        return self._load_camera_metadata()['footage']
 
     def extract_render_resolution(self):
         """Extract render resolution from Alembic camera metadata
@@ -332,35 +607,73 @@ class AlembicReader(BaseReader):
         Returns:
             tuple: (width, height) in pixels, or (1920, 1080) as fallback
         """
+        return self._load_camera_metadata()['resolution']
+
+    def _load_camera_metadata(self):
+        """Read footage path, resolution and aperture from the first camera (cached)
+
+        Both public accessors are served from one read of the camera schema;
+        the camera itself comes from the cached traversal.
+
+        Returns:
+            dict: 'footage' (str or None), 'resolution' ((width, height)),
+                  'aperture' ((h_cm, v_cm) or None)
+        """
+        if self._camera_metadata_cache is not None:
+            return self._camera_metadata_cache
+
+        # Use standard HD resolution as default
+        metadata = {'footage': None, 'resolution': (1920, 1080), 'aperture': None}
+
         try:
-            # Search for camera to extract resolution
-            def find_camera(obj):
-                if ICamera.matches(obj.getHeader()):
-                    return obj
-                for child in obj.children:
-                    cam = find_camera(child)
-                    if cam:
-                        return cam
-                return None
-
-            camera_obj = find_camera(self.top)
-            if camera_obj:
-                camera = ICamera(camera_obj, WrapExistingFlag.kWrapExisting)
+            cameras = self.get_cameras()
+            if cameras:
+                camera = ICamera(cameras[0], WrapExistingFlag.kWrapExisting)
                 schema = camera.getSchema()
-                cam_sample = schema.getValue()
 
                 # Get aperture (film back dimensions)
-                h_aperture_cm = cam_sample.getHorizontalAperture()
-                v_aperture_cm = cam_sample.getVerticalAperture()
+                cam_sample = schema.getValue()
+                metadata['aperture'] = (cam_sample.getHorizontalAperture(),
+                                        cam_sample.getVerticalAperture())
 
-                # Use standard HD resolution as default
-                return (1920, 1080)
+                # Check arbGeomParams (custom properties), then user properties
+                for params in (schema.getArbGeomParams(), schema.getUserProperties()):
+                    footage = self._find_footage_property(params)
+                    if footage:
+                        metadata['footage'] = footage
+                        break
 
         except Exception:
             pass
 
-        # Fallback to HD resolution
-        return (1920, 1080)
+        self._camera_metadata_cache = metadata
+        return metadata
+
+    def _find_footage_property(self, params):
+        """Return the first string-valued footage property in a compound, if any
+
+        Args:
+            params: ICompoundProperty (may be invalid/empty)
+
+        Returns:
+            str: Footage path, or None
+        """
+        if not params:
+            return None
+
+        # Try common property names for footage file paths
+        for prop_name in self.FOOTAGE_PROPERTY_NAMES:
+            try:
+                if params.getPropertyHeader(prop_name):
+                    prop = params.getProperty(prop_name)
+                    if prop.valid():
+                        val = prop.getValue()
+                        if val and isinstance(val, str):
+                            return val
+            except:
+                pass
+
+        return None
 
     def _decompose_matrix(self, matrix, maya_compat=False):
         """Decompose a 4x4 matrix into translation, rotation (XYZ Euler), and scale
@@ -380,63 +693,105 @@ class AlembicReader(BaseReader):
                 - rotation: [rx, ry, rz] in degrees (XYZ Euler)
                 - scale: [sx, sy, sz]
         """
-        m = np.array(matrix)
+        m = np.asarray(matrix, dtype=np.float64)
 
         # Extract translation (row 3 contains translation in row-major format)
-        translation = [m[3][0], m[3][1], m[3][2]]
+        translation = m[3, :3].tolist()
 
         # Extract scale from row lengths (row-major: rows are transformed basis vectors)
-        sx = np.linalg.norm([m[0][0], m[0][1], m[0][2]])
-        sy = np.linalg.norm([m[1][0], m[1][1], m[1][2]])
-        sz = np.linalg.norm([m[2][0], m[2][1], m[2][2]])
-        scale = [sx, sy, sz]
-
-        # Build normalized rotation matrix
-        rot = np.zeros((3, 3))
-        rot[0][0] = m[0][0] / sx if sx > 0 else m[0][0]
-        rot[0][1] = m[0][1] / sx if sx > 0 else m[0][1]
-        rot[0][2] = m[0][2] / sx if sx > 0 else m[0][2]
-        rot[1][0] = m[1][0] / sy if sy > 0 else m[1][0]
-        rot[1][1] = m[1][1] / sy if sy > 0 else m[1][1]
-        rot[1][2] = m[1][2] / sy if sy > 0 else m[1][2]
-        rot[2][0] = m[2][0] / sz if sz > 0 else m[2][0]
-        rot[2][1] = m[2][1] / sz if sz > 0 else m[2][1]
-        rot[2][2] = m[2][2] / sz if sz > 0 else m[2][2]
+        basis = m[:3, :3]
+        scales = np.sqrt((basis * basis).sum(axis=1))
+        scale = scales.tolist()
+
+        # Build normalized rotation matrix (zero-length rows are left as-is),
+        # then unpack to Python floats - math.* is much faster than np.* on scalars.
+        # Most transforms carry unit scale, where the basis already is the rotation.
+        # The tolerance is far below float noise in the resulting angles.
+        sx, sy, sz = scale
+        if abs(sx - 1.0) < 1e-9 and abs(sy - 1.0) < 1e-9 and abs(sz - 1.0) < 1e-9:
+            rot = basis
+        else:
+            rot = basis / np.where(scales > 0, scales, 1.0)[:, None]
+        (r00, r01, r02), (r10, r11, r12), (r20, r21, r22) = rot.tolist()
 
         # Extract XYZ Euler angles from rotation matrix
         if maya_compat:
             # Row-major decomposition for Maya/USD compatibility
-            cy = np.sqrt(rot[0][0]**2 + rot[0][1]**2)
+            cy = math.sqrt(r00 * r00 + r01 * r01)
 
             if cy > 1e-6:
                 # Normal case
-                x = np.arctan2(rot[1][2], rot[2][2])
-                y = np.arctan2(-rot[0][2], cy)
-                z = np.arctan2(-rot[0][1], rot[0][0])  # Negated for correct sign
+                x = math.atan2(r12, r22)
+                y = math.atan2(-r02, cy)
+                z = math.atan2(-r01, r00)  # Negated for correct sign
             else:
                 # Gimbal lock case
-                x = np.arctan2(-rot[2][1], rot[1][1])
-                y = np.arctan2(-rot[0][2], cy)
-                z = 0
+                x = math.atan2(-r21, r11)
+                y = math.atan2(-r02, cy)
+                z = 0.0
         else:
             # Column-major decomposition for After Effects compatibility
-            sy_test = np.sqrt(rot[0][0]**2 + rot[1][0]**2)
+            sy_test = math.sqrt(r00 * r00 + r10 * r10)
 
             if sy_test > 1e-6:
                 # Normal case
-                x = np.arctan2(rot[2][1], rot[2][2])
-                y = np.arctan2(-rot[2][0], sy_test)
-                z = np.arctan2(rot[1][0], rot[0][0])
+                x = math.atan2(r21, r22)
+                y = math.atan2(-r20, sy_test)
+                z = math.atan2(r10, r00)
             else:
                 # Gimbal lock case
-                x = np.arctan2(-rot[1][2], rot[1][1])
-                y = np.arctan2(-rot[2][0], sy_test)
-                z = 0
+                x = math.atan2(-r12, r11)
+                y = math.atan2(-r20, sy_test)
+                z = 0.0
 
-        rotation = [np.degrees(x), np.degrees(y), np.degrees(z)]
+        rotation = [math.degrees(x), math.degrees(y), math.degrees(z)]
 
         return translation, rotation, scale
 
+    def _decompose_matrices(self, matrices, maya_compat=False):
+        """Decompose stacked 4x4 matrices; vectorized form of _decompose_matrix
+
+        Args:
+            matrices: (N, 4, 4) row-major transformation matrices
+            maya_compat: If True, use Maya-compatible row-major rotation extraction
+
+        Returns:
+            tuple: (translations, rotations, scales) as (N, 3) float64 arrays,
+                   rotations in degrees (XYZ Euler)
+        """
+        m = np.asarray(matrices, dtype=np.float64)
+        translations = m[:, 3, :3]
+
+        # Computed in float64 with _decompose_matrix's tolerances, so both
+        # paths pick the same Euler branch near gimbal lock
+        basis = m[:, :3, :3]
+        scales = np.sqrt((basis * basis).sum(axis=2))
+        # Unit-scale tracks (cameras, most locators) skip normalization
+        # entirely; checked once per track rather than per frame
+        if np.all(np.abs(scales - 1.0) < 1e-9):
+            rot = basis
+        else:
+            rot = basis / np.where(scales > 0, scales, 1.0)[:, :, None]
+
+        # Normal and gimbal-lock branches are both evaluated and selected per frame
+        if maya_compat:
+            cy = np.sqrt(rot[:, 0, 0] ** 2 + rot[:, 0, 1] ** 2)
+            normal = cy > 1e-6
+            x = np.where(normal, np.arctan2(rot[:, 1, 2], rot[:, 2, 2]),
+                         np.arctan2(-rot[:, 2, 1], rot[:, 1, 1]))
+            y = np.arctan2(-rot[:, 0, 2], cy)
+            z = np.where(normal, np.arctan2(-rot[:, 0, 1], rot[:, 0, 0]), 0.0)
+        else:
+            sy_test = np.sqrt(rot[:, 0, 0] ** 2 + rot[:, 1, 0] ** 2)
+            normal = sy_test > 1e-6
+            x = np.where(normal, np.arctan2(rot[:, 2, 1], rot[:, 2, 2]),
+                         np.arctan2(-rot[:, 1, 2], rot[:, 1, 1]))
+            y = np.arctan2(-rot[:, 2, 0], sy_test)
+            z = np.where(normal, np.arctan2(rot[:, 1, 0], rot[:, 0, 0]), 0.0)
+
+        rotations = np.degrees(np.stack([x, y, z], axis=1))
+        return translations, rotations, scales
+
     def _get_full_path(self, obj):
         """Get full hierarchy path for an Alembic object
 
@@ -446,7 +801,19 @@ class AlembicReader(BaseReader):
         Returns:
             str: Full path like "/World/Camera/CameraShape"
         """
-        return obj.getFullName()
+        return self._full_name(obj)
+
+    def _full_name(self, obj):
+        """Get an object's full name, from the traversal records when possible
+
+        Args:
+            obj: Alembic object
+
+        Returns:
+            str: Full name; wrappers not seen during traversal ask the bindings
+        """
+        name = self._full_name_by_id.get(id(obj))
+        return name if name is not None else obj.getFullName()
 
     def _is_organizational_group(self, obj):
         """Check if transform is just an organizational container
@@ -459,23 +826,57 @@ class AlembicReader(BaseReader):
         Returns:
             bool: True if object is organizational only
         """
-        if not IXform.matches(obj.getHeader()):
+        name = self._full_name(obj)
+        result = self._is_org_by_name.get(name)
+        if result is None:
+            result = self._is_org_by_name[name] = self._compute_is_organizational(obj, name)
+        return result
+
+    def _compute_is_organizational(self, obj, name):
+        """Uncached body of _is_organizational_group
+
+        Args:
+            obj: Alembic object
+            name: Its full name
+
+        Returns:
+            bool: True if object is organizational only
+        """
+        if self._kind_of(obj, name) != KIND_XFORM:
             return False
 
-        xform = IXform(obj, WrapExistingFlag.kWrapExisting)
-        schema = xform.getSchema()
+        # Children first: they come from the traversal records, so groups
+        # holding a shape are rejected without touching the xform schema
+        self.get_all_objects()
+        index = self._index_by_name.get(name)
+        if index is not None:
+            child_kinds = self._kinds[self._child_indices[index]]
+            if not len(child_kinds) or np.isin(child_kinds, (KIND_CAMERA, KIND_MESH)).any():
+                return False
+        else:
+            children = list(obj.children)
+            if not children:
+                return False
+            for child in children:
+                if self._kind_of(child) in (KIND_CAMERA, KIND_MESH):
+                    return False
+
+        return self._xform_num_samples(obj, name) <= 1
 
-        num_samples = schema.getNumSamples()
-        if num_samples <= 1:
-            has_direct_shape = False
-            has_children = False
-            for child in obj.children:
-                has_children = True
-                if ICamera.matches(child.getHeader()) or IPolyMesh.matches(child.getHeader()):
-                    has_direct_shape = True
-                    break
+    def _xform_num_samples(self, obj, name=None):
+        """Get an IXform's sample count, wrapping its schema only on first sight
 
-            if has_children and not has_direct_shape:
-                return True
+        Args:
+            obj: Alembic object matching IXform
+            name: obj.getFullName(), if the caller already has it
 
-        return False
+        Returns:
+            int: Number of xform samples
+        """
+        if name is None:
+            name = self._full_name(obj)
+        count = self._num_samples_by_name.get(name)
+        if count is None:
+            schema = IXform(obj, WrapExistingFlag.kWrapExisting).getSchema()
+            count = self._num_samples_by_name[name] = schema.getNumSamples()
+        return count
@@ -4,9 +4,47 @@ Base Reader Module
 Abstract interface for reading 3D scene files (Alembic, USD, etc.)
 """
 
+import hashlib
+import os
+import pickle
 from abc import ABC, abstractmethod
+from functools import partial
 from pathlib import Path
-from typing import List, Dict, Tuple, Any, Optional
+from typing import List, Dict, Tuple, Any, Optional, Iterator
+
+import numpy as np
+
+from core.animation_detector import AnimationDetector
+from core.scene_data import (
+    SceneData, SceneMetadata, CameraData, MeshData, TransformData, KeyframeTrack,
+    CameraProperties, MeshGeometry, AnimationType, AnimationCategories
+)
+
+
+# Default location for the opt-in SceneData cache (see BaseReader.scene_cache_dir)
+DEFAULT_SCENE_CACHE_DIR = Path.home() / '.cache' / 'abcConverter'
+
+
+def _float3(value) -> Tuple[float, float, float]:
+    """Normalize a vector-like value to a plain (x, y, z) float tuple
+
+    Unwraps the nested [[x, y, z]] form some readers return, so consumers of
+    Keyframe never need to special-case it.
+    """
+    if len(value) and isinstance(value[0], (list, tuple, np.ndarray)):
+        value = value[0]
+    return (float(value[0]), float(value[1]), float(value[2]))
+
+
+def _positions_array(positions) -> np.ndarray:
+    """Get vertex positions as an (N, 3) float32 array
+
+    Readers that already return ndarrays are passed through without a copy;
+    sequences of vectors are converted element-wise.
+    """
+    if isinstance(positions, np.ndarray):
+        return np.ascontiguousarray(positions, dtype=np.float32).reshape(-1, 3)
+    return np.array([(p[0], p[1], p[2]) for p in positions], dtype=np.float32).reshape(-1, 3)
 
 
 class BaseReader(ABC):
@@ -23,8 +61,26 @@ class BaseReader(ABC):
             file_path: Path to the scene file
         """
         self.file_path = Path(file_path)
+        # Resolved once; also identifies the file version for the scene cache
+        self._resolved_path = self.file_path.resolve()
+        try:
+            self._file_stat = self._resolved_path.stat()
+        except OSError:
+            self._file_stat = None
         self._objects_cache = None
         self._parent_map_cache = None
+        self._parent_name_map_cache = None
+        self._time_table = None  # ((fps, frame_count), frames, times) from _frame_times
+        # Constant tracks by (values, frame_count), shared by identical static objects
+        self._constant_tracks = {}
+        # When True, vertex-animated meshes get a loader that reads frames on
+        # demand instead of holding every frame in memory. The reader must
+        # then stay open until exporters have consumed the SceneData.
+        self.stream_vertex_positions = False
+        # Directory for pickled SceneData keyed by the source file's mtime and
+        # size plus the sampling parameters (normally DEFAULT_SCENE_CACHE_DIR);
+        # None disables the cache
+        self.scene_cache_dir: Optional[Path] = None
 
     @abstractmethod
     def get_format_name(self) -> str:
@@ -76,6 +132,19 @@ class BaseReader(ABC):
         """
         pass
 
+    def get_parent_name_map(self) -> Dict[str, str]:
+        """Build child name -> parent name map (cached)
+
+        Returns:
+            dict: Mapping of child name -> parent name
+        """
+        if self._parent_name_map_cache is None:
+            self._parent_name_map_cache = {
+                child_name: parent.getName()
+                for child_name, parent in self.get_parent_map().items()
+            }
+        return self._parent_name_map_cache
+
     @abstractmethod
     def detect_frame_count(self, fps: int = 24) -> int:
         """Auto-detect frame count from file time sampling
@@ -106,6 +175,62 @@ class BaseReader(ABC):
         """
         pass
 
+    def get_transform_track(self, obj: Any, times: List[float],
+                            maya_compat: bool = False) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get transform data for a whole sequence of times
+
+        The default samples get_transform_at_time once per time; readers that
+        can sample and decompose a full track at once override this.
+
+        Args:
+            obj: Scene object
+            times: Times in seconds to sample
+            maya_compat: If True, use Maya-compatible rotation decomposition
+
+        Returns:
+            tuple: (translations, rotations, scales) as (N, 3) float64 arrays,
+                   same conventions as get_transform_at_time
+        """
+        samples = [self.get_transform_at_time(obj, t, maya_compat=maya_compat) for t in times]
+        return tuple(
+            np.array([_float3(sample[channel]) for sample in samples], dtype=np.float64).reshape(-1, 3)
+            for channel in range(3)
+        )
+
+    def get_transforms_over_range(self, obj: Any, times: List[float]
+                                  ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Get a transform track with both rotation decomposition modes
+
+        The default builds it from two get_transform_track calls; readers
+        that can decompose each sampled matrix twice override this.
+
+        Args:
+            obj: Scene object
+            times: Times in seconds to sample
+
+        Returns:
+            tuple: (translations, rotations_ae, rotations_maya, scales) as
+                   (N, 3) float64 arrays
+        """
+        positions, rotations_ae, scales = self.get_transform_track(obj, times, maya_compat=False)
+        _, rotations_maya, _ = self.get_transform_track(obj, times, maya_compat=True)
+        return positions, rotations_ae, rotations_maya, scales
+
+    def is_transform_constant(self, obj: Any) -> bool:
+        """Check whether an object's world transform can't change over time
+
+        Used to sample static objects once instead of every frame, so it must
+        only return True when that is certain from the file. The default
+        makes no such claim.
+
+        Args:
+            obj: Scene object
+
+        Returns:
+            bool: True if the world transform is the same at every time
+        """
+        return False
+
     @abstractmethod
     def get_mesh_data_at_time(self, mesh_obj: Any, time_seconds: float) -> Dict[str, Any]:
         """Get mesh geometry data at a specific time
@@ -179,13 +304,19 @@ class BaseReader(ABC):
         """
         return False
 
-    def extract_scene_data(self, fps: int, frame_count: int) -> 'SceneData':
+    # Bump when extraction output changes so stale scene caches are ignored
+    SCENE_CACHE_VERSION = 1
+
+    def extract_scene_data(self, fps: int, frame_count: int) -> SceneData:
         """Extract complete scene data with all animation pre-sampled
 
         This is the main extraction method that creates a format-agnostic
         SceneData structure. All animation is sampled for all frames with
         both AE and Maya rotation decompositions.
 
+        When scene_cache_dir is set, a previous extraction of the unchanged
+        file with the same parameters is loaded from disk instead.
+
         Args:
             fps: Frames per second for time calculation
             frame_count: Total number of frames to extract
@@ -193,18 +324,137 @@ class BaseReader(ABC):
         Returns:
             SceneData: Complete scene data with all animation
         """
-        from core.scene_data import (
-            SceneData, SceneMetadata, CameraData, MeshData, TransformData,
-            Keyframe, CameraProperties, MeshGeometry, AnimationType, AnimationCategories
+        cache_path = self._scene_cache_path(fps, frame_count)
+        if cache_path is not None and cache_path.exists():
+            try:
+                with open(cache_path, 'rb') as f:
+                    return pickle.load(f)
+            except Exception:
+                pass  # Unreadable or outdated cache - extract again
+
+        self.prefetch()
+        try:
+            scene_data = self._extract_scene_data(fps, frame_count)
+        finally:
+            # Samples are only reused within one extraction
+            self.reset_sampling_cache()
+        if cache_path is not None:
+            self._write_scene_cache(cache_path, scene_data)
+        return scene_data
+
+    def reset_sampling_cache(self):
+        """Drop any transform samples cached while extracting (no-op by default)"""
+
+    def prefetch(self):
+        """Ask the OS to start reading the source file into the page cache
+
+        The native libraries do their own reads, so this only hints that the
+        whole file will be needed soon (and read front to back) so cold-cache
+        reads overlap with the analysis steps. No-op where posix_fadvise is
+        unavailable (Windows, macOS) or the hint fails.
+        """
+        if not hasattr(os, 'posix_fadvise'):
+            return
+        try:
+            fd = os.open(self._resolved_path, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    def _scene_cache_path(self, fps: int, frame_count: int) -> Optional[Path]:
+        """Get the cache file for this source file and sampling parameters
+
+        Args:
+            fps: Frames per second
+            frame_count: Total number of frames
+
+        Returns:
+            Path: Cache file path, or None if caching is disabled or unavailable
+        """
+        # Streamed vertex positions read from the open file, so can't be cached
+        if self.scene_cache_dir is None or self.stream_vertex_positions or self._file_stat is None:
+            return None
+        source = self._resolved_path
+        stat = self._file_stat
+        key = repr((str(source), stat.st_mtime_ns, stat.st_size, fps, frame_count,
+                    self.get_format_name(), self.SCENE_CACHE_VERSION))
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+        return Path(self.scene_cache_dir) / f"{source.stem}.{digest}.scene.pickle"
+
+    def _write_scene_cache(self, cache_path: Path, scene_data: SceneData):
+        """Pickle scene data to the cache, replacing any previous file atomically
+
+        Failures are ignored: the cache only ever saves work.
+
+        Args:
+            cache_path: Cache file path from _scene_cache_path
+            scene_data: Extracted scene data
+        """
+        tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(scene_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except Exception:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
+    def _extract_scene_data(self, fps: int, frame_count: int) -> SceneData:
+        """Sample the scene into SceneData (uncached body of extract_scene_data)
+
+        Args:
+            fps: Frames per second for time calculation
+            frame_count: Total number of frames to extract
+
+        Returns:
+            SceneData: Complete scene data with all animation
+        """
+        parts = {SceneMetadata: None, CameraData: [], MeshData: [], TransformData: [],
+                 AnimationCategories: None}
+        for part in self.iter_scene_data(fps, frame_count):
+            if isinstance(parts[type(part)], list):
+                parts[type(part)].append(part)
+            else:
+                parts[type(part)] = part
+
+        return SceneData(
+            metadata=parts[SceneMetadata],
+            cameras=parts[CameraData],
+            meshes=parts[MeshData],
+            transforms=parts[TransformData],
+            animation_categories=parts[AnimationCategories]
         )
-        from core.animation_detector import AnimationDetector
 
+    def iter_scene_data(self, fps: int, frame_count: int) -> Iterator[Any]:
+        """Extract scene data one piece at a time
+
+        Yields the SceneMetadata first, then each CameraData, MeshData and
+        TransformData as soon as it is built, and the AnimationCategories
+        last. Consumers that write objects as they arrive only hold one
+        object's animation (and vertex positions) in memory at a time.
+
+        Args:
+            fps: Frames per second for time calculation
+            frame_count: Total number of frames to extract
+
+        Yields:
+            SceneMetadata, CameraData, MeshData, TransformData, then AnimationCategories
+        """
         # Step 1: Analyze animation types
         detector = AnimationDetector()
         animation_analysis = detector.analyze_scene(self, frame_count, fps)
 
-        # Step 2: Build parent map once
-        parent_map = self.get_parent_map()
+        # Step 2: Build parent name map once
+        parent_names = self.get_parent_name_map()
 
         # Step 3: Extract metadata
         width, height = self.extract_render_resolution()
@@ -214,20 +464,22 @@ class BaseReader(ABC):
             fps=fps,
             frame_count=frame_count,
             footage_path=self.extract_footage_path(),
-            source_file_path=str(self.file_path.resolve()),
+            source_file_path=str(self._resolved_path),
             source_format_name=self.get_format_name()
         )
+        yield metadata
+
+        # Names Step 6 must skip, filled in as cameras and meshes are emitted
+        processed = set()
 
         # Step 4: Extract cameras with animation
-        cameras = []
+        camera_properties = {}
         for cam_obj in self.get_cameras():
             cam_name = cam_obj.getName()
-            parent = parent_map.get(cam_name)
-
             # Determine parent_name for display purposes
             # Only use parent_name if the camera follows Alembic convention (name ends with "Shape")
-            if cam_name.endswith('Shape') and parent:
-                parent_name = parent.getName()
+            if cam_name.endswith('Shape'):
+                parent_name = parent_names.get(cam_name)
             else:
                 parent_name = None
 
@@ -237,37 +489,44 @@ class BaseReader(ABC):
 
             # Get camera properties (first frame)
             props = self.get_camera_properties(cam_obj, 1.0 / fps)
-            cam_props = CameraProperties(
-                focal_length=props['focal_length'],
-                h_aperture=props['h_aperture'],
-                v_aperture=props['v_aperture']
-            )
+            # Cameras with identical optics share one (frozen) properties object
+            props_key = (props['focal_length'], props['h_aperture'], props['v_aperture'])
+            cam_props = camera_properties.get(props_key)
+            if cam_props is None:
+                cam_props = camera_properties[props_key] = CameraProperties(
+                    focal_length=props['focal_length'],
+                    h_aperture=props['h_aperture'],
+                    v_aperture=props['v_aperture']
+                )
 
             # Extract keyframes for all frames (both rotation modes)
             keyframes = self._extract_keyframes(transform_obj, fps, frame_count)
 
-            cameras.append(CameraData(
+            camera = CameraData(
                 name=cam_name,
                 parent_name=parent_name,
                 full_path=self._get_full_path(cam_obj),
                 properties=cam_props,
                 keyframes=keyframes
-            ))
+            )
+            self._mark_hierarchy_processed(processed, camera)
+            yield camera
 
         # Step 5: Extract meshes with animation
-        meshes = []
-        vertex_animated_set = set(animation_analysis['vertex_animated'])
-        transform_only_set = set(animation_analysis['transform_only'])
+        # Mesh names per animation type, for the categories (Step 7)
+        category_names = {anim_type: [] for anim_type in AnimationType}
+        vertex_animated_set = animation_analysis['vertex_animated']
+        transform_only_set = animation_analysis['transform_only']
+        first_frame_geometry = animation_analysis.get('first_frame_geometry', {})
+        topology_cache = {}
 
         for mesh_obj in self.get_meshes():
             mesh_name = mesh_obj.getName()
-            parent = parent_map.get(mesh_name)
-
             # Determine parent_name for display purposes
             # Only use parent_name if the mesh follows Alembic convention (name ends with "Shape")
             # For USD meshes, the mesh name itself is the proper display name
-            if mesh_name.endswith('Shape') and parent:
-                parent_name = parent.getName()
+            if mesh_name.endswith('Shape'):
+                parent_name = parent_names.get(mesh_name)
             else:
                 parent_name = None
 
@@ -291,12 +550,19 @@ class BaseReader(ABC):
             else:
                 anim_type = AnimationType.STATIC
 
-            # Get first frame geometry
-            mesh_data = self.get_mesh_data_at_time(mesh_obj, 1.0 / fps)
+            # Get first frame geometry (already sampled by the animation detector)
+            mesh_data = first_frame_geometry.get(mesh_name)
+            if mesh_data is None:
+                mesh_data = self.get_mesh_data_at_time(mesh_obj, 1.0 / fps)
+            indices, counts = self._intern_topology(
+                topology_cache,
+                np.ascontiguousarray(mesh_data['indices'], dtype=np.int32).reshape(-1),
+                np.ascontiguousarray(mesh_data['counts'], dtype=np.int32).reshape(-1)
+            )
             geometry = MeshGeometry(
-                positions=[(p[0], p[1], p[2]) for p in mesh_data['positions']],
-                indices=list(mesh_data['indices']),
-                counts=list(mesh_data['counts'])
+                positions=_positions_array(mesh_data['positions']),
+                indices=indices,
+                counts=counts
             )
 
             # Extract transform keyframes
@@ -304,16 +570,33 @@ class BaseReader(ABC):
 
             # Extract vertex positions per frame if vertex-animated (raw, not blend shape)
             vertex_positions = None
-            if anim_type == AnimationType.VERTEX_ANIMATED:
+            vertex_stack = None
+            vertex_frames = None
+            vertex_loader = None
+            if anim_type == AnimationType.VERTEX_ANIMATED and self.stream_vertex_positions:
+                vertex_loader = partial(self._iter_vertex_positions, mesh_obj, fps, frame_count)
+            elif anim_type == AnimationType.VERTEX_ANIMATED:
                 vertex_positions = {}
-                for frame in range(1, frame_count + 1):
-                    time_seconds = frame / fps
-                    frame_mesh_data = self.get_mesh_data_at_time(mesh_obj, time_seconds)
-                    vertex_positions[frame] = [
-                        (p[0], p[1], p[2]) for p in frame_mesh_data['positions']
-                    ]
-
-            meshes.append(MeshData(
+                # Fill one (F, V, 3) buffer while the vertex count stays constant;
+                # the per-frame dict entries are views into it
+                vertex_count = len(geometry.positions)
+                vertex_stack = np.empty((frame_count, vertex_count, 3), dtype=np.float32)
+                # Frame 1 is the geometry already read above
+                if frame_count > 0:
+                    vertex_stack[0] = geometry.positions
+                    vertex_positions[1] = vertex_stack[0]
+                frames = self._iter_vertex_positions(mesh_obj, fps, frame_count, start_frame=2)
+                for index, (frame, positions) in enumerate(frames, start=1):
+                    if vertex_stack is not None and len(positions) == vertex_count:
+                        vertex_stack[index] = positions
+                        positions = vertex_stack[index]
+                    else:
+                        vertex_stack = None  # Topology changes over time - no stack
+                    vertex_positions[frame] = positions
+                if vertex_stack is not None:
+                    vertex_frames = np.arange(1, frame_count + 1, dtype=np.int32)
+
+            mesh = MeshData(
                 name=mesh_name,
                 parent_name=parent_name,
                 full_path=self._get_full_path(mesh_obj),
@@ -321,24 +604,16 @@ class BaseReader(ABC):
                 keyframes=keyframes,
                 geometry=geometry,
                 vertex_positions_per_frame=vertex_positions,
-                blend_shapes=blend_shapes
-            ))
+                blend_shapes=blend_shapes,
+                vertex_positions_stack=vertex_stack,
+                vertex_position_frames=vertex_frames,
+                vertex_positions_loader=vertex_loader
+            )
+            self._mark_hierarchy_processed(processed, mesh)
+            category_names[anim_type].append(mesh_name)
+            yield mesh
 
         # Step 6: Extract pure transforms (locators - no camera/mesh children)
-        transforms = []
-        processed = set(c.name for c in cameras) | set(m.name for m in meshes)
-        processed.update(c.parent_name for c in cameras if c.parent_name)
-        processed.update(m.parent_name for m in meshes if m.parent_name)
-
-        # Also exclude ALL ancestors of cameras/meshes (grandparents, etc.)
-        # This prevents exporting intermediate transforms that are part of camera/mesh hierarchies
-        all_items = list(cameras) + list(meshes)
-        for item in all_items:
-            parts = [p for p in item.full_path.split('/') if p]
-            # Add all path components except the last (the item itself)
-            for part in parts[:-1]:
-                processed.add(part)
-
         for xform_obj in self.get_transforms():
             xform_name = xform_obj.getName()
             if xform_name in processed:
@@ -346,65 +621,124 @@ class BaseReader(ABC):
             if self._is_organizational_group(xform_obj):
                 continue
 
-            parent = parent_map.get(xform_name)
-            parent_name = parent.getName() if parent else None
+            parent_name = parent_names.get(xform_name)
 
             keyframes = self._extract_keyframes(xform_obj, fps, frame_count)
-            transforms.append(TransformData(
+            yield TransformData(
                 name=xform_name,
                 parent_name=parent_name,
                 full_path=self._get_full_path(xform_obj),
                 keyframes=keyframes
-            ))
+            )
 
         # Step 7: Build animation categories (accounting for blend shapes)
-        blend_shape_names = [m.name for m in meshes if m.animation_type == AnimationType.BLEND_SHAPE]
-        vertex_animated_names = [m.name for m in meshes if m.animation_type == AnimationType.VERTEX_ANIMATED]
-        transform_only_names = [m.name for m in meshes if m.animation_type == AnimationType.TRANSFORM_ONLY]
-        static_names = [m.name for m in meshes if m.animation_type == AnimationType.STATIC]
-
-        categories = AnimationCategories(
-            vertex_animated=vertex_animated_names,
-            blend_shape=blend_shape_names,
-            transform_only=transform_only_names,
-            static=static_names
+        yield AnimationCategories(
+            vertex_animated=category_names[AnimationType.VERTEX_ANIMATED],
+            blend_shape=category_names[AnimationType.BLEND_SHAPE],
+            transform_only=category_names[AnimationType.TRANSFORM_ONLY],
+            static=category_names[AnimationType.STATIC]
         )
 
-        return SceneData(
-            metadata=metadata,
-            cameras=cameras,
-            meshes=meshes,
-            transforms=transforms,
-            animation_categories=categories
-        )
+    @staticmethod
+    def _intern_topology(cache: Dict[bytes, Tuple[np.ndarray, np.ndarray]],
+                         indices: np.ndarray, counts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Share one indices/counts pair between meshes with identical topology
 
-    def _extract_keyframes(self, obj: Any, fps: int, frame_count: int) -> List['Keyframe']:
-        """Extract keyframes with both rotation decomposition modes
+        Args:
+            cache: Extraction-local map of topology digest -> (indices, counts)
+            indices: int32 face vertex indices
+            counts: int32 face vertex counts
+
+        Returns:
+            tuple: (indices, counts), the cached arrays if an identical pair was seen
+        """
+        digest = hashlib.blake2b(counts.tobytes(), digest_size=16)
+        digest.update(indices.tobytes())
+        key = digest.digest()
+        cached = cache.get(key)
+        if (cached is not None and np.array_equal(cached[0], indices)
+                and np.array_equal(cached[1], counts)):
+            return cached
+        cache[key] = (indices, counts)
+        return indices, counts
+
+    @staticmethod
+    def _mark_hierarchy_processed(processed: set, item: Any):
+        """Add a camera/mesh and its hierarchy to the names Step 6 skips
+
+        Covers the item, its parent and ALL of its ancestors (grandparents,
+        etc.), so intermediate transforms that are part of camera/mesh
+        hierarchies aren't exported as locators.
 
         Args:
-            obj: Scene object to sample
+            processed: Set of names to skip
+            item: CameraData or MeshData just extracted
+        """
+        processed.add(item.name)
+        if item.parent_name:
+            processed.add(item.parent_name)
+        processed.update(item.full_path_parts[:-1])
+
+    def _iter_vertex_positions(self, mesh_obj: Any, fps: int, frame_count: int,
+                               start_frame: int = 1) -> Iterator[Tuple[int, np.ndarray]]:
+        """Read a mesh's vertex positions one frame at a time
+
+        Args:
+            mesh_obj: Mesh object to sample
             fps: Frames per second
             frame_count: Total number of frames
+            start_frame: First frame to read
 
-        Returns:
-            List[Keyframe]: Animation keyframes for all frames
+        Yields:
+            tuple: (frame, (N, 3) float32 positions)
         """
-        from core.scene_data import Keyframe
+        frames, times = self._frame_times(fps, frame_count)
+        for frame, time_seconds in zip(frames.tolist()[start_frame - 1:], times[start_frame - 1:]):
+            frame_mesh_data = self.get_mesh_data_at_time(mesh_obj, time_seconds)
+            yield frame, _positions_array(frame_mesh_data['positions'])
 
-        keyframes = []
-        for frame in range(1, frame_count + 1):
-            time_seconds = frame / fps
+    def _frame_times(self, fps: int, frame_count: int) -> Tuple[np.ndarray, List[float]]:
+        """Get frame numbers and their sample times, shared by every object
 
-            # Get both rotation modes
-            pos_ae, rot_ae, scale = self.get_transform_at_time(obj, time_seconds, maya_compat=False)
-            _, rot_maya, _ = self.get_transform_at_time(obj, time_seconds, maya_compat=True)
+        Args:
+            fps: Frames per second
+            frame_count: Total number of frames
 
-            keyframes.append(Keyframe(
-                frame=frame,
-                position=tuple(pos_ae),
-                rotation_ae=tuple(rot_ae),
-                rotation_maya=tuple(rot_maya),
-                scale=tuple(scale)
-            ))
+        Returns:
+            tuple: ((F,) int32 frames 1..frame_count, list of F times in seconds)
+        """
+        key = (fps, frame_count)
+        if self._time_table is None or self._time_table[0] != key:
+            frames = np.arange(1, frame_count + 1, dtype=np.int32)
+            frames.flags.writeable = False  # Shared by every KeyframeTrack
+            self._time_table = (key, frames, (frames / fps).tolist())
+        return self._time_table[1], self._time_table[2]
+
+    def _extract_keyframes(self, obj: Any, fps: int, frame_count: int) -> KeyframeTrack:
+        """Extract keyframes with both rotation decomposition modes
 
-        return keyframes
+        Args:
+            obj: Scene object to sample
+            fps: Frames per second
+            frame_count: Total number of frames
+
+        Returns:
+            KeyframeTrack: Packed animation keyframes for all frames
+        """
+        frames, times = self._frame_times(fps, frame_count)
+
+        if frame_count > 0 and self.is_transform_constant(obj):
+            # Sample once; every frame is a read-only view of the same row
+            tracks = self.get_transforms_over_range(obj, times[:1])
+            row = np.concatenate([track[0] for track in tracks])
+            # Identical static objects (set dressing) share one track
+            key = (tuple(row.tolist()), fps, frame_count)
+            track = self._constant_tracks.get(key)
+            if track is None:
+                track = self._constant_tracks[key] = KeyframeTrack(
+                    frames, np.broadcast_to(row, (frame_count, 12)))
+            return track
+
+        # Both rotation modes in one batched call, packed into one (F, 12) array
+        tracks = self.get_transforms_over_range(obj, times)
+        return KeyframeTrack(frames, np.concatenate(tracks, axis=1).reshape(frame_count, 12))
@@ -7,15 +7,166 @@ No Maya installation required - parses the text format directly.
 """
 
 import re
+import sys
 from pathlib import Path
-from typing import List, Dict, Tuple, Any, Optional
+from typing import List, Dict, Set, Tuple, Any, Optional, Iterable, Iterator
+
+import numpy as np
 
 from .base_reader import BaseReader
 
+# Node types shared by many nodes; interned so all their nodes share one
+# string (unknown types aren't, so odd files can't grow the intern table)
+_KNOWN_NODE_TYPES = frozenset({
+    'transform', 'mesh', 'camera', 'locator', 'joint', 'nurbsCurve',
+    'nurbsSurface', 'blendShape', 'groupId', 'groupParts', 'shadingEngine',
+    'materialInfo', 'lambert', 'blinn', 'phong', 'file', 'place2dTexture',
+    'animCurveTL', 'animCurveTA', 'animCurveTU',
+})
+
+# Curve attribute names tried per transform channel component; long names
+# (translateX, ...) are found through MayaScene's alias index
+_CHANNEL_ATTR_NAMES = {
+    base: tuple((f'{base}{axis}', f'{base}{axis.upper()}') for axis in 'xyz')
+    for base in 'trs'
+}
+
+# Transform channel attributes whose animation keeps a group from being
+# treated as organizational
+_XFORM_ATTR_SET = frozenset(
+    f'{short}{axis}' for short in 'trs' for axis in 'xyz'
+) | frozenset(
+    f'{long}{axis}' for long in ('translate', 'rotate', 'scale') for axis in 'XYZ'
+)
+_EMPTY_SET = frozenset()
+
+# Camera attributes read by get_camera_properties: (short name, long name,
+# default) for focal length and horizontal/vertical film aperture
+_CAMERA_ATTRS = (
+    ('fl', 'focalLength', 35.0),
+    ('hfa', 'horizontalFilmAperture', 1.417),
+    ('vfa', 'verticalFilmAperture', 0.945),
+)
+_INCH_TO_CM = 2.54
+
+# Patterns used per statement, compiled once
+_RE_FLOAT = re.compile(r'[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?')
+_RE_INT = re.compile(r'[-+]?\d+')
+_RE_TARGET_ITEM = re.compile(
+    r'\.(?:it|inputTarget)\[(\d+)\]\.(?:itg|inputTargetGroup)\[(\d+)\]'
+    r'\.(?:iti|inputTargetItem)\[(\d+)\]'
+    r'\.(?:(?P<points>ipt|inputPointsTarget)|(?P<components>ict|inputComponentsTarget))'
+)
+_RE_POINT_ARRAY = re.compile(r'-type\s+"pointArray"\s+(\d+)\s+')
+_RE_VTX_COMPONENT = re.compile(r'"vtx\[(\d+)(?::(\d+))?\]"')
+_RE_WEIGHT_ALIAS = re.compile(r'aliasAttr\s+"([^"]+)"\s+"\.w\[(\d+)\]"')
+_RE_VT_RANGE = re.compile(r'\.vt\[\d+:\d+\]')
+_RE_VRTS_RANGE = re.compile(r'\.vrts\[\d+:\d+\]')
+_RE_VT_INDEX = re.compile(r'\.vt\[\d+\]')
+_RE_POLY_FACE = re.compile(r'f\s+(\d+)((?:\s+[-]?\d+)+)')
+_RE_FLAG_DQ_VALUE = re.compile(r'-\w+\s+"[^"]*"')
+_RE_FLAG_SQ_VALUE = re.compile(r"-\w+\s+'[^']*'")
+
+
+def _parse_floats(values_str: str) -> List[float]:
+    """Parse whitespace-separated numbers
+
+    Maya ASCII writes plain numeric tokens, so split + float() handles the
+    common case; strings with other tokens fall back to extracting every
+    number-looking substring.
+    """
+    try:
+        return [float(token) for token in values_str.split()]
+    except ValueError:
+        return [float(n) for n in _RE_FLOAT.findall(values_str)]
+
+
+def _parse_float_array(values_str: str, dtype=np.float64) -> np.ndarray:
+    """Parse whitespace-separated numbers into a flat array
+
+    Used for the large numeric blocks (vertices, deltas, keyframes), where
+    converting in NumPy avoids a Python float() call per number. Falls back
+    like _parse_floats when other tokens are present.
+    """
+    try:
+        return np.array(values_str.split(), dtype=dtype)
+    except ValueError:
+        return np.array(_RE_FLOAT.findall(values_str), dtype=dtype)
+
+
+def _parse_triplets(values_str: str, dtype=np.float64) -> np.ndarray:
+    """Parse numbers into an (N, 3) array, dropping any incomplete trailing triplet"""
+    numbers = _parse_float_array(values_str, dtype)
+    return numbers[:len(numbers) - len(numbers) % 3].reshape(-1, 3)
+
+
+class _DeferredTriplets:
+    """Numeric text for an (N, 3) array, kept unparsed until first use"""
+
+    __slots__ = ('text', 'dtype', 'limit')
+
+    def __init__(self, text: str, dtype=np.float64, limit: Optional[int] = None):
+        self.text = text
+        self.dtype = dtype
+        self.limit = limit  # Maximum number of triplets, None for all
+
+    def parse(self) -> np.ndarray:
+        return _parse_triplets(self.text, self.dtype)[:self.limit]
+
+
+def _parse_int_array(values_str: str) -> np.ndarray:
+    """Parse whitespace-separated integers into a flat int32 array (see _parse_float_array)"""
+    try:
+        return np.array(values_str.split(), dtype=np.int32)
+    except ValueError:
+        return np.array(_RE_INT.findall(values_str), dtype=np.int32)
+
+
+def _tokenize(statement: str) -> List[str]:
+    """Split a statement into whitespace-separated tokens
+
+    Quoted tokens keep their quotes (Maya names never contain whitespace),
+    so callers can tell flag values from quoted names.
+    """
+    return statement.rstrip().rstrip(';').split()
+
+
+def _unquote(token: str) -> Optional[str]:
+    """Get a "quoted" or 'quoted' token's contents, None if it isn't quoted"""
+    if len(token) > 2 and token[0] in '"\'' and token[-1] == token[0]:
+        return token[1:-1]
+    return None
+
+
+def _flag_value(tokens: List[str], flag: str, quoted: bool = False) -> Optional[str]:
+    """Get the token following the first occurrence of a flag
+
+    Args:
+        tokens: Statement tokens from _tokenize
+        flag: Flag to look for, e.g. '-n'
+        quoted: Only accept (and unquote) a quoted value
+
+    Returns:
+        str: Flag value, or None if the flag has no (acceptable) value
+    """
+    for i in range(len(tokens) - 1):
+        if tokens[i] == flag:
+            value = tokens[i + 1]
+            if not quoted:
+                return value
+            value = _unquote(value)
+            if value is not None:
+                return value
+    return None
+
 
 class MayaNode:
     """Wrapper providing Alembic-compatible interface for parsed Maya nodes"""
 
+    # No per-instance __dict__: scenes can hold hundreds of thousands of nodes
+    __slots__ = ('name', 'node_type', 'parent_name', 'attributes', 'children',
+                 '_parent', '_full_path', '_is_org_cached')
+
     def __init__(self, name: str, node_type: str, parent_name: Optional[str] = None):
         self.name = name
         self.node_type = node_type  # 'transform', 'camera', 'mesh', 'animCurveTL', etc.
@@ -24,6 +175,7 @@ class MayaNode:
         self.children: List['MayaNode'] = []
         self._parent: Optional['MayaNode'] = None
         self._full_path: Optional[str] = None
+        self._is_org_cached: Optional[bool] = None  # set by MayaReader._is_organizational_group
 
     def getName(self) -> str:
         """Alembic-compatible: Get node name"""
@@ -34,15 +186,28 @@ class MayaNode:
         if self._full_path is not None:
             return self._full_path
 
-        # Build path from parent chain
-        parts = [self.name]
-        current = self._parent
-        while current is not None:
-            parts.insert(0, current.name)
+        # Walk up only to the nearest ancestor with a cached path, then
+        # build (and cache) each path top-down from its parent's
+        chain = []
+        current = self
+        while current is not None and current._full_path is None:
+            chain.append(current)
             current = current._parent
-        self._full_path = "/" + "/".join(parts)
+        prefix = current._full_path if current is not None else ""
+        for node in reversed(chain):
+            prefix = node._full_path = prefix + "/" + node.name
         return self._full_path
 
+    @property
+    def vertices(self) -> np.ndarray:
+        """Mesh vertex positions as an (N, 3) array, parsed on first access"""
+        vertices = self.attributes.get('vertices')
+        if isinstance(vertices, _DeferredTriplets):
+            vertices = self.attributes['vertices'] = vertices.parse()
+        if vertices is None:
+            return np.empty((0, 3), dtype=np.float64)
+        return vertices
+
     def getParent(self) -> Optional['MayaNode']:
         """Alembic-compatible: Get parent node"""
         return self._parent
@@ -61,38 +226,64 @@ class MayaAnimCurve:
     def __init__(self, name: str, curve_type: str):
         self.name = name
         self.curve_type = curve_type  # 'TL' (translate), 'TA' (angle/rotate), 'TU' (unitless/scale)
-        self.keyframes: List[Tuple[float, float]] = []  # [(frame, value), ...]
+        # Keyframes as parallel arrays, sorted by frame on first query
+        self.frames = np.empty(0)
+        self.values = np.empty(0)
+        self._sorted = True
         self.target_node: Optional[str] = None
         self.target_attr: Optional[str] = None
         self.pre_infinity = 'constant'
         self.post_infinity = 'constant'
 
+    def add_keyframes(self, frames: np.ndarray, values: np.ndarray):
+        """Append keyframes (parallel arrays of frame numbers and values)"""
+        self.frames = np.concatenate((self.frames, frames))
+        self.values = np.concatenate((self.values, values))
+        self._sorted = False
+
+    def _sort(self):
+        """Sort keyframes by frame (stable, so duplicate frames keep file order)"""
+        if not self._sorted:
+            order = np.argsort(self.frames, kind='stable')
+            self.frames = self.frames[order]
+            self.values = self.values[order]
+            self._sorted = True
+
     def get_value_at_frame(self, frame: float) -> float:
         """Get interpolated value at a specific frame"""
-        if not self.keyframes:
+        if not len(self.frames):
             return 0.0
+        self._sort()
+        frames = self.frames
+        values = self.values
+
+        # Before first / after last keyframe
+        if frame <= frames[0]:
+            return float(values[0])
+        if frame >= frames[-1]:
+            return float(values[-1])
+
+        # Bracketing keyframes: frames[i - 1] < frame <= frames[i]
+        i = int(np.searchsorted(frames, frame))
+        f1, f2 = frames[i - 1], frames[i]
+        v1, v2 = values[i - 1], values[i]
+        # Linear interpolation
+        t = (frame - f1) / (f2 - f1) if f2 != f1 else 0
+        return float(v1 + t * (v2 - v1))
+
+    def get_values_at_frames(self, frames: np.ndarray) -> np.ndarray:
+        """Get interpolated values at many frames at once
 
-        # Sort keyframes by frame number
-        sorted_kf = sorted(self.keyframes, key=lambda x: x[0])
-
-        # Before first keyframe
-        if frame <= sorted_kf[0][0]:
-            return sorted_kf[0][1]
-
-        # After last keyframe
-        if frame >= sorted_kf[-1][0]:
-            return sorted_kf[-1][1]
-
-        # Find surrounding keyframes and interpolate (linear)
-        for i in range(len(sorted_kf) - 1):
-            f1, v1 = sorted_kf[i]
-            f2, v2 = sorted_kf[i + 1]
-            if f1 <= frame <= f2:
-                # Linear interpolation
-                t = (frame - f1) / (f2 - f1) if f2 != f1 else 0
-                return v1 + t * (v2 - v1)
+        Args:
+            frames: Frame numbers to sample
 
-        return sorted_kf[-1][1]
+        Returns:
+            np.ndarray: Values, held constant outside the keyed range
+        """
+        if not len(self.frames):
+            return np.zeros(len(frames))
+        self._sort()
+        return np.interp(frames, self.frames, self.values)
 
 
 class MayaBlendShapeData:
@@ -105,7 +296,7 @@ class MayaBlendShapeData:
         self.weight_aliases: Dict[int, str] = {}  # target_idx -> weight alias name
         self.connected_mesh: Optional[str] = None
 
-    def add_deltas(self, target_idx: int, weight_idx: int, deltas: List[Tuple[float, float, float]]):
+    def add_deltas(self, target_idx: int, weight_idx: int, deltas: Any):
         """Add delta positions for a target at a weight index"""
         if target_idx not in self.targets:
             self.targets[target_idx] = {}
@@ -127,6 +318,7 @@ class MayaScene:
 
     def __init__(self):
         self.nodes: Dict[str, MayaNode] = {}
+        self._by_type: Dict[str, List[MayaNode]] = {}  # node_type -> nodes
         self.anim_curves: Dict[str, MayaAnimCurve] = {}
         self.blend_shapes: Dict[str, MayaBlendShapeData] = {}  # blendShape nodes
         self.connections: List[Tuple[str, str]] = []  # [(source, dest), ...]
@@ -135,18 +327,30 @@ class MayaScene:
         self.end_frame: float = 120.0
         self.linear_unit: str = 'cm'
         self.angular_unit: str = 'deg'
+        # (target_node, target_attr) -> curve, built by index_anim_curves()
+        self._curve_by_target: Dict[Tuple[str, str], MayaAnimCurve] = {}
+        # node name -> animated attribute names (both alias forms)
+        self._node_animated_attrs: Dict[str, Set[str]] = {}
+
+    def add_node(self, node: MayaNode):
+        """Add a node, replacing any earlier node with the same name"""
+        previous = self.nodes.get(node.name)
+        if previous is not None:
+            self._by_type[previous.node_type].remove(previous)
+        self.nodes[node.name] = node
+        self._by_type.setdefault(node.node_type, []).append(node)
 
     def get_node(self, name: str) -> Optional[MayaNode]:
         return self.nodes.get(name)
 
     def get_cameras(self) -> List[MayaNode]:
-        return [n for n in self.nodes.values() if n.node_type == 'camera']
+        return self._by_type.get('camera', [])
 
     def get_meshes(self) -> List[MayaNode]:
-        return [n for n in self.nodes.values() if n.node_type == 'mesh']
+        return self._by_type.get('mesh', [])
 
     def get_transforms(self) -> List[MayaNode]:
-        return [n for n in self.nodes.values() if n.node_type == 'transform']
+        return self._by_type.get('transform', [])
 
     # Attribute name aliases (short -> long and long -> short)
     ATTR_ALIASES = {
@@ -160,31 +364,56 @@ class MayaScene:
         'scaleX': 'sx', 'scaleY': 'sy', 'scaleZ': 'sz',
     }
 
+    def index_anim_curves(self):
+        """Index linked animation curves by target node and attribute
+
+        Each curve is stored under both its short (tx, rx, sx) and long
+        (translateX, rotateX, scaleX) attribute name. The first curve in
+        file order wins, as with a scan. Must be called again after curves
+        or their targets change.
+        """
+        index = {}
+        animated_attrs = {}
+        for curve in self.anim_curves.values():
+            if curve.target_node is None:
+                continue
+            attrs = animated_attrs.setdefault(curve.target_node, set())
+            index.setdefault((curve.target_node, curve.target_attr), curve)
+            attrs.add(curve.target_attr)
+            alias = self.ATTR_ALIASES.get(curve.target_attr)
+            if alias is not None:
+                index.setdefault((curve.target_node, alias), curve)
+                attrs.add(alias)
+        self._curve_by_target = index
+        self._node_animated_attrs = animated_attrs
+
     def get_anim_curve_for_attr(self, node_name: str, attr: str) -> Optional[MayaAnimCurve]:
         """Find animation curve connected to a specific node attribute
 
         Checks both short (tx, rx, sx) and long (translateX, rotateX, scaleX)
         attribute name formats.
         """
-        # Build list of attribute names to check (original + alias)
-        attrs_to_check = [attr]
-        if attr in self.ATTR_ALIASES:
-            attrs_to_check.append(self.ATTR_ALIASES[attr])
-
-        for curve in self.anim_curves.values():
-            if curve.target_node == node_name and curve.target_attr in attrs_to_check:
-                return curve
-        return None
+        return self._curve_by_target.get((node_name, attr))
 
 
 class MayaASCIIParser:
     """Pure Python parser for Maya ASCII (.ma) file format"""
 
-    def __init__(self):
+    def __init__(self, preload: bool = False):
+        """Initialize parser
+
+        Args:
+            preload: Parse vertex and blend shape delta blocks while reading
+                the file, instead of on first access
+        """
+        self.preload = preload
         self.scene = MayaScene()
         self._current_node: Optional[MayaNode] = None
         self._current_curve: Optional[MayaAnimCurve] = None
         self._current_blend_shape: Optional[MayaBlendShapeData] = None
+        # (id(node), attr) -> (node, attr, chunks) for array attributes
+        self._array_chunks: Dict[Tuple[int, str], Tuple[MayaNode, str, List[np.ndarray]]] = {}
+        self._attr_names: Dict[str, str] = {}  # interning table for attribute names
 
     def parse(self, file_path: str) -> MayaScene:
         """Parse a Maya ASCII file and return structured scene data"""
@@ -192,75 +421,79 @@ class MayaASCIIParser:
         self._current_node = None
         self._current_curve = None
         self._current_blend_shape = None
+        self._array_chunks = {}
+        self._attr_names = {}
+
+        # Stream statements straight from the file, so neither the whole
+        # content nor the whole statement list is held in memory. Statements
+        # are split and dispatched as bytes; only handled ones are decoded.
+        dispatch = {command.encode(): handler
+                    for command, handler in self._STATEMENT_HANDLERS.items()}
+        initials = frozenset(command[0] for command in dispatch)
+        with open(file_path, 'rb', buffering=1 << 20) as f:
+            # Statements come back stripped and non-empty
+            for statement in self._preprocess_lines(f):
+                # Most unhandled commands are ruled out by their first letter
+                if statement[0] not in initials:
+                    continue
+
+                # Dispatch on the command name (first space-separated word)
+                handler = dispatch.get(statement.partition(b' ')[0])
+                if handler is not None:
+                    handler(self, statement.decode('utf-8', 'replace'))
+
+        # Build node hierarchy and link animations and blend shapes
+        self._join_array_chunks()
+        self._normalize_transform_attrs()
+        self._build_hierarchy()
+        self._link_connections()
 
-        with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-            content = f.read()
-
-        # Process line by line, handling line continuations
-        lines = self._preprocess_lines(content)
+        return self.scene
 
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith('//'):
-                continue
+    def _preprocess_lines(self, lines: Iterable[bytes]) -> Iterator[bytes]:
+        """Join physical lines into complete (semicolon-terminated) statements
 
-            if line.startswith('createNode '):
-                self._parse_create_node(line)
-            elif line.startswith('setAttr '):
-                self._parse_set_attr(line)
-            elif line.startswith('connectAttr '):
-                self._parse_connect_attr(line)
-            elif line.startswith('currentUnit '):
-                self._parse_current_unit(line)
-            elif line.startswith('playbackOptions '):
-                self._parse_playback_options(line)
-
-        # Build node hierarchy and link animations
-        self._build_hierarchy()
-        self._link_animations()
+        Args:
+            lines: Raw source lines, e.g. a file opened in binary mode
 
-        return self.scene
+        Yields:
+            bytes: One statement at a time
+        """
+        # Collect fragments and join once, rather than re-copying a growing
+        # string for every continuation line of a large setAttr
+        parts = []
 
-    def _preprocess_lines(self, content: str) -> List[str]:
-        """Preprocess content to handle multi-line statements"""
-        lines = []
-        current_line = ""
+        for line in lines:
+            # Between statements, blank lines and comments are recognised by
+            # their first character, before paying for a strip
+            if not parts and (line[:1] == b'\n' or line.startswith(b'//')):
+                continue
 
-        for line in content.split('\n'):
             stripped = line.strip()
 
-            # Skip empty lines and comments when not accumulating
-            if not current_line and (not stripped or stripped.startswith('//')):
+            # Skip remaining empty lines and comments when not accumulating
+            if not parts and (not stripped or stripped.startswith(b'//')):
                 continue
 
-            current_line += " " + stripped if current_line else stripped
+            parts.append(stripped)
 
             # Check if statement is complete (ends with semicolon)
-            if current_line.rstrip().endswith(';'):
-                lines.append(current_line)
-                current_line = ""
-
-        return lines
+            if stripped.endswith(b';'):
+                yield b' '.join(parts)
+                parts.clear()
 
     def _parse_create_node(self, line: str):
         """Parse createNode command: createNode type -n "name" [-p "parent"];"""
-        # Extract node type
-        match = re.match(r'createNode\s+(\w+)', line)
-        if not match:
+        tokens = _tokenize(line)
+        if len(tokens) < 2:
             return
-        node_type = match.group(1)
+        node_type = tokens[1]
+        if node_type in _KNOWN_NODE_TYPES:
+            node_type = sys.intern(node_type)
 
-        # Extract node name
-        name_match = re.search(r'-n\s+"([^"]+)"', line)
-        if not name_match:
-            name_match = re.search(r"-n\s+'([^']+)'", line)
-        name = name_match.group(1) if name_match else f"unnamed_{len(self.scene.nodes)}"
-
-        # Extract parent name
-        parent_match = re.search(r'-p\s+"([^"]+)"', line)
-        if not parent_match:
-            parent_match = re.search(r"-p\s+'([^']+)'", line)
-        parent_name = parent_match.group(1) if parent_match else None
+        # Extract node name and parent name
+        name = _flag_value(tokens, '-n', quoted=True) or f"unnamed_{len(self.scene.nodes)}"
+        parent_name = _flag_value(tokens, '-p', quoted=True)
 
         # Handle animation curves specially
         if node_type.startswith('animCurve'):
@@ -279,7 +512,7 @@ class MayaASCIIParser:
             self._current_curve = None
         else:
             node = MayaNode(name, node_type, parent_name)
-            self.scene.nodes[name] = node
+            self.scene.add_node(node)
             self._current_node = node
             self._current_curve = None
             self._current_blend_shape = None
@@ -300,21 +533,19 @@ class MayaASCIIParser:
             return
 
         # Parse keyframe time-value pairs: setAttr -s N ".ktv[0:N]" frame1 value1 frame2 value2 ...
-        ktv_match = re.search(r'\.ktv\[', line)
-        if ktv_match:
+        ktv_start = line.find('.ktv[')
+        if ktv_start != -1:
             # Extract all numbers after the attribute specification
             # Find where the attribute ends (after the "]")
-            bracket_end = line.find(']', ktv_match.start())
+            bracket_end = line.find(']', ktv_start)
             if bracket_end != -1:
                 values_str = line[bracket_end + 1:].rstrip(';').strip()
                 # Remove quotes if present
                 values_str = values_str.strip('"').strip("'")
-                numbers = re.findall(r'[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?', values_str)
+                numbers = _parse_float_array(values_str)
                 # Pairs of (frame, value)
-                for i in range(0, len(numbers) - 1, 2):
-                    frame = float(numbers[i])
-                    value = float(numbers[i + 1])
-                    curve.keyframes.append((frame, value))
+                pairs = numbers[:len(numbers) - len(numbers) % 2].reshape(-1, 2)
+                curve.add_keyframes(pairs[:, 0], pairs[:, 1])
 
     def _parse_blend_shape_attr(self, line: str):
         """Parse blendShape node attributes (targets, deltas, components)"""
@@ -322,44 +553,40 @@ class MayaASCIIParser:
         if not bs:
             return
 
+        # One search finds the target item and which of its fields is set
+        # Alternative long names: .inputTarget[0].inputTargetGroup[0].inputTargetItem[6000]...
+        item_match = _RE_TARGET_ITEM.search(line)
+        field = item_match.lastgroup if item_match else None
+
         # Parse inputPointsTarget (delta positions)
         # Format: setAttr ".it[0].itg[0].iti[6000].ipt" -type "pointArray" N dx dy dz dx dy dz ...
-        # Alternative short names: .inputTarget[0].inputTargetGroup[0].inputTargetItem[6000].inputPointsTarget
-        ipt_match = re.search(r'\.(?:it|inputTarget)\[(\d+)\]\.(?:itg|inputTargetGroup)\[(\d+)\]\.(?:iti|inputTargetItem)\[(\d+)\]\.(?:ipt|inputPointsTarget)', line)
-        if ipt_match and '-type "pointArray"' in line:
-            geom_idx = int(ipt_match.group(1))  # Usually 0 (first deformed geometry)
-            target_idx = int(ipt_match.group(2))  # Target shape index
-            weight_idx = int(ipt_match.group(3))  # Weight index (6000 = 1.0 weight)
+        if field == 'points' and '-type "pointArray"' in line:
+            geom_idx = int(item_match.group(1))  # Usually 0 (first deformed geometry)
+            target_idx = int(item_match.group(2))  # Target shape index
+            weight_idx = int(item_match.group(3))  # Weight index (6000 = 1.0 weight)
 
             # Extract pointArray: -type "pointArray" N x y z x y z ...
-            pa_match = re.search(r'-type\s+"pointArray"\s+(\d+)\s+', line)
+            pa_match = _RE_POINT_ARRAY.search(line)
             if pa_match:
                 count = int(pa_match.group(1))
                 # Get everything after the count
                 start_idx = pa_match.end()
                 values_str = line[start_idx:].rstrip(';').strip()
-                numbers = re.findall(r'[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?', values_str)
-
-                # Group into triplets (x, y, z deltas)
-                deltas = []
-                for i in range(0, min(len(numbers), count * 3), 3):
-                    if i + 2 < len(numbers):
-                        deltas.append((float(numbers[i]), float(numbers[i + 1]), float(numbers[i + 2])))
-
-                if deltas:
-                    bs.add_deltas(target_idx, weight_idx, deltas)
+                # Group into triplets (x, y, z deltas), parsed when first used
+                deltas = _DeferredTriplets(values_str, limit=count)
+                bs.add_deltas(target_idx, weight_idx,
+                              deltas.parse() if self.preload else deltas)
             return
 
         # Parse inputComponentsTarget (affected vertex indices)
         # Format: setAttr ".it[0].itg[0].iti[6000].ict" -type "componentList" N "vtx[0:99]" "vtx[150]" ...
-        ict_match = re.search(r'\.(?:it|inputTarget)\[(\d+)\]\.(?:itg|inputTargetGroup)\[(\d+)\]\.(?:iti|inputTargetItem)\[(\d+)\]\.(?:ict|inputComponentsTarget)', line)
-        if ict_match and '-type "componentList"' in line:
-            geom_idx = int(ict_match.group(1))
-            target_idx = int(ict_match.group(2))
-            weight_idx = int(ict_match.group(3))
+        if field == 'components' and '-type "componentList"' in line:
+            geom_idx = int(item_match.group(1))
+            target_idx = int(item_match.group(2))
+            weight_idx = int(item_match.group(3))
 
             # Extract all vertex specifications: "vtx[N]" or "vtx[N:M]"
-            vtx_specs = re.findall(r'"vtx\[(\d+)(?::(\d+))?\]"', line)
+            vtx_specs = _RE_VTX_COMPONENT.findall(line)
             components = []
             for spec in vtx_specs:
                 start = int(spec[0])
@@ -373,7 +600,7 @@ class MayaASCIIParser:
         # Parse weight alias (target name)
         # Format: addAttr -ci true -k true -sn "smile" -ln "smile" -at "double" -min 0 -max 1;
         # Or via alias: aliasAttr "smile" ".w[0]";
-        alias_match = re.search(r'aliasAttr\s+"([^"]+)"\s+"\.w\[(\d+)\]"', line)
+        alias_match = _RE_WEIGHT_ALIAS.search(line) if 'aliasAttr' in line else None
         if alias_match:
             alias_name = alias_match.group(1)
             weight_idx = int(alias_match.group(2))
@@ -386,30 +613,42 @@ class MayaASCIIParser:
         if not node:
             return
 
-        # Extract attribute name
-        attr_match = re.search(r'setAttr\s+"\.([^"]+)"', line)
-        if not attr_match:
-            attr_match = re.search(r"setAttr\s+'\.([^']+)'", line)
-        if not attr_match:
-            attr_match = re.search(r'setAttr\s+\.(\w+)', line)
-        if not attr_match:
+        # Extract attribute name: setAttr ".name" / '.name' / .name
+        rest = line[len('setAttr'):].lstrip()
+        if rest[:1] in ('"', "'") and rest[1:2] == '.':
+            end = rest.find(rest[0], 2)
+            if end <= 2:
+                return
+            attr_name = rest[2:end]
+        elif rest[:1] == '.':
+            end = 1
+            while end < len(rest) and (rest[end].isalnum() or rest[end] == '_'):
+                end += 1
+            if end == 1:
+                return
+            attr_name = rest[1:end]
+        else:
             return
 
-        attr_name = attr_match.group(1)
-
-        # Handle different attribute types
-        if '-type "double3"' in line or "-type 'double3'" in line:
-            self._parse_double3_attr(node, attr_name, line)
-        elif '-type "float3"' in line or "-type 'float3'" in line:
-            self._parse_float3_array_attr(node, attr_name, line)
-        elif '.vt[' in line or '.vrts[' in line:
-            self._parse_vertex_attr(node, line)
-        elif '.fc[' in line or '.face[' in line:
-            self._parse_face_attr(node, line)
-        elif '.ed[' in line or '.edge[' in line:
-            self._parse_edge_attr(node, line)
-        elif '.pnts[' in line:
-            self._parse_points_attr(node, line)
+        # Share one string per attribute name across all nodes of the file
+        attr_name = self._attr_names.setdefault(attr_name, attr_name)
+
+        # Handle different attribute types: typed vectors first (one search
+        # for the flag, then a look at its value)
+        type_idx = line.find('-type ')
+        if type_idx != -1:
+            data_type = line[type_idx + 6:type_idx + 15]
+            if data_type.startswith(('"double3"', "'double3'")):
+                self._parse_double3_attr(node, attr_name, line)
+                return
+            if data_type.startswith(('"float3"', "'float3'")):
+                self._parse_float3_array_attr(node, attr_name, line)
+                return
+
+        # Then mesh component arrays, by attribute name (e.g. vt[0:7] -> vt)
+        handler = self._ARRAY_ATTR_HANDLERS.get(attr_name.partition('[')[0])
+        if handler is not None:
+            handler(self, node, line)
         else:
             # Simple numeric attribute
             self._parse_simple_attr(node, attr_name, line)
@@ -422,9 +661,9 @@ class MayaASCIIParser:
             type_idx = line.find("double3'")
         if type_idx != -1:
             values_str = line[type_idx + 8:].rstrip(';').strip()
-            numbers = re.findall(r'[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?', values_str)
+            numbers = _parse_floats(values_str)
             if len(numbers) >= 3:
-                node.attributes[attr_name] = [float(numbers[0]), float(numbers[1]), float(numbers[2])]
+                node.attributes[attr_name] = numbers[:3]
 
     def _parse_float3_array_attr(self, node: MayaNode, attr_name: str, line: str):
         """Parse float3 array attribute (vertices, normals, etc.)"""
@@ -433,15 +672,10 @@ class MayaASCIIParser:
             type_idx = line.find("float3'")
         if type_idx != -1:
             values_str = line[type_idx + 7:].rstrip(';').strip()
-            numbers = re.findall(r'[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?', values_str)
             # Group into triplets
-            values = []
-            for i in range(0, len(numbers) - 2, 3):
-                values.append([float(numbers[i]), float(numbers[i + 1]), float(numbers[i + 2])])
-            if values:
-                if attr_name not in node.attributes:
-                    node.attributes[attr_name] = []
-                node.attributes[attr_name].extend(values)
+            values = _parse_triplets(values_str)
+            if len(values):
+                self._append_array_chunk(node, attr_name, values)
 
     def _parse_vertex_attr(self, node: MayaNode, line: str):
         """Parse mesh vertex positions
@@ -450,34 +684,77 @@ class MayaASCIIParser:
         1. With type: setAttr ".vt[0:N]" -type "float3" x y z x y z ...
         2. Raw numbers: setAttr ".vt[0:N]" x y z x y z ...
         """
-        if 'vertices' not in node.attributes:
-            node.attributes['vertices'] = []
+        self._append_array_chunk(node, 'vertices')
 
         # Find where the numeric data starts
         # Skip past attribute index like ".vt[0:4]"
-        bracket_match = re.search(r'\.vt\[\d+:\d+\]', line)
+        bracket_match = _RE_VT_RANGE.search(line)
         if not bracket_match:
-            bracket_match = re.search(r'\.vrts\[\d+:\d+\]', line)
+            bracket_match = _RE_VRTS_RANGE.search(line)
         if not bracket_match:
-            bracket_match = re.search(r'\.vt\[\d+\]', line)
+            bracket_match = _RE_VT_INDEX.search(line)
 
         if bracket_match:
             # Start parsing after the bracket
             data_start = bracket_match.end()
-            values_str = line[data_start:].rstrip(';').strip()
+            # Drop the closing quote of the attribute name, so plain numbers
+            # take the parsers' split() path rather than the regex fallback
+            values_str = line[data_start:].rstrip(';').strip().lstrip('"\'')
 
             # Skip past -type "float3" if present
             if '-type' in values_str:
-                type_match = re.search(r'-type\s+["\']?\w+["\']?\s*', values_str)
-                if type_match:
-                    values_str = values_str[type_match.end():]
-
-            # Extract all floating point numbers
-            numbers = re.findall(r'[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?', values_str)
-            for i in range(0, len(numbers) - 2, 3):
-                node.attributes['vertices'].append(
-                    [float(numbers[i]), float(numbers[i + 1]), float(numbers[i + 2])]
-                )
+                type_tokens = values_str.partition('-type')[2].split(None, 1)
+                if type_tokens:
+                    values_str = type_tokens[1] if len(type_tokens) > 1 else ''
+
+            # Extracted on first access (see MayaNode.vertices)
+            self._append_array_chunk(node, 'vertices', values_str)
+
+    def _append_array_chunk(self, node: MayaNode, attr_name: str,
+                            chunk: Any = None):
+        """Collect a chunk of an array attribute
+
+        Maya splits large arrays over many setAttr statements, so chunks are
+        kept per attribute and concatenated once by _join_array_chunks.
+
+        Args:
+            node: Node owning the attribute
+            attr_name: Attribute name, e.g. 'vertices'
+            chunk: Parsed values, or numeric text to parse later as (N, 3)
+                float64; None only registers an (N, 3) attribute
+        """
+        key = (id(node), attr_name)
+        entry = self._array_chunks.get(key)
+        if entry is None:
+            entry = self._array_chunks[key] = (node, attr_name, [])
+        if chunk is not None:
+            entry[2].append(chunk)
+
+    def _join_array_chunks(self):
+        """Store each collected array attribute as a single array"""
+        for node, attr_name, chunks in self._array_chunks.values():
+            if chunks and isinstance(chunks[0], str):
+                deferred = _DeferredTriplets(' '.join(chunks))
+                node.attributes[attr_name] = deferred.parse() if self.preload else deferred
+            elif chunks:
+                node.attributes[attr_name] = np.concatenate(chunks)
+            else:
+                node.attributes[attr_name] = np.empty((0, 3), dtype=np.float64)
+        self._array_chunks = {}
+
+    def _normalize_transform_attrs(self):
+        """Store static translate/rotate/scale values as flat float tuples
+
+        double3 parsing gives a flat [x, y, z] list and float3 parsing an
+        (N, 3) array; both start with x, y, z. Normalizing once here keeps
+        the per-sample fallback free of type checks.
+        """
+        for node in self.scene.nodes.values():
+            attrs = node.attributes
+            for attr_base in ('t', 'r', 's'):
+                value = attrs.get(attr_base)
+                if isinstance(value, (list, np.ndarray)):
+                    attrs[attr_base] = tuple(np.ravel(value)[:3].tolist())
 
     def _parse_face_attr(self, node: MayaNode, line: str):
         """Parse mesh face definitions (polyFaces format)
@@ -490,9 +767,7 @@ class MayaASCIIParser:
         Edge indices can be positive (forward) or negative (reversed).
         For negative index -N: use edge at index (N-1) reversed.
         """
-        if 'polyfaces_raw' not in node.attributes:
-            node.attributes['polyfaces_raw'] = []
-            node.attributes['face_format'] = 'unknown'
+        node.attributes.setdefault('face_format', 'unknown')
 
         # Detect polyFaces format
         if '-type "polyFaces"' in line or '-type \'polyFaces\'' in line:
@@ -500,19 +775,19 @@ class MayaASCIIParser:
 
         # Parse "f N e1 e2 ..." entries (face definitions)
         # Each face starts with 'f' followed by vertex count and edge indices
-        face_pattern = r'f\s+(\d+)((?:\s+[-]?\d+)+)'
-        face_matches = re.findall(face_pattern, line)
-
-        for match in face_matches:
+        # Stored CSR-style: per-face counts plus one flat edge index array
+        counts = []
+        edges = []
+        for match in _RE_POLY_FACE.findall(line):
             vertex_count = int(match[0])
-            edge_indices_str = match[1].strip()
-            edge_indices = [int(e) for e in edge_indices_str.split()]
+            edge_indices = match[1].split()
 
             if len(edge_indices) == vertex_count:
-                node.attributes['polyfaces_raw'].append({
-                    'count': vertex_count,
-                    'edges': edge_indices
-                })
+                counts.append(vertex_count)
+                edges.extend(edge_indices)
+
+        self._append_array_chunk(node, 'polyfaces_counts', np.array(counts, dtype=np.int32))
+        self._append_array_chunk(node, 'polyfaces_edges', np.array(edges, dtype=np.int32))
 
     def _parse_edge_attr(self, node: MayaNode, line: str):
         """Parse mesh edge definitions
@@ -520,39 +795,29 @@ class MayaASCIIParser:
         Maya ASCII stores edges as triplets: start_vertex end_vertex smooth_flag
         Format: setAttr ".ed[0:N]" v1 v2 smooth v3 v4 smooth ...
         """
-        if 'edges_raw' not in node.attributes:
-            node.attributes['edges_raw'] = []
-
         # Extract all numbers from the line (skip attribute index range like [0:7])
         # Find where the actual data starts (after the closing bracket or after attribute name)
         data_start = line.find(']')
         if data_start == -1:
             data_start = line.find('.ed')
         if data_start != -1:
-            data_str = line[data_start + 1:].rstrip(';').strip()
-            numbers = re.findall(r'[-+]?\d+', data_str)
+            data_str = line[data_start + 1:].rstrip(';').strip().lstrip('"\'')
+            numbers = _parse_int_array(data_str)
 
-            # Parse triplets: (start_vertex, end_vertex, smooth_flag)
-            for i in range(0, len(numbers) - 2, 3):
-                start_v = int(numbers[i])
-                end_v = int(numbers[i + 1])
-                # smooth_flag = int(numbers[i + 2])  # Not needed for vertex extraction
-                node.attributes['edges_raw'].append((start_v, end_v))
+            # Parse triplets: (start_vertex, end_vertex, smooth_flag);
+            # the smooth flag is not needed for vertex extraction
+            triplets = numbers[:len(numbers) - len(numbers) % 3].reshape(-1, 3)
+            self._append_array_chunk(node, 'edges_raw', triplets[:, :2])
 
     def _parse_points_attr(self, node: MayaNode, line: str):
         """Parse point offsets (deformation deltas)"""
-        if 'point_offsets' not in node.attributes:
-            node.attributes['point_offsets'] = []
+        self._append_array_chunk(node, 'point_offsets')
 
         if '-type "float3"' in line or "-type 'float3'" in line:
             type_idx = max(line.find('float3"'), line.find("float3'"))
             if type_idx != -1:
                 values_str = line[type_idx + 7:].rstrip(';').strip()
-                numbers = re.findall(r'[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?', values_str)
-                for i in range(0, len(numbers) - 2, 3):
-                    node.attributes['point_offsets'].append(
-                        [float(numbers[i]), float(numbers[i + 1]), float(numbers[i + 2])]
-                    )
+                self._append_array_chunk(node, 'point_offsets', _parse_triplets(values_str))
 
     def _parse_simple_attr(self, node: MayaNode, attr_name: str, line: str):
         """Parse simple numeric attribute"""
@@ -561,39 +826,39 @@ class MayaASCIIParser:
         if attr_idx != -1:
             values_str = line[attr_idx + len(attr_name):].rstrip(';').strip()
             # Remove any remaining flags
-            values_str = re.sub(r'-\w+\s+"[^"]*"', '', values_str)
-            values_str = re.sub(r"-\w+\s+'[^']*'", '', values_str)
-            numbers = re.findall(r'[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?', values_str)
+            values_str = _RE_FLAG_DQ_VALUE.sub('', values_str)
+            values_str = _RE_FLAG_SQ_VALUE.sub('', values_str)
+            # Leading quote is the end of the attribute name
+            numbers = _parse_floats(values_str.lstrip('"\''))
             if len(numbers) == 1:
-                node.attributes[attr_name] = float(numbers[0])
+                node.attributes[attr_name] = numbers[0]
             elif len(numbers) > 1:
-                node.attributes[attr_name] = [float(n) for n in numbers]
+                node.attributes[attr_name] = numbers
 
     def _parse_connect_attr(self, line: str):
         """Parse connectAttr command: connectAttr "source.attr" "dest.attr";"""
         # Extract source and destination
-        match = re.search(r'connectAttr\s+"([^"]+)"\s+"([^"]+)"', line)
-        if not match:
-            match = re.search(r"connectAttr\s+'([^']+)'\s+'([^']+)'", line)
-        if match:
-            source = match.group(1)
-            dest = match.group(2)
-            self.scene.connections.append((source, dest))
+        tokens = _tokenize(line)
+        if len(tokens) >= 3 and tokens[1][0] == tokens[2][0]:
+            source = _unquote(tokens[1])
+            dest = _unquote(tokens[2])
+            if source is not None and dest is not None:
+                self.scene.connections.append((source, dest))
 
     def _parse_current_unit(self, line: str):
         """Parse currentUnit command for units"""
         # currentUnit -l centimeter -a degree -t film;
-        linear_match = re.search(r'-l\s+(\w+)', line)
-        if linear_match:
-            self.scene.linear_unit = linear_match.group(1)
+        tokens = _tokenize(line)
+        linear_unit = _flag_value(tokens, '-l')
+        if linear_unit:
+            self.scene.linear_unit = linear_unit
 
-        angular_match = re.search(r'-a\s+(\w+)', line)
-        if angular_match:
-            self.scene.angular_unit = angular_match.group(1)
+        angular_unit = _flag_value(tokens, '-a')
+        if angular_unit:
+            self.scene.angular_unit = angular_unit
 
-        time_match = re.search(r'-t\s+(\w+)', line)
-        if time_match:
-            time_unit = time_match.group(1)
+        time_unit = _flag_value(tokens, '-t')
+        if time_unit:
             # Convert time unit to FPS
             fps_map = {
                 'film': 24.0, 'pal': 25.0, 'ntsc': 30.0, 'show': 48.0,
@@ -616,20 +881,49 @@ class MayaASCIIParser:
     def _parse_playback_options(self, line: str):
         """Parse playbackOptions for frame range"""
         # playbackOptions -min 1 -max 120 -ast 1 -aet 120;
-        min_match = re.search(r'-min\s+([-+]?\d*\.?\d+)', line)
-        max_match = re.search(r'-max\s+([-+]?\d*\.?\d+)', line)
-        ast_match = re.search(r'-ast\s+([-+]?\d*\.?\d+)', line)
-        aet_match = re.search(r'-aet\s+([-+]?\d*\.?\d+)', line)
-
-        if min_match:
-            self.scene.start_frame = float(min_match.group(1))
-        if max_match:
-            self.scene.end_frame = float(max_match.group(1))
+        tokens = _tokenize(line)
+
+        def frame_flag(flag):
+            value = _flag_value(tokens, flag)
+            try:
+                return float(value) if value is not None else None
+            except ValueError:
+                return None
+
+        min_frame = frame_flag('-min')
+        max_frame = frame_flag('-max')
+        ast_frame = frame_flag('-ast')
+        aet_frame = frame_flag('-aet')
+
+        if min_frame is not None:
+            self.scene.start_frame = min_frame
+        if max_frame is not None:
+            self.scene.end_frame = max_frame
         # Animation start/end take precedence if present
-        if ast_match:
-            self.scene.start_frame = float(ast_match.group(1))
-        if aet_match:
-            self.scene.end_frame = float(aet_match.group(1))
+        if ast_frame is not None:
+            self.scene.start_frame = ast_frame
+        if aet_frame is not None:
+            self.scene.end_frame = aet_frame
+
+    # Statement handlers by command name, used by parse()
+    _STATEMENT_HANDLERS = {
+        'createNode': _parse_create_node,
+        'setAttr': _parse_set_attr,
+        'connectAttr': _parse_connect_attr,
+        'currentUnit': _parse_current_unit,
+        'playbackOptions': _parse_playback_options,
+    }
+
+    # Mesh component array attributes (short and long names) -> parser
+    _ARRAY_ATTR_HANDLERS = {
+        'vt': _parse_vertex_attr,
+        'vrts': _parse_vertex_attr,
+        'fc': _parse_face_attr,
+        'face': _parse_face_attr,
+        'ed': _parse_edge_attr,
+        'edge': _parse_edge_attr,
+        'pnts': _parse_points_attr,
+    }
 
     def _build_hierarchy(self):
         """Build parent-child relationships between nodes"""
@@ -639,42 +933,32 @@ class MayaASCIIParser:
                 node._parent = parent
                 parent.children.append(node)
 
-    def _link_animations(self):
-        """Link animation curves to their target nodes/attributes"""
-        for source, dest in self.scene.connections:
-            # Parse source (e.g., "pCube1_translateX.output" or "pCube1_translateX.o")
-            source_parts = source.split('.')
-            if len(source_parts) >= 1:
-                curve_name = source_parts[0]
-                if curve_name in self.scene.anim_curves:
-                    curve = self.scene.anim_curves[curve_name]
-                    # Parse destination (e.g., "pCube1.translateX" or "pCube1.tx")
-                    dest_parts = dest.split('.')
-                    if len(dest_parts) >= 2:
-                        curve.target_node = dest_parts[0]
-                        curve.target_attr = dest_parts[1]
-
-        # Also link blend shapes to their target meshes
-        self._link_blend_shapes()
-
-    def _link_blend_shapes(self):
-        """Link blendShape deformers to their target meshes via connections"""
+    def _link_connections(self):
+        """Link animation curves and blendShape deformers to their targets
+
+        Classifies each connection in a single pass:
+        - pCube1_translateX.output -> pCube1.translateX (or pCube1.tx)
+          sets the curve's target node/attribute
+        - blendShape1.outputGeometry[0] -> meshShape.inMesh (or .og[0] -> .i)
+          sets the deformer's connected mesh
+        """
+        anim_curves = self.scene.anim_curves
+        blend_shapes = self.scene.blend_shapes
         for source, dest in self.scene.connections:
-            # Look for blendShape output connections:
-            # blendShape1.outputGeometry[0] -> meshShape.inMesh
-            # or: blendShape1.og[0] -> meshShape.i
-            source_parts = source.split('.')
-            if len(source_parts) >= 1:
-                bs_name = source_parts[0]
-                if bs_name in self.scene.blend_shapes:
-                    # Check if destination is a mesh's input
-                    dest_parts = dest.split('.')
-                    if len(dest_parts) >= 1:
-                        mesh_name = dest_parts[0]
-                        # Check if the destination looks like a mesh input
-                        attr = dest_parts[1] if len(dest_parts) > 1 else ''
-                        if attr in ('inMesh', 'i', 'inputGeometry', 'ig'):
-                            self.scene.blend_shapes[bs_name].connected_mesh = mesh_name
+            source_node = source.partition('.')[0]
+            dest_node, separator, dest_rest = dest.partition('.')
+            dest_attr = dest_rest.partition('.')[0]
+
+            curve = anim_curves.get(source_node)
+            if curve is not None and separator:
+                curve.target_node = dest_node
+                curve.target_attr = dest_attr
+
+            bs_data = blend_shapes.get(source_node)
+            if bs_data is not None and dest_attr in ('inMesh', 'i', 'inputGeometry', 'ig'):
+                bs_data.connected_mesh = dest_node
+
+        self.scene.index_anim_curves()
 
 
 class MayaReader(BaseReader):
@@ -689,6 +973,9 @@ class MayaReader(BaseReader):
     - Blend shape deformers with delta targets
     """
 
+    # Max cached (node, frame) transform samples; oldest entries are evicted
+    TRANSFORM_CACHE_SIZE = 4096
+
     def __init__(self, ma_file: str):
         """Initialize reader and parse Maya ASCII file
 
@@ -699,6 +986,16 @@ class MayaReader(BaseReader):
         parser = MayaASCIIParser()
         self.scene = parser.parse(str(self.file_path))
         self.fps = self.scene.fps
+        # (id(transform node), frame in 1/1000ths) -> (translation, rotation, scale)
+        self._transform_cache: Dict[Tuple[int, int], Tuple[List[float], List[float], List[float]]] = {}
+        self._blend_shapes_by_mesh: Optional[Dict[str, List[MayaBlendShapeData]]] = None
+        self._blend_shape_cache: Dict[str, Any] = {}  # mesh name -> BlendShapeDeformer or None
+        # camera name -> attribute key per _CAMERA_ATTRS entry (None: use default)
+        self._camera_attr_cache: Dict[str, Tuple[Optional[str], ...]] = {}
+
+    def reset_sampling_cache(self):
+        """Drop cached transform samples (e.g. between exports)"""
+        self._transform_cache.clear()
 
     def get_format_name(self) -> str:
         """Return human-readable format name"""
@@ -759,16 +1056,17 @@ class MayaReader(BaseReader):
         """
         frame = time_seconds * self.fps
 
-        # Find the transform node
-        if obj.node_type in ('camera', 'mesh'):
-            # Shape node - get parent transform
-            transform_node = obj._parent
-        else:
-            transform_node = obj
-
+        transform_node = self._get_transform_node(obj)
         if not transform_node:
             return [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [1.0, 1.0, 1.0]
 
+        # A shape and its transform sample the same curves; rotation is
+        # native, so maya_compat doesn't change the result either
+        key = (id(transform_node), round(frame * 1000))
+        cached = self._transform_cache.get(key)
+        if cached is not None:
+            return cached
+
         # Get translation
         translation = self._get_animated_value(transform_node, 't', frame, [0.0, 0.0, 0.0])
 
@@ -778,8 +1076,95 @@ class MayaReader(BaseReader):
         # Get scale
         scale = self._get_animated_value(transform_node, 's', frame, [1.0, 1.0, 1.0])
 
+        if len(self._transform_cache) >= self.TRANSFORM_CACHE_SIZE:
+            # Dicts keep insertion order, so the first key is the oldest
+            del self._transform_cache[next(iter(self._transform_cache))]
+        self._transform_cache[key] = translation, rotation, scale
         return translation, rotation, scale
 
+    def get_transform_track(self, obj: MayaNode, times: List[float],
+                            maya_compat: bool = False) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get transform data for a whole sequence of times
+
+        Each animated channel is evaluated for all times in one
+        MayaAnimCurve.get_values_at_frames call.
+
+        Args:
+            obj: MayaNode object (transform or shape with parent transform)
+            times: Times in seconds to sample
+            maya_compat: If True, use Maya-compatible rotation (already native)
+
+        Returns:
+            tuple: (translations, rotations, scales) as (N, 3) float64 arrays
+        """
+        frames = np.asarray(times, dtype=np.float64) * self.fps
+        transform_node = self._get_transform_node(obj)
+
+        tracks = []
+        for attr_base, default in (('t', 0.0), ('r', 0.0), ('s', 1.0)):
+            track = np.full((len(frames), 3), default)
+            if transform_node:
+                sources = self._get_channel_sources(transform_node, attr_base, [default] * 3)
+                for idx, source in enumerate(sources):
+                    if isinstance(source, MayaAnimCurve):
+                        track[:, idx] = source.get_values_at_frames(frames)
+                    else:
+                        track[:, idx] = source
+            tracks.append(track)
+        return tuple(tracks)
+
+    def get_transforms_over_range(self, obj: MayaNode, times: List[float]
+                                  ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Get a transform track with both rotation decomposition modes
+
+        Maya rotations are native, so both modes share one sampled track.
+
+        Args:
+            obj: MayaNode object
+            times: Times in seconds to sample
+
+        Returns:
+            tuple: (translations, rotations_ae, rotations_maya, scales) as
+                   (N, 3) float64 arrays
+        """
+        positions, rotations, scales = self.get_transform_track(obj, times)
+        return positions, rotations, rotations, scales
+
+    def _get_transform_node(self, obj: MayaNode) -> Optional[MayaNode]:
+        """Get the transform driving an object (shape nodes use their parent)"""
+        if obj.node_type in ('camera', 'mesh'):
+            return obj._parent
+        return obj
+
+    def _get_channel_sources(self, node: MayaNode, attr_base: str,
+                             default: List[float]) -> List[Any]:
+        """Get the animation curve or static value for each x/y/z channel
+
+        Args:
+            node: Transform node
+            attr_base: Attribute base name ('t', 'r', or 's')
+            default: Default value if not found
+
+        Returns:
+            List of 3 entries, each a MayaAnimCurve or a float
+        """
+        sources = list(default)
+
+        # Static fallback: (x, y, z) tuple from _normalize_transform_attrs
+        static_val = node.attributes.get(attr_base)
+        if type(static_val) is tuple:
+            sources[:len(static_val)] = static_val
+
+        # Animation curves take precedence, per component
+        for idx, attr_names in enumerate(_CHANNEL_ATTR_NAMES.get(attr_base, ())):
+            for attr_name in attr_names:
+                curve = self.scene.get_anim_curve_for_attr(node.name, attr_name)
+                if curve:
+                    sources[idx] = curve
+                    break
+
+        return sources
+
     def _get_animated_value(self, node: MayaNode, attr_base: str, frame: float,
                             default: List[float]) -> List[float]:
         """Get animated or static value for a transform attribute
@@ -793,52 +1178,10 @@ class MayaReader(BaseReader):
         Returns:
             List of 3 floats [x, y, z]
         """
-        result = list(default)
-
-        # Map short names to full names for animation curve lookup
-        attr_map = {
-            't': ['translateX', 'translateY', 'translateZ', 'tx', 'ty', 'tz'],
-            'r': ['rotateX', 'rotateY', 'rotateZ', 'rx', 'ry', 'rz'],
-            's': ['scaleX', 'scaleY', 'scaleZ', 'sx', 'sy', 'sz'],
-        }
-
-        attrs = attr_map.get(attr_base, [])
-        components = ['X', 'Y', 'Z', 'x', 'y', 'z']
-
-        # Try to find animation curves for each component
-        for i, component in enumerate(['X', 'Y', 'Z']):
-            idx = i % 3
-            curve = None
-
-            # Try different attribute name formats
-            for attr_name in [f'{attr_base}{component.lower()}',
-                              f'{attr_base}{component}',
-                              f'translate{component}' if attr_base == 't' else None,
-                              f'rotate{component}' if attr_base == 'r' else None,
-                              f'scale{component}' if attr_base == 's' else None]:
-                if attr_name:
-                    curve = self.scene.get_anim_curve_for_attr(node.name, attr_name)
-                    if curve:
-                        break
-
-            if curve:
-                result[idx] = curve.get_value_at_frame(frame)
-            else:
-                # Fall back to static attribute
-                if attr_base in node.attributes:
-                    static_val = node.attributes[attr_base]
-                    if isinstance(static_val, list):
-                        # Handle nested list case: [[x, y, z]] from float3 parsing
-                        # vs flat list case: [x, y, z] from double3 parsing
-                        if len(static_val) > 0 and isinstance(static_val[0], list):
-                            # Nested list - flatten first element
-                            if len(static_val[0]) > idx:
-                                result[idx] = float(static_val[0][idx])
-                        elif len(static_val) > idx:
-                            # Flat list - access directly
-                            result[idx] = float(static_val[idx])
-
-        return result
+        return [
+            source.get_value_at_frame(frame) if isinstance(source, MayaAnimCurve) else source
+            for source in self._get_channel_sources(node, attr_base, default)
+        ]
 
     def get_mesh_data_at_time(self, mesh_obj: MayaNode, time_seconds: float) -> Dict[str, Any]:
         """Get mesh geometry data at a specific time
@@ -851,15 +1194,12 @@ class MayaReader(BaseReader):
             dict: Mesh data with 'positions', 'indices', 'counts'
         """
         # Get base vertices
-        vertices = mesh_obj.attributes.get('vertices', [])
+        vertices = mesh_obj.vertices
 
         # Apply point offsets if present (baked vertex animation)
         offsets = mesh_obj.attributes.get('point_offsets', [])
-        if offsets and len(offsets) == len(vertices):
-            vertices = [
-                [v[0] + o[0], v[1] + o[1], v[2] + o[2]]
-                for v, o in zip(vertices, offsets)
-            ]
+        if len(offsets) and len(offsets) == len(vertices):
+            vertices = vertices + offsets
 
         # Get face data using polyFaces format (edge-based)
         indices, counts = self._parse_face_data(mesh_obj, len(vertices))
@@ -870,51 +1210,60 @@ class MayaReader(BaseReader):
             'counts': counts
         }
 
-    def _parse_face_data(self, mesh_obj: MayaNode, vertex_count: int) -> Tuple[List[int], List[int]]:
+    def _parse_face_data(self, mesh_obj: MayaNode, vertex_count: int) -> Tuple[np.ndarray, np.ndarray]:
         """Parse Maya face data into indices and counts
 
         Handles Maya's polyFaces format which uses edge indices:
         - Positive edge index N: use start vertex of edge N
         - Negative edge index -N: use end vertex of edge (N-1)
 
+        Faces referencing an edge that doesn't exist, and faces with no
+        vertices, are dropped. Counts that don't add up to the edge list
+        yield no faces.
+
         Args:
             mesh_obj: MayaNode with parsed mesh attributes
             vertex_count: Total number of vertices (for bounds checking)
 
         Returns:
-            tuple: (indices, counts)
+            tuple: (indices, counts) as int32 arrays
         """
-        polyfaces_raw = mesh_obj.attributes.get('polyfaces_raw', [])
-        edges_raw = mesh_obj.attributes.get('edges_raw', [])
-
-        if not polyfaces_raw:
-            return [], []
-
-        indices = []
-        counts = []
-
-        for face_data in polyfaces_raw:
-            face_vertex_count = face_data['count']
-            edge_indices = face_data['edges']
-
-            face_verts = []
-            for edge_idx in edge_indices:
-                if edge_idx >= 0:
-                    # Positive: use start vertex of edge at this index
-                    if edge_idx < len(edges_raw):
-                        vert = edges_raw[edge_idx][0]  # start vertex
-                        face_verts.append(vert)
-                else:
-                    # Negative: use end vertex of edge at (abs(edge_idx) - 1)
-                    actual_edge_idx = abs(edge_idx) - 1
-                    if 0 <= actual_edge_idx < len(edges_raw):
-                        vert = edges_raw[actual_edge_idx][1]  # end vertex
-                        face_verts.append(vert)
-
-            if len(face_verts) == face_vertex_count:
-                indices.extend(face_verts)
-                counts.append(face_vertex_count)
-
+        face_counts = mesh_obj.attributes.get('polyfaces_counts')
+        face_edges = mesh_obj.attributes.get('polyfaces_edges')
+        edges_raw = mesh_obj.attributes.get('edges_raw')
+
+        empty = np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int32)
+        if face_counts is None or not len(face_counts) or edges_raw is None or not len(edges_raw):
+            return empty
+
+        # Counts and edges are stored CSR-style; without matching totals the
+        # per-face edge ranges are unknown
+        if face_edges is None or int(face_counts.sum()) != len(face_edges):
+            return empty
+
+        # Zero-count faces own no edges; dropping them also keeps the face
+        # start offsets distinct (and in range) for reduceat below
+        nonempty = face_counts > 0
+        if not nonempty.all():
+            face_counts = face_counts[nonempty]
+            if not len(face_counts):
+                return empty
+
+        # Negative index -N is edge N-1 reversed: its sign bit selects the
+        # end-vertex column, so both cases are one gather
+        col = np.signbit(face_edges).astype(np.intp)
+        edge_idx = np.where(col, -face_edges - 1, face_edges)
+        valid = edge_idx < len(edges_raw)
+        verts = edges_raw[np.minimum(edge_idx, len(edges_raw) - 1), col]
+        if valid.all():
+            return verts.astype(np.int32, copy=False), face_counts
+
+        # Keep only faces whose edges all exist
+        face_starts = np.concatenate(([0], np.cumsum(face_counts)[:-1]))
+        face_ok = np.logical_and.reduceat(valid, face_starts)
+
+        indices = verts[np.repeat(face_ok, face_counts)].astype(np.int32)
+        counts = face_counts[face_ok]
         return indices, counts
 
     def get_camera_properties(self, cam_obj: MayaNode, time_seconds: Optional[float] = None) -> Dict[str, float]:
@@ -927,25 +1276,27 @@ class MayaReader(BaseReader):
         Returns:
             dict: Camera properties with 'focal_length', 'h_aperture', 'v_aperture'
         """
-        # Get focal length (Maya attribute: .fl or .focalLength)
-        focal_length = cam_obj.attributes.get('fl',
-                       cam_obj.attributes.get('focalLength', 35.0))
-
-        # Get apertures (Maya: .chs/.cvs for camera aperture, or .hfa/.vfa)
-        # Maya stores in inches, convert to cm (Alembic convention)
-        h_aperture_inch = cam_obj.attributes.get('hfa',
-                          cam_obj.attributes.get('horizontalFilmAperture', 1.417))
-        v_aperture_inch = cam_obj.attributes.get('vfa',
-                          cam_obj.attributes.get('verticalFilmAperture', 0.945))
-
-        # Convert inches to cm
-        h_aperture = h_aperture_inch * 2.54
-        v_aperture = v_aperture_inch * 2.54
+        attrs = cam_obj.attributes
+
+        # Resolve which attribute name (short or long) each property uses
+        # once per camera; the short name wins when both are present
+        keys = self._camera_attr_cache.get(cam_obj.name)
+        if keys is None:
+            keys = tuple(
+                short if short in attrs else (long if long in attrs else None)
+                for short, long, _ in _CAMERA_ATTRS
+            )
+            self._camera_attr_cache[cam_obj.name] = keys
+        focal_length, h_aperture_inch, v_aperture_inch = (
+            attrs[key] if key is not None else default
+            for key, (_, _, default) in zip(keys, _CAMERA_ATTRS)
+        )
 
+        # Maya stores apertures in inches, convert to cm (Alembic convention)
         return {
             'focal_length': float(focal_length),
-            'h_aperture': float(h_aperture),
-            'v_aperture': float(v_aperture)
+            'h_aperture': float(h_aperture_inch) * _INCH_TO_CM,
+            'v_aperture': float(v_aperture_inch) * _INCH_TO_CM
         }
 
     def _get_full_path(self, obj: MayaNode) -> str:
@@ -968,34 +1319,34 @@ class MayaReader(BaseReader):
         Returns:
             bool: True if object is organizational only
         """
+        if obj._is_org_cached is not None:
+            return obj._is_org_cached
+
         if obj.node_type != 'transform':
-            return False
-
-        # Check if it has any animation
-        has_animation = False
-        for attr in ['tx', 'ty', 'tz', 'rx', 'ry', 'rz', 'sx', 'sy', 'sz',
-                     'translateX', 'translateY', 'translateZ',
-                     'rotateX', 'rotateY', 'rotateZ',
-                     'scaleX', 'scaleY', 'scaleZ']:
-            if self.scene.get_anim_curve_for_attr(obj.name, attr):
-                has_animation = True
-                break
-
-        # If no animation and has children but no direct shapes, it's organizational
-        if not has_animation:
-            has_shape_child = any(
-                child.node_type in ('camera', 'mesh')
-                for child in obj.children
-            )
-            has_children = len(obj.children) > 0
+            result = False
+        # Organizational groups have children but no direct shapes...
+        elif not obj.children or any(child.node_type in ('camera', 'mesh')
+                                     for child in obj.children):
+            result = False
+        # ...and no transform animation
+        else:
+            animated = self.scene._node_animated_attrs.get(obj.name, _EMPTY_SET)
+            result = not (animated & _XFORM_ATTR_SET)
 
-            if has_children and not has_shape_child:
-                return True
+        obj._is_org_cached = result
+        return result
 
-        return False
+    def _get_blend_shapes_by_mesh(self) -> Dict[str, List[MayaBlendShapeData]]:
+        """Map each mesh name to its connected blendShape nodes (cached)"""
+        if self._blend_shapes_by_mesh is None:
+            self._blend_shapes_by_mesh = {}
+            for bs_data in self.scene.blend_shapes.values():
+                if bs_data.connected_mesh is not None:
+                    self._blend_shapes_by_mesh.setdefault(bs_data.connected_mesh, []).append(bs_data)
+        return self._blend_shapes_by_mesh
 
     def get_blend_shape_for_mesh(self, mesh_name: str) -> Optional['BlendShapeDeformer']:
-        """Get blend shape deformer data for a mesh
+        """Get blend shape deformer data for a mesh (cached per mesh)
 
         Args:
             mesh_name: Name of the mesh to find blend shapes for
@@ -1003,77 +1354,87 @@ class MayaReader(BaseReader):
         Returns:
             BlendShapeDeformer if mesh has blend shapes, None otherwise
         """
+        if mesh_name not in self._blend_shape_cache:
+            self._blend_shape_cache[mesh_name] = self._build_blend_shape(mesh_name)
+        return self._blend_shape_cache[mesh_name]
+
+    def _build_blend_shape(self, mesh_name: str) -> Optional['BlendShapeDeformer']:
+        """Build the BlendShapeDeformer for a mesh (see get_blend_shape_for_mesh)"""
         from core.scene_data import (
             BlendShapeDeformer, BlendShapeChannel, BlendShapeTarget, BlendShapeWeightKey
         )
 
-        # Find blend shape connected to this mesh
-        for bs_data in self.scene.blend_shapes.values():
-            if bs_data.connected_mesh == mesh_name:
-                channels = []
-
-                # Process each target group
-                for target_idx, weight_items in bs_data.targets.items():
-                    # Get target name from alias or generate one
-                    target_name = bs_data.weight_aliases.get(target_idx, f"target_{target_idx}")
-
-                    # Usually there's one weight item per target (at index 6000 = weight 1.0)
-                    for weight_idx, data in weight_items.items():
-                        deltas = data.get('deltas', [])
-                        components = data.get('components', [])
-
-                        if not deltas:
-                            continue
-
-                        # If no components specified, assume sequential indices
-                        if not components:
-                            components = list(range(len(deltas)))
-
-                        # Ensure we have matching counts
-                        if len(components) != len(deltas):
-                            # Adjust to minimum of both
-                            min_len = min(len(components), len(deltas))
-                            components = components[:min_len]
-                            deltas = deltas[:min_len]
-
-                        # Calculate full weight from index: weight = (index / 1000) - 5
-                        full_weight = (weight_idx / 1000.0) - 5.0
-                        if full_weight <= 0:
-                            full_weight = 1.0
-
-                        target = BlendShapeTarget(
-                            name=target_name,
-                            vertex_indices=components,
-                            deltas=deltas,
-                            full_weight=full_weight
-                        )
-
-                        # Check for weight animation
-                        weight_animation = None
-                        weight_attr = f"w[{target_idx}]"
-                        # Also check alias name
-                        for attr_name in [weight_attr, target_name]:
-                            curve = self.scene.get_anim_curve_for_attr(bs_data.name, attr_name)
-                            if curve and curve.keyframes:
-                                weight_animation = [
-                                    BlendShapeWeightKey(frame=int(kf[0]), weight=kf[1])
-                                    for kf in curve.keyframes
-                                ]
-                                break
-
-                        channel = BlendShapeChannel(
-                            name=target_name,
-                            targets=[target],
-                            weight_animation=weight_animation,
-                            default_weight=0.0
-                        )
-                        channels.append(channel)
-
-                if channels:
-                    return BlendShapeDeformer(
-                        name=bs_data.name,
-                        channels=channels,
-                        base_mesh_name=mesh_name
+        # Blend shapes connected to this mesh, in file order
+        for bs_data in self._get_blend_shapes_by_mesh().get(mesh_name, ()):
+            channels = []
+
+            # Process each target group
+            for target_idx, weight_items in bs_data.targets.items():
+                # Get target name from alias or generate one
+                target_name = bs_data.weight_aliases.get(target_idx, f"target_{target_idx}")
+
+                # Usually there's one weight item per target (at index 6000 = weight 1.0)
+                for weight_idx, data in weight_items.items():
+                    deltas = data.get('deltas', [])
+                    if isinstance(deltas, _DeferredTriplets):
+                        deltas = data['deltas'] = deltas.parse()
+                    components = data.get('components', [])
+
+                    if not len(deltas):
+                        continue
+
+                    deltas = np.asarray(deltas, dtype=np.float64).reshape(-1, 3)
+
+                    # If no components specified, assume sequential indices
+                    if len(components):
+                        components = np.asarray(components, dtype=np.int32)
+                    else:
+                        components = np.arange(len(deltas), dtype=np.int32)
+
+                    # Ensure we have matching counts (adjust to minimum of both)
+                    min_len = min(len(components), len(deltas))
+                    components = components[:min_len]
+                    deltas = deltas[:min_len]
+
+                    # Calculate full weight from index: weight = (index / 1000) - 5
+                    full_weight = (weight_idx / 1000.0) - 5.0
+                    if full_weight <= 0:
+                        full_weight = 1.0
+
+                    target = BlendShapeTarget(
+                        name=target_name,
+                        vertex_indices=components,
+                        deltas=deltas,
+                        full_weight=full_weight
                     )
 
+                    # Check for weight animation
+                    weight_animation = None
+                    weight_attr = f"w[{target_idx}]"
+                    # Also check alias name
+                    for attr_name in [weight_attr, target_name]:
+                        curve = self.scene.get_anim_curve_for_attr(bs_data.name, attr_name)
+                        if curve and len(curve.frames):
+                            weight_animation = [
+                                BlendShapeWeightKey(frame=int(frame), weight=weight)
+                                for frame, weight in zip(curve.frames.tolist(),
+                                                         curve.values.tolist())
+                            ]
+                            break
+
+                    channel = BlendShapeChannel(
+                        name=target_name,
+                        targets=[target],
+                        weight_animation=weight_animation,
+                        default_weight=0.0
+                    )
+                    channels.append(channel)
+
+            if channels:
+                return BlendShapeDeformer(
+                    name=bs_data.name,
+                    channels=channels,
+                    base_mesh_name=mesh_name
+                )
+
         return None
@@ -4,20 +4,61 @@ USD Reader Module
 Centralized USD reading utilities implementing the BaseReader interface
 """
 
+import math
+import weakref
 import numpy as np
 from pathlib import Path
 from typing import List, Dict, Tuple, Any, Optional
 
 from .base_reader import BaseReader
 
+# USD is optional; this module is only imported for USD input files, so the
+# import happens once here rather than in every scene-graph call
+try:
+    from pxr import Usd, UsdGeom, Gf, Sdf
+    _USD_AVAILABLE = True
+    _USD_IMPORT_ERROR = None
+except ImportError as e:
+    Usd = UsdGeom = Gf = Sdf = None
+    _USD_AVAILABLE = False
+    _USD_IMPORT_ERROR = e
+
+
+def _points_array(points) -> np.ndarray:
+    """Convert a USD point array (Vt.Vec3fArray, buffer protocol) to (N, 3) float32"""
+    if points is None:
+        return np.empty((0, 3), dtype=np.float32)
+    return np.asarray(points, dtype=np.float32).reshape(-1, 3)
+
+
+def _matrix_array(matrix) -> np.ndarray:
+    """View a Gf.Matrix4d as a (4, 4) float64 array
+
+    Gf matrices expose their doubles through the buffer protocol, which
+    avoids a per-element copy; arrays are passed through unchanged.
+    """
+    if isinstance(matrix, np.ndarray):
+        return matrix
+    try:
+        return np.frombuffer(memoryview(matrix), dtype=np.float64).reshape(4, 4)
+    except TypeError:
+        return np.array(matrix, dtype=np.float64)
+
 
 class USDPrimWrapper:
     """Wrapper for USD prims to provide consistent interface with Alembic objects
 
     Provides getName(), getFullName(), getParent()-like interface for compatibility
     with existing code that expects Alembic-style object access.
+
+    Use USDPrimWrapper.get(prim) to obtain wrappers: it returns the same
+    wrapper for the same prim while that wrapper is alive.
     """
 
+    # Prim -> live wrapper (keyed by the prim itself, so prims with the same
+    # path on different stages don't collide)
+    _INTERN: 'weakref.WeakValueDictionary[Any, USDPrimWrapper]' = weakref.WeakValueDictionary()
+
     def __init__(self, prim):
         """Initialize wrapper with USD prim
 
@@ -26,29 +67,42 @@ class USDPrimWrapper:
         """
         self.prim = prim
         self._children = None
-        self._UsdGeom = None
+        self._name = None
+        self._full_name = None
+        self._is_org_cached = None  # set by USDReader._is_organizational_group
+
+    @classmethod
+    def get(cls, prim) -> 'USDPrimWrapper':
+        """Get the shared wrapper for a prim, creating it if needed
 
-    def _get_usd_geom(self):
-        """Lazy import of UsdGeom"""
-        if self._UsdGeom is None:
-            from pxr import UsdGeom
-            self._UsdGeom = UsdGeom
-        return self._UsdGeom
+        Args:
+            prim: USD Prim object
+
+        Returns:
+            USDPrimWrapper
+        """
+        wrapper = cls._INTERN.get(prim)
+        if wrapper is None:
+            wrapper = cls._INTERN[prim] = cls(prim)
+        return wrapper
 
     def getName(self) -> str:
         """Get the prim's name (last component of path)"""
-        return self.prim.GetName()
+        if self._name is None:
+            self._name = self.prim.GetName()
+        return self._name
 
     def getFullName(self) -> str:
         """Get the full prim path"""
-        return str(self.prim.GetPath())
+        if self._full_name is None:
+            self._full_name = str(self.prim.GetPath())
+        return self._full_name
 
     def getParent(self):
         """Get the parent wrapper, or None if at root"""
-        from pxr import Sdf
         parent_prim = self.prim.GetParent()
         if parent_prim and parent_prim.GetPath() != Sdf.Path.absoluteRootPath:
-            return USDPrimWrapper(parent_prim)
+            return USDPrimWrapper.get(parent_prim)
         return None
 
     def getHeader(self):
@@ -59,22 +113,19 @@ class USDPrimWrapper:
     def children(self):
         """Get child prim wrappers"""
         if self._children is None:
-            self._children = [USDPrimWrapper(child) for child in self.prim.GetChildren()]
+            self._children = [USDPrimWrapper.get(child) for child in self.prim.GetChildren()]
         return self._children
 
     def IsCamera(self) -> bool:
         """Check if this prim is a camera"""
-        UsdGeom = self._get_usd_geom()
         return self.prim.IsA(UsdGeom.Camera)
 
     def IsMesh(self) -> bool:
         """Check if this prim is a mesh"""
-        UsdGeom = self._get_usd_geom()
         return self.prim.IsA(UsdGeom.Mesh)
 
     def IsXform(self) -> bool:
         """Check if this prim is a transform (Xform or Xformable but not Camera/Mesh)"""
-        UsdGeom = self._get_usd_geom()
         return self.prim.IsA(UsdGeom.Xformable) and not self.IsCamera() and not self.IsMesh()
 
 
@@ -85,6 +136,10 @@ class USDReader(BaseReader):
     as AlembicReader for seamless integration with existing exporters.
     """
 
+    # Max time codes with a live XformCache; recent frames are revisited
+    # while sampling, older ones are rebuilt on demand
+    XFORM_CACHE_SIZE = 32
+
     def __init__(self, usd_file: str):
         """Open USD stage and initialize
 
@@ -93,17 +148,15 @@ class USDReader(BaseReader):
         """
         super().__init__(usd_file)
 
-        # Import USD libraries
-        try:
-            from pxr import Usd, UsdGeom, Gf
-            self.Usd = Usd
-            self.UsdGeom = UsdGeom
-            self.Gf = Gf
-        except ImportError as e:
+        # USD libraries (imported at module load)
+        if not _USD_AVAILABLE:
             raise ImportError(
-                f"USD Python library (pxr) not found: {e}\n"
+                f"USD Python library (pxr) not found: {_USD_IMPORT_ERROR}\n"
                 "Install with: pip install usd-core"
             )
+        self.Usd = Usd
+        self.UsdGeom = UsdGeom
+        self.Gf = Gf
 
         self.stage = Usd.Stage.Open(str(self.file_path))
         if not self.stage:
@@ -120,6 +173,41 @@ class USDReader(BaseReader):
         if self._end_time is None or self._end_time == float('-inf'):
             self._end_time = 1.0
 
+        self._type_buckets: Optional[Dict[str, List[USDPrimWrapper]]] = None
+
+        # Time code value -> UsdGeom.XformCache, most recently used last
+        # (see _get_xform_cache)
+        self._xform_caches: Dict[float, Any] = {}
+
+    def reset_sampling_cache(self):
+        """Drop cached transform matrices (e.g. between exports)"""
+        self._xform_caches.clear()
+
+    def _get_xform_cache(self, time_code):
+        """Get the transform cache for a time code
+
+        One UsdGeom.XformCache is kept per recent time code, so each
+        ancestor's world matrix is composed once per time and shared by
+        every prim below it, instead of once per prim. Only the
+        XFORM_CACHE_SIZE most recently used time codes are kept, since each
+        cache holds matrices for every prim it has seen.
+
+        Args:
+            time_code: USD TimeCode
+
+        Returns:
+            UsdGeom.XformCache
+        """
+        key = time_code.GetValue()
+        cache = self._xform_caches.pop(key, None)
+        if cache is None:
+            cache = self.UsdGeom.XformCache(time_code)
+            if len(self._xform_caches) >= self.XFORM_CACHE_SIZE:
+                # Dicts keep insertion order, so the first key is the least recent
+                del self._xform_caches[next(iter(self._xform_caches))]
+        self._xform_caches[key] = cache
+        return cache
+
     def get_format_name(self) -> str:
         """Return human-readable format name"""
         return "USD"
@@ -133,20 +221,39 @@ class USDReader(BaseReader):
         if self._objects_cache is None:
             self._objects_cache = []
             for prim in self.stage.Traverse():
-                self._objects_cache.append(USDPrimWrapper(prim))
+                self._objects_cache.append(USDPrimWrapper.get(prim))
         return self._objects_cache
 
+    def _get_type_buckets(self) -> Dict[str, List[USDPrimWrapper]]:
+        """Sort all prims into cameras, meshes and transforms (cached)
+
+        One pass with one IsA check per type, instead of a traversal per
+        getter.
+
+        Returns:
+            dict: 'cameras', 'meshes' and 'transforms' prim wrapper lists
+        """
+        if self._type_buckets is None:
+            UsdGeom = self.UsdGeom
+            cameras, meshes, transforms = [], [], []
+            for obj in self.get_all_objects():
+                prim = obj.prim
+                if prim.IsA(UsdGeom.Camera):
+                    cameras.append(obj)
+                elif prim.IsA(UsdGeom.Mesh):
+                    meshes.append(obj)
+                elif prim.IsA(UsdGeom.Xformable):
+                    transforms.append(obj)
+            self._type_buckets = {'cameras': cameras, 'meshes': meshes, 'transforms': transforms}
+        return self._type_buckets
+
     def get_cameras(self) -> List[USDPrimWrapper]:
         """Get all camera objects in the scene
 
         Returns:
             list: Camera prim wrappers
         """
-        cameras = []
-        for obj in self.get_all_objects():
-            if obj.IsCamera():
-                cameras.append(obj)
-        return cameras
+        return self._get_type_buckets()['cameras']
 
     def get_meshes(self) -> List[USDPrimWrapper]:
         """Get all mesh objects in the scene
@@ -154,11 +261,7 @@ class USDReader(BaseReader):
         Returns:
             list: Mesh prim wrappers
         """
-        meshes = []
-        for obj in self.get_all_objects():
-            if obj.IsMesh():
-                meshes.append(obj)
-        return meshes
+        return self._get_type_buckets()['meshes']
 
     def get_transforms(self) -> List[USDPrimWrapper]:
         """Get all transform objects in the scene
@@ -166,11 +269,7 @@ class USDReader(BaseReader):
         Returns:
             list: Transform prim wrappers
         """
-        transforms = []
-        for obj in self.get_all_objects():
-            if obj.IsXform():
-                transforms.append(obj)
-        return transforms
+        return self._get_type_buckets()['transforms']
 
     def get_parent_map(self) -> Dict[str, USDPrimWrapper]:
         """Build parent-child relationship map (cached)
@@ -233,32 +332,65 @@ class USDReader(BaseReader):
                 - scale: [sx, sy, sz]
         """
         time_code = self._time_seconds_to_time_code(time_seconds)
-
-        xformable = self.UsdGeom.Xformable(obj.prim)
+        xform_cache = self._get_xform_cache(time_code)
 
         # Get local transformation matrix for scale extraction
-        local_matrix = xformable.GetLocalTransformation(time_code)
+        local_matrix, _ = xform_cache.GetLocalTransformation(obj.prim)
         local_scale = self._extract_scale_from_matrix(local_matrix)
 
         # Get world transform for position and rotation
-        world_matrix = xformable.ComputeLocalToWorldTransform(time_code)
+        world_matrix = xform_cache.GetLocalToWorldTransform(obj.prim)
         pos, rot, _ = self._decompose_matrix(world_matrix, maya_compat=maya_compat)
 
         return pos, rot, local_scale
 
+    def get_transforms_over_range(self, obj: USDPrimWrapper, times: List[float]
+                                  ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Get a transform track with both rotation decomposition modes
+
+        Computes the local and world matrices once per time and decomposes
+        the world matrix in both modes, instead of sampling it twice.
+
+        Args:
+            obj: USDPrimWrapper object
+            times: Times in seconds to sample
+
+        Returns:
+            tuple: (translations, rotations_ae, rotations_maya, scales) as
+                   (N, 3) float64 arrays
+        """
+        positions, rotations_ae, rotations_maya, scales = [], [], [], []
+
+        for time_seconds in times:
+            xform_cache = self._get_xform_cache(self._time_seconds_to_time_code(time_seconds))
+            local_matrix, _ = xform_cache.GetLocalTransformation(obj.prim)
+            scales.append(self._extract_scale_from_matrix(local_matrix))
+
+            world_matrix = _matrix_array(xform_cache.GetLocalToWorldTransform(obj.prim))
+            pos, rot_ae, _ = self._decompose_matrix(world_matrix)
+            _, rot_maya, _ = self._decompose_matrix(world_matrix, maya_compat=True)
+            positions.append(pos)
+            rotations_ae.append(rot_ae)
+            rotations_maya.append(rot_maya)
+
+        return tuple(
+            np.array(track, dtype=np.float64).reshape(-1, 3)
+            for track in (positions, rotations_ae, rotations_maya, scales)
+        )
+
     def _extract_scale_from_matrix(self, matrix) -> List[float]:
         """Extract scale from transformation matrix
 
         Args:
-            matrix: USD Gf.Matrix4d
+            matrix: USD Gf.Matrix4d (or its (4, 4) array)
 
         Returns:
             list: [sx, sy, sz] scale values
         """
-        m = np.array(matrix)
-        sx = np.linalg.norm([m[0][0], m[0][1], m[0][2]])
-        sy = np.linalg.norm([m[1][0], m[1][1], m[1][2]])
-        sz = np.linalg.norm([m[2][0], m[2][1], m[2][2]])
+        (m00, m01, m02, _), (m10, m11, m12, _), (m20, m21, m22, _) = _matrix_array(matrix)[:3].tolist()
+        sx = math.sqrt(m00 * m00 + m01 * m01 + m02 * m02)
+        sy = math.sqrt(m10 * m10 + m11 * m11 + m12 * m12)
+        sz = math.sqrt(m20 * m20 + m21 * m21 + m22 * m22)
         return [sx, sy, sz]
 
     def _decompose_matrix(self, matrix, maya_compat: bool = False) -> Tuple[List[float], List[float], List[float]]:
@@ -267,28 +399,23 @@ class USDReader(BaseReader):
         Uses the same decomposition logic as AlembicReader for consistency.
 
         Args:
-            matrix: USD Gf.Matrix4d
+            matrix: USD Gf.Matrix4d (or its (4, 4) array)
             maya_compat: If True, use Maya-compatible rotation decomposition
 
         Returns:
             tuple: (translation, rotation, scale)
         """
-        m = np.array(matrix)
+        m = _matrix_array(matrix)
 
         # Extract translation (row 3 in row-major format)
-        translation = [m[3][0], m[3][1], m[3][2]]
-
-        # Extract scale
-        sx = np.linalg.norm([m[0][0], m[0][1], m[0][2]])
-        sy = np.linalg.norm([m[1][0], m[1][1], m[1][2]])
-        sz = np.linalg.norm([m[2][0], m[2][1], m[2][2]])
-        scale = [sx, sy, sz]
+        translation = m[3, :3].tolist()
 
-        # Build normalized rotation matrix
-        rot = np.zeros((3, 3))
-        rot[0] = [m[0][i] / sx if sx > 0 else m[0][i] for i in range(3)]
-        rot[1] = [m[1][i] / sy if sy > 0 else m[1][i] for i in range(3)]
-        rot[2] = [m[2][i] / sz if sz > 0 else m[2][i] for i in range(3)]
+        # Extract scale (row lengths) and normalize the rows in one go;
+        # zero-length rows are left as they are
+        basis = m[:3, :3]
+        row_lengths = np.sqrt(np.einsum('ij,ij->i', basis, basis))
+        rot = basis / np.where(row_lengths > 0, row_lengths, 1.0)[:, None]
+        scale = row_lengths.tolist()
 
         # Extract XYZ Euler angles
         if maya_compat:
@@ -327,9 +454,9 @@ class USDReader(BaseReader):
 
         Returns:
             dict: Mesh data with keys:
-                - 'positions': Vertex positions as list of [x, y, z]
-                - 'indices': Face vertex indices
-                - 'counts': Face vertex counts
+                - 'positions': (N, 3) float32 vertex positions
+                - 'indices': int32 face vertex indices
+                - 'counts': int32 face vertex counts
         """
         time_code = self._time_seconds_to_time_code(time_seconds)
 
@@ -347,13 +474,47 @@ class USDReader(BaseReader):
         counts_attr = mesh.GetFaceVertexCountsAttr()
         counts = counts_attr.Get(time_code)
 
-        # Convert to lists for consistency with AlembicReader
+        # Arrays straight from the Vt buffers, as AlembicReader returns
         return {
-            'positions': list(points) if points else [],
-            'indices': list(indices) if indices else [],
-            'counts': list(counts) if counts else []
+            'positions': _points_array(points),
+            'indices': np.asarray(indices if indices is not None else (), dtype=np.int32),
+            'counts': np.asarray(counts if counts is not None else (), dtype=np.int32)
         }
 
+    def _iter_vertex_positions(self, mesh_obj: USDPrimWrapper, fps: int, frame_count: int,
+                               start_frame: int = 1):
+        """Read a mesh's vertex positions one frame at a time
+
+        Unlike get_mesh_data_at_time, only the points attribute is resolved
+        per frame (topology comes from the first frame), and points without
+        time samples are read once for the whole range.
+
+        Args:
+            mesh_obj: USDPrimWrapper for mesh
+            fps: Frames per second
+            frame_count: Total number of frames
+            start_frame: First frame to read
+
+        Yields:
+            tuple: (frame, (N, 3) float32 positions)
+        """
+        points_attr = self.UsdGeom.Mesh(mesh_obj.prim).GetPointsAttr()
+        frames, times = self._frame_times(fps, frame_count)
+        frames = frames.tolist()[start_frame - 1:]
+        times = times[start_frame - 1:]
+
+        constant = None
+        if times and points_attr.GetNumTimeSamples() <= 1:
+            constant = _points_array(points_attr.Get(self._time_seconds_to_time_code(times[0])))
+            constant.flags.writeable = False  # Shared by every frame
+
+        for frame, time_seconds in zip(frames, times):
+            if constant is not None:
+                yield frame, constant
+            else:
+                time_code = self._time_seconds_to_time_code(time_seconds)
+                yield frame, _points_array(points_attr.Get(time_code))
+
     def get_camera_properties(self, cam_obj: USDPrimWrapper,
                               time_seconds: Optional[float] = None) -> Dict[str, float]:
         """Get camera properties at a specific time
@@ -425,24 +586,27 @@ class USDReader(BaseReader):
         Returns:
             bool: True if object is organizational only
         """
-        if not obj.IsXform():
-            return False
-
-        name = obj.getName()
+        if obj._is_org_cached is not None:
+            return obj._is_org_cached
 
+        if not obj.IsXform():
+            result = False
         # Root container names should be treated as organizational
         # These are common USD root group names
-        if name in ('World', 'Root', 'Scene', 'root', 'world', 'scene'):
-            return True
-
-        # Check if it has direct shape children
-        has_direct_shape = False
-        has_children = False
-        for child in obj.children:
-            has_children = True
-            if child.IsCamera() or child.IsMesh():
-                has_direct_shape = True
-                break
-
-        # If has children but no direct shapes, it's organizational
-        return has_children and not has_direct_shape
+        elif obj.getName() in ('World', 'Root', 'Scene', 'root', 'world', 'scene'):
+            result = True
+        else:
+            # Check if it has direct shape children
+            has_direct_shape = False
+            has_children = False
+            for child in obj.children:
+                has_children = True
+                if child.IsCamera() or child.IsMesh():
+                    has_direct_shape = True
+                    break
+
+            # If has children but no direct shapes, it's organizational
+            result = has_children and not has_direct_shape
+
+        obj._is_org_cached = result
+        return result